@@ -0,0 +1,507 @@
+"""
+Action space and legal action mask for Brass Birmingham
+
+Every action is a flat index into ACTIONS. Builds pick the player's lowest tier
+tile of the industry, develops the lowest tier tile(s) of the industries. A build
+needs a card for it in hand (BUILD_CARD_KINDS), any card plays the other actions.
+
+legalActions computes the whole mask for one player in a single pass: network
+components and the coal/beer reachable from each are worked out once
+(NetworkResources) and shared by every build and network candidate, sells read
+the beer each town reaches from Board.tradeIndex.
+A masked action is both allowed by the Player.can* checks and guaranteed to
+execute - the resources it needs can actually be taken and paid for.
+"""
+from __future__ import annotations
+
+import itertools
+from enum import Enum
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from classes.buildings.enums import BuildingName, BuildingType
+from classes.enums import Era
+from consts import (BUILDINGS, CANAL_PRICE, ONE_RAILROAD_COAL_PRICE,
+                    ONE_RAILROAD_PRICE, TWO_RAILROAD_BEER_PRICE,
+                    TWO_RAILROAD_COAL_PRICE, TWO_RAILROAD_PRICE)
+from layout import (BUILDING_NAMES, INDUSTRY_CARD_KINDS, NUM_CARD_KINDS,
+                    NUM_ROADS, NUM_SLOTS, SLOT_POSSIBLE_BUILDS, SLOT_TOWN,
+                    TOWN_CARD_KIND, WILD_INDUSTRY_KIND, WILD_KINDS,
+                    WILD_LOCATION_KIND)
+
+if TYPE_CHECKING:
+    from classes.board import Board
+    from classes.buildings.building import Building
+    from classes.hand import Hand
+    from classes.player import Player
+    from classes.road_location import RoadLocation
+
+
+class ActionType(Enum):
+    build = "build"
+    network = "network"
+    twoRailroads = "twoRailroads"
+    develop = "develop"
+    sell = "sell"
+    loan = "loan"
+    scout = "scout"
+    passTurn = "passTurn"
+
+
+MARKET_BUILDING_NAMES = {
+    building.name for building in BUILDINGS if building.type == BuildingType.market
+}
+
+BUILD_ACTIONS: List[Tuple[int, BuildingName]] = [
+    (slot, name) for slot in range(NUM_SLOTS) for name in SLOT_POSSIBLE_BUILDS[slot]
+]
+NETWORK_ACTIONS: List[int] = list(range(NUM_ROADS))
+TWO_RAILROADS_ACTIONS: List[Tuple[int, int]] = list(
+    itertools.combinations(range(NUM_ROADS), 2)
+)
+TWO_RAILROADS_INDEX: Dict[Tuple[int, int], int] = {
+    roads: i for i, roads in enumerate(TWO_RAILROADS_ACTIONS)
+}
+DEVELOP_ACTIONS: List[Tuple[BuildingName, BuildingName]] = list(
+    itertools.combinations_with_replacement(BUILDING_NAMES, 2)
+)
+SELL_ACTIONS: List[int] = [
+    slot
+    for slot in range(NUM_SLOTS)
+    if MARKET_BUILDING_NAMES.intersection(SLOT_POSSIBLE_BUILDS[slot])
+]
+
+BUILD_OFFSET = 0
+NETWORK_OFFSET = BUILD_OFFSET + len(BUILD_ACTIONS)
+TWO_RAILROADS_OFFSET = NETWORK_OFFSET + len(NETWORK_ACTIONS)
+DEVELOP_OFFSET = TWO_RAILROADS_OFFSET + len(TWO_RAILROADS_ACTIONS)
+SELL_OFFSET = DEVELOP_OFFSET + len(DEVELOP_ACTIONS)
+LOAN = SELL_OFFSET + len(SELL_ACTIONS)
+SCOUT = LOAN + 1
+PASS = SCOUT + 1
+NUM_ACTIONS = PASS + 1
+
+ACTIONS: List[Tuple[ActionType, tuple]] = (
+    [(ActionType.build, args) for args in BUILD_ACTIONS]
+    + [(ActionType.network, (road,)) for road in NETWORK_ACTIONS]
+    + [(ActionType.twoRailroads, args) for args in TWO_RAILROADS_ACTIONS]
+    + [(ActionType.develop, args) for args in DEVELOP_ACTIONS]
+    + [(ActionType.sell, (slot,)) for slot in SELL_ACTIONS]
+    + [(ActionType.loan, ()), (ActionType.scout, ()), (ActionType.passTurn, ())]
+)
+assert len(ACTIONS) == NUM_ACTIONS
+
+# card kinds each build can be played with: the town's location card, the industry's
+# cards, then the wild cards. Farm breweries have no location card, only brewery and
+# wild industry cards build there
+BUILD_CARD_KINDS: List[Tuple[int, ...]] = []
+for _slot, _name in BUILD_ACTIONS:
+    _location = TOWN_CARD_KIND[SLOT_TOWN[_slot]]
+    if _location is None:
+        BUILD_CARD_KINDS.append(INDUSTRY_CARD_KINDS[_name] + (WILD_INDUSTRY_KIND,))
+    else:
+        BUILD_CARD_KINDS.append(
+            (_location,) + INDUSTRY_CARD_KINDS[_name] + (WILD_LOCATION_KIND, WILD_INDUSTRY_KIND)
+        )
+# the same as a (build, card kind) matrix, for masking all builds at once
+BUILD_CARDS = np.zeros((len(BUILD_ACTIONS), NUM_CARD_KINDS), dtype=bool)
+for _i, _kinds in enumerate(BUILD_CARD_KINDS):
+    BUILD_CARDS[_i, list(_kinds)] = True
+del _slot, _name, _location, _i, _kinds
+
+
+"""
+availableBuildings
+
+:param player: player
+:return: player's tiles not yet built/developed, per industry in tier order
+"""
+
+
+def availableBuildings(player: Player) -> Dict[BuildingName, List[Building]]:
+    available = {name: [] for name in BUILDING_NAMES}
+    for building in player.buildings:
+        if building.buildLocation is None and not building.isRetired:
+            available[building.name].append(building)
+    return available
+
+
+"""
+actionCard
+card an action is played with: for builds the location card, then the industry card,
+then a wild card (BUILD_CARD_KINDS), for other actions the first card in kind order
+
+:param hand: hand of the player taking the action
+:param action: index into ACTIONS, legal for the player
+:return: card kind to spend
+"""
+
+
+def actionCard(hand: Hand, action: int) -> int:
+    if BUILD_OFFSET <= action < NETWORK_OFFSET:
+        counts = hand.counts
+        for kind in BUILD_CARD_KINDS[action - BUILD_OFFSET]:
+            if counts[kind]:
+                return kind
+    return hand.card(0)
+
+
+"""
+developBuildings
+
+:param available: result of availableBuildings
+:param name1: industry of first tile
+:param name2: industry of second tile
+:return: the two lowest tier tiles to develop, None if there are not enough
+"""
+
+
+def developBuildings(
+    available: Dict[BuildingName, List[Building]],
+    name1: BuildingName,
+    name2: BuildingName,
+) -> Optional[Tuple[Building, Building]]:
+    if name1 == name2:
+        if len(available[name1]) < 2:
+            return None
+        return available[name1][0], available[name1][1]
+    if not available[name1] or not available[name2]:
+        return None
+    return available[name1][0], available[name2][0]
+
+
+class NetworkResources:
+    """
+    NetworkResources - coal, beer and market access of every built network, as seen by one player
+
+    Mirrors Board.getAvailableCoalAmount/getAvailableBeerAmount but per network component,
+    so all candidates of one mask share a single scan of the board
+
+    :param board: board
+    :param player: player inquiring (own breweries count from anywhere)
+    """
+
+    def __init__(self, board: Board, player: Player):
+        self.board = board
+        index = board.networkIndex
+        if index.isStale:
+            index.rebuild()
+        self.components = [index.find(node) for node in range(len(index.nodes))]
+        self.nodes = index.nodes
+
+        self.coal: Dict[int, int] = {}
+        for building in board.getCoalBuildings():
+            component = self.component(building.town)
+            self.coal[component] = self.coal.get(component, 0) + building.resourceAmount
+
+        self.ownBeer = 0
+        self.beer: Dict[int, int] = {}
+        for building in board.getBeerBuildings():
+            if building.owner == player:
+                self.ownBeer += building.resourceAmount
+            else:
+                component = self.component(building.town)
+                self.beer[component] = self.beer.get(component, 0) + building.resourceAmount
+
+        # first connected trade post (board order) is the one whose beer counts
+        self.tradePostOrder: Dict[int, int] = {}
+        self.tradePostBeer: Dict[int, int] = {}
+        self.tradePostHasBeer = set()
+        for i, tradePost in enumerate(board.tradePosts):
+            component = self.component(tradePost)
+            if component not in self.tradePostOrder:
+                self.tradePostOrder[component] = i
+                self.tradePostBeer[component] = tradePost.beerAmount
+            if tradePost.beerAmount > 0:
+                self.tradePostHasBeer.add(component)
+
+        self.ironOnBoard = sum(
+            building.resourceAmount for building in board.getIronBuildings()
+        )
+
+    def component(self, location) -> int:
+        return self.components[self.nodes[location.name]]
+
+    def hasMarket(self, components) -> bool:
+        return any(component in self.tradePostOrder for component in components)
+
+    def coalAmount(self, *components: int) -> int:
+        amount = sum(self.coal.get(component, 0) for component in components)
+        if self.hasMarket(components):
+            amount += self.board.coalMarketRemaining
+        return amount
+
+    def beerAmount(self, *components: int) -> int:
+        amount = self.ownBeer + sum(self.beer.get(component, 0) for component in components)
+        tradePosts = [c for c in components if c in self.tradePostOrder]
+        if tradePosts:
+            first = min(tradePosts, key=lambda component: self.tradePostOrder[component])
+            amount += self.tradePostBeer[first]
+        return amount
+
+    def hasBeerSource(self, component: int) -> bool:
+        return (
+            self.ownBeer > 0
+            or self.beer.get(component, 0) > 0
+            or component in self.tradePostHasBeer
+        )
+
+    """
+    coalSource
+    Board.removeXCoal takes coal from the first of towns with any source
+
+    :param towns: towns the coal is taken from, in order
+    :return: component coal is taken from, None if no town has a source
+    """
+
+    def coalSource(self, towns) -> Optional[int]:
+        for town in towns:
+            component = self.component(town)
+            if self.coal.get(component, 0) > 0 or component in self.tradePostOrder:
+                return component
+        return None
+
+    """
+    coalCost
+
+    :param coalNeeded: amount of coal
+    :param component: component coal is taken from, see coalSource
+    :return: market cost Board.removeXCoal will charge, None if the coal cannot be taken
+    """
+
+    def coalCost(self, coalNeeded: int, component: Optional[int]) -> Optional[int]:
+        if component is None:
+            return 0
+        coal = self.coal.get(component, 0)
+        if coal >= coalNeeded:
+            return 0
+        if component not in self.tradePostOrder:
+            return None
+        return self.board.priceForCoal(coalNeeded - coal)
+
+    def ironCost(self, ironNeeded: int) -> int:
+        if self.ironOnBoard >= ironNeeded:
+            return 0
+        return self.board.priceForIron(ironNeeded - self.ironOnBoard)
+
+
+"""
+legalActions
+
+:param board: board
+:param player: player to move
+:return: mask of size NUM_ACTIONS, 1 for every legal action
+"""
+
+
+def legalActions(board: Board, player: Player) -> np.ndarray:
+    mask = np.zeros(NUM_ACTIONS, dtype=np.float32)
+    hand = player.hand
+    if not hand.size:
+        return mask
+    mask[PASS] = 1
+
+    resources = NetworkResources(board, player)
+    available = availableBuildings(player)
+    isCanal = board.era == Era.canal
+
+    # 1 BUILD
+    ownTowns: Dict[str, List[int]] = {}
+    for buildLocation in board.buildLocations:
+        if buildLocation.building and buildLocation.building.owner == player:
+            ownTowns.setdefault(buildLocation.town.name, []).append(buildLocation.index)
+
+    playable = (BUILD_CARDS & (hand.countsView > 0)).any(axis=1)  # builds the hand has a card for
+    for i, (slot, name) in enumerate(BUILD_ACTIONS):
+        if not playable[i] or not available[name]:
+            continue
+        building = available[name][0]
+        if building.cost > player.money:
+            continue
+        if (building.onlyPhaseOne and not isCanal) or (building.onlyPhaseTwo and isCanal):
+            continue
+        buildLocation = board.buildLocations[slot]
+        if buildLocation.building and buildLocation.building.tier >= building.tier:
+            continue
+        town = buildLocation.town
+        if isCanal and any(s != slot for s in ownTowns.get(town.name, ())):
+            continue  # max 1 industry tile per location in canal era
+        coalCost = 0
+        if building.coalCost > 0:
+            coalCost = resources.coalCost(building.coalCost, resources.coalSource([town]))
+            if coalCost is None or not resources.coalAmount(resources.component(town)):
+                continue
+        if building.cost + coalCost + resources.ironCost(building.ironCost) <= player.money:
+            mask[BUILD_OFFSET + i] = 1
+
+    # 2 NETWORK
+    roadLocations = board.roadLocations
+    if player.roadCount > 0:
+        for road in NETWORK_ACTIONS:
+            roadLocation = roadLocations[road]
+            if roadLocation.isBuilt:
+                continue
+            if isCanal:
+                if roadLocation.canBuildCanal and player.money >= CANAL_PRICE:
+                    mask[NETWORK_OFFSET + road] = 1
+            elif roadLocation.canBuildRailroad and canAffordOneRailroad(
+                resources, roadLocation, player
+            ):
+                mask[NETWORK_OFFSET + road] = 1
+
+    if not isCanal and player.roadCount > 1 and player.money >= TWO_RAILROAD_PRICE:
+        twoRailroads(resources, board, player, mask)
+
+    # 3 DEVELOP
+    for i, (name1, name2) in enumerate(DEVELOP_ACTIONS):
+        buildings = developBuildings(available, name1, name2)
+        if buildings and buildings[0].canBeDeveloped and buildings[1].canBeDeveloped:
+            mask[DEVELOP_OFFSET + i] = 1
+
+    # 4 SELL - beer reach of the towns is kept by Board.tradeIndex between masks
+    tradeIndex = board.tradeIndex
+    for i, slot in enumerate(SELL_ACTIONS):
+        building = board.buildLocations[slot].building
+        if (
+            building
+            and building.type == BuildingType.market
+            and building.isActive
+            and building.owner == player
+            and building.beerCost <= tradeIndex.beerAmount(player, building.town)
+        ):
+            mask[SELL_OFFSET + i] = 1
+
+    # 5 LOAN
+    if player.canLoan():
+        mask[LOAN] = 1
+
+    # 6 SCOUT - needs a card to discard besides the action card
+    if hand.size > 1 and not any(hand.counts[kind] for kind in WILD_KINDS):
+        mask[SCOUT] = 1
+
+    return mask
+
+
+def canAffordOneRailroad(
+    resources: NetworkResources, roadLocation: RoadLocation, player: Player
+) -> bool:
+    if not any(
+        resources.coalAmount(resources.component(town)) >= ONE_RAILROAD_COAL_PRICE
+        for town in roadLocation.towns
+    ):
+        return False
+    coalCost = resources.coalCost(
+        ONE_RAILROAD_COAL_PRICE, resources.coalSource(roadLocation.towns)
+    )
+    return coalCost is not None and ONE_RAILROAD_PRICE + coalCost <= player.money
+
+
+"""
+twoRailroads
+
+:param resources: NetworkResources of the current network
+:param mask: mask to fill in
+"""
+
+
+def twoRailroads(
+    resources: NetworkResources, board: Board, player: Player, mask: np.ndarray
+):
+    for road1, road2 in twoRailroadPairs(resources, board, player):
+        mask[TWO_RAILROADS_OFFSET + TWO_RAILROADS_INDEX[road1, road2]] = 1
+
+
+"""
+twoRailroadPairs
+same rule as Player.canAffordTwoRailroadIndustryResources: one road must have coal and beer
+on its own, the other once the first is built. So only roads with resources of their own can
+come first, and the second has resources of its own too or touches the network the first
+joins - pairs are drawn from those instead of all O(roads^2) of them. Everything about a
+single road is worked out once, the pairs only combine it
+
+:param resources: NetworkResources of the current network
+:return: (road1, road2) of every legal pair once, road1 < road2 as in TWO_RAILROADS_ACTIONS
+"""
+
+
+def twoRailroadPairs(
+    resources: NetworkResources, board: Board, player: Player
+) -> Iterator[Tuple[int, int]]:
+    hasResources: Dict[int, bool] = {}
+
+    def componentHasResources(component: int) -> bool:
+        if component not in hasResources:
+            hasResources[component] = hasRailroadResources(resources, component)
+        return hasResources[component]
+
+    components: Dict[int, List[int]] = {}
+    firsts: List[int] = []  # roads with coal and beer on their own
+    componentRoads: Dict[int, List[int]] = {}
+    # Board.buildTwoRailroads takes coal and beer before either road exists, coal from the
+    # towns of the lower road first
+    coalSources, affordable, beerSources = {}, {}, {}
+    for road in NETWORK_ACTIONS:
+        roadLocation = board.roadLocations[road]
+        if roadLocation.isBuilt or not roadLocation.canBuildRailroad:
+            continue
+        components[road] = [resources.component(town) for town in roadLocation.towns]
+        for component in set(components[road]):
+            componentRoads.setdefault(component, []).append(road)
+        if any(componentHasResources(c) for c in components[road]):
+            firsts.append(road)
+        coalSources[road] = resources.coalSource(roadLocation.towns)
+        coalCost = resources.coalCost(TWO_RAILROAD_COAL_PRICE, coalSources[road])
+        affordable[road] = (
+            coalCost is not None and TWO_RAILROAD_PRICE + coalCost <= player.money
+        )
+        beerSources[road] = any(resources.hasBeerSource(c) for c in components[road])
+
+    def canPay(road1: int, road2: int) -> bool:
+        coalRoad = road1 if coalSources[road1] is not None else road2
+        return affordable[coalRoad] and (beerSources[road1] or beerSources[road2])
+
+    # with the first road built its towns form one network
+    merged = {road: set(components[road]) for road in firsts}
+    mergedHasResources = {
+        road: hasRailroadResources(resources, *merged[road]) for road in firsts
+    }
+
+    def canBuildSecond(first: int, second: int) -> bool:
+        return any(
+            mergedHasResources[first] if c in merged[first] else componentHasResources(c)
+            for c in components[second]
+        )
+
+    # both roads have resources of their own, so both have a coal source and the lower
+    # one's is used
+    for i, road1 in enumerate(firsts):
+        if not affordable[road1]:
+            continue
+        for road2 in firsts[i + 1 :]:
+            if (canBuildSecond(road1, road2) or canBuildSecond(road2, road1)) and canPay(
+                road1, road2
+            ):
+                yield road1, road2
+
+    # the second road only gets resources from the network the first one joins
+    for first in firsts:
+        if not mergedHasResources[first]:
+            continue
+        seconds = {
+            road
+            for component in merged[first]
+            for road in componentRoads[component]
+            if road not in merged
+        }
+        for second in sorted(seconds):
+            road1, road2 = min(first, second), max(first, second)
+            if canPay(road1, road2):
+                yield road1, road2
+
+
+def hasRailroadResources(resources: NetworkResources, *components: int) -> bool:
+    return (
+        resources.coalAmount(*components) >= TWO_RAILROAD_COAL_PRICE
+        and resources.beerAmount(*components) >= TWO_RAILROAD_BEER_PRICE
+    )
@@ -0,0 +1,409 @@
+"""
+Benchmarks for the Brass Birmingham engine
+
+    python benchmark.py masks --games 5 --players 2
+    python benchmark.py playouts --games 20 --json after.json --baseline before.json
+
+masks - legal action masks per second over positions of random playouts, against
+        asking Player.can* for every candidate one by one
+reset - new games per second, against deep-copying the starting pieces
+vec   - game steps per second of BrassBirminghamVecEnv with --games games in lockstep
+playouts - complete random games with 2, 3 and 4 players: games/s, actions/s and the
+        time spent in the hot Board methods (PROFILED_METHODS), optionally saved as
+        JSON and compared against an earlier run
+memory - bytes held by a new game and by each kind of starting piece, and the time to
+        clone them, with 2, 3 and 4 players; saved and compared like playouts
+startup - import time of the engine modules and of the first game, each run in a fresh
+        interpreter (--games runs, median), saved and compared like playouts
+
+BRASS_PROFILE=1 adds a profile of every engine method over the whole run on stderr.
+"""
+import argparse
+import ast
+import copy
+import gc
+import json
+import platform
+import os
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from actions import (BUILD_ACTIONS, DEVELOP_ACTIONS, NETWORK_ACTIONS, PASS,
+                     SELL_ACTIONS, availableBuildings, developBuildings,
+                     legalActions)
+from classes.board import Board
+from classes.board_template import (buildingPrototypes, cardPrototypes,
+                                    createBuildings, createRoadLocations,
+                                    createTowns, createTradePosts,
+                                    roadLocationPrototypes, startingDeck,
+                                    townPrototypes, tradePostPrototypes)
+from classes.buildings.enums import BuildingType
+from classes.deck import Deck
+from classes.enums import Era
+from classes.player import Player
+from game import Game
+from profiling import Profiler, profileFromEnvironment
+from vec_env import BrassBirminghamVecEnv
+
+
+"""
+playRandomGame
+
+:param numPlayers: amount of players
+:param onPosition: called with the game before every action
+:return: finished game
+"""
+
+
+def playRandomGame(numPlayers: int, onPosition=None) -> Game:
+    game = Game(numPlayers)
+    while not game.isOver:
+        if onPosition:
+            onPosition(game)
+        legal = np.flatnonzero(game.legalActions())
+        game.step(int(random.choice(legal)) if len(legal) > 1 else PASS)
+    return game
+
+
+"""
+naiveLegalCount
+one Player.can* call per candidate (no two railroad pairs), the baseline legalActions replaces
+
+:param board: board
+:param player: player to move
+:return: amount of legal candidates
+"""
+
+
+def naiveLegalCount(board: Board, player: Player) -> int:
+    available = availableBuildings(player)
+    count = 0
+    for slot, name in BUILD_ACTIONS:
+        if available[name]:
+            count += player.canBuildBuilding(available[name][0], board.buildLocations[slot])
+    for road in NETWORK_ACTIONS:
+        roadLocation = board.roadLocations[road]
+        if board.era == Era.canal:
+            count += player.canBuildCanal(roadLocation)
+        else:
+            count += player.canBuildOneRailroad(roadLocation)
+    for name1, name2 in DEVELOP_ACTIONS:
+        buildings = developBuildings(available, name1, name2)
+        count += bool(buildings) and player.canDevelop(*buildings)
+    for slot in SELL_ACTIONS:
+        building = board.buildLocations[slot].building
+        if building and building.type == BuildingType.market:
+            count += player.canSell(building)
+    return count
+
+
+def collectPositions(games: int, numPlayers: int) -> List:
+    positions = []
+
+    def onPosition(game: Game):
+        positions.append((game.board.getState(), game.currentPlayerNum))
+
+    for _ in range(games):
+        playRandomGame(numPlayers, onPosition)
+    return positions
+
+
+"""
+timeMasks
+positions are loaded with Board.setState, only the mask calls are timed
+
+:return: masks per second
+"""
+
+
+def timeMasks(game: Game, positions, maskFn) -> float:
+    maskTime = 0.0
+    for state, playerNum in positions:
+        game.board.setState(state)
+        player = game.players[playerNum]
+        start = time.perf_counter()
+        maskFn(game.board, player)
+        maskTime += time.perf_counter() - start
+    return len(positions) / maskTime
+
+
+def benchmarkMasks(games: int, numPlayers: int):
+    positions = collectPositions(games, numPlayers)
+    game = Game(numPlayers)
+    fast = timeMasks(game, positions, legalActions)
+    naive = timeMasks(game, positions, naiveLegalCount)
+    print(f"positions:        {len(positions)}")
+    print(f"legalActions:     {fast:10.1f} masks/s")
+    print(f"Player.can* scan: {naive:10.1f} masks/s (without two railroad pairs)")
+    print(f"speedup:          {fast / naive:10.1f}x")
+
+
+def deepcopyStartingPieces(numPlayers: int):
+    copy.deepcopy(cardPrototypes(numPlayers))
+    copy.deepcopy(townPrototypes())
+    copy.deepcopy(tradePostPrototypes(numPlayers))
+    copy.deepcopy(roadLocationPrototypes())
+    for _ in range(numPlayers):
+        copy.deepcopy(buildingPrototypes())
+
+
+def benchmarkReset(games: int, numPlayers: int):
+    games *= 100
+    start = time.perf_counter()
+    for _ in range(games):
+        Game(numPlayers)
+    resets = games / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(games):
+        deepcopyStartingPieces(numPlayers)
+    deepcopies = games / (time.perf_counter() - start)
+    print(f"Game():                 {resets:10.1f} resets/s")
+    print(f"deepcopy of pieces only: {deepcopies:9.1f} /s")
+
+
+def benchmarkVec(games: int, numPlayers: int, steps: int = 2000):
+    vec = BrassBirminghamVecEnv(games, numPlayers)
+    vec.reset()
+    masks = vec.masks
+    finished = 0
+    start = time.perf_counter()
+    for _ in range(steps):
+        actions = [random.choice(np.flatnonzero(mask)) for mask in masks]
+        _, _, dones, masks, _ = vec.step(actions)
+        finished += int(dones.sum())
+    elapsed = time.perf_counter() - start
+    print(f"games in lockstep: {games}")
+    print(f"steps:            {steps * games / elapsed:10.1f} game steps/s")
+    print(f"finished games:   {finished:10d}")
+
+
+PROFILED_METHODS = [
+    "areNetworked",
+    "getAvailableCoalAmount",
+    "priceForCoal",
+    "removeXBeer",
+    "getVictoryPoints",
+]
+
+
+def benchmarkPlayouts(games: int, numPlayers: int) -> Dict:
+    actions = 0
+
+    def onPosition(game: Game):
+        nonlocal actions
+        actions += 1
+
+    # plain run for throughput, profiled run for the method breakdown
+    start = time.perf_counter()
+    for _ in range(games):
+        playRandomGame(numPlayers, onPosition).scores()
+    elapsed = time.perf_counter() - start
+
+    with Profiler({Board: PROFILED_METHODS}) as profiler:
+        for _ in range(games):
+            playRandomGame(numPlayers).scores()
+    stats = {name.split(".")[1]: stat for name, stat in profiler.stats().items()}
+
+    return {
+        "games": games,
+        "actions": actions,
+        "gamesPerSecond": games / elapsed,
+        "actionsPerSecond": actions / elapsed,
+        "methods": stats,
+    }
+
+
+# factories of the starting pieces of a board, see classes.board_template
+PIECE_FACTORIES = {
+    "towns": lambda numPlayers: createTowns(),  # with their build locations
+    "tradePosts": createTradePosts,
+    "roadLocations": lambda numPlayers: createRoadLocations(),
+    "cards": lambda numPlayers: Deck(startingDeck(numPlayers)),  # card kind counts
+    "buildings": lambda numPlayers: createBuildings(),  # one player's tiles
+}
+
+
+"""
+allocatedBytes
+
+:param create: called once, what it returns is kept alive until measured
+:return: bytes allocated by the call and still held
+"""
+
+
+def allocatedBytes(create) -> int:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    created = create()
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del created
+    return allocated
+
+
+def benchmarkMemory(games: int, numPlayers: int) -> Dict:
+    repeats = games * 100
+    pieces = {}
+    for name, factory in PIECE_FACTORIES.items():
+        start = time.perf_counter()
+        for _ in range(repeats):
+            factory(numPlayers)
+        pieces[name] = {
+            "bytes": allocatedBytes(lambda: factory(numPlayers)),
+            "cloneMicroseconds": (time.perf_counter() - start) / repeats * 1e6,
+        }
+
+    return {
+        "gameBytes": allocatedBytes(lambda: Game(numPlayers)),
+        "cloneMicroseconds": sum(
+            piece["cloneMicroseconds"] * (numPlayers if name == "buildings" else 1)
+            for name, piece in pieces.items()
+        ),
+        "pieces": pieces,
+    }
+
+
+def printMemory(results: Dict, baseline: Optional[Dict]):
+    for numPlayers, result in results["players"].items():
+        before = baseline["players"].get(numPlayers) if baseline else None
+
+        def compare(new: float, old: Optional[float]) -> str:
+            return f" ({new / old:.2f}x)" if old else ""
+
+        print(f"{numPlayers} players")
+        print(
+            f"  new game:           {result['gameBytes']:10d} bytes"
+            + compare(result["gameBytes"], before and before["gameBytes"])
+        )
+        print(
+            f"  clone pieces:       {result['cloneMicroseconds']:10.1f} us"
+            + compare(result["cloneMicroseconds"], before and before["cloneMicroseconds"])
+        )
+        for name, piece in result["pieces"].items():
+            old = before["pieces"].get(name) if before else None
+            print(
+                f"  {name:16} {piece['bytes']:8d} bytes"
+                + compare(piece["bytes"], old and old["bytes"])
+                + f" {piece['cloneMicroseconds']:8.1f} us"
+                + compare(piece["cloneMicroseconds"], old and old["cloneMicroseconds"])
+            )
+
+
+# modules imported in this order by the startup benchmark, each timed on its own
+STARTUP_MODULES = ["consts", "layout", "actions", "game"]
+STARTUP_SCRIPT = """
+import sys, time
+times = {}
+for module in sys.argv[2:]:
+    start = time.perf_counter()
+    __import__(module)
+    times[module] = time.perf_counter() - start
+Game = sys.modules["game"].Game
+for key in ["firstGame", "secondGame"]:
+    start = time.perf_counter()
+    Game(int(sys.argv[1]))
+    times[key] = time.perf_counter() - start
+print(repr(times))
+"""
+
+
+def benchmarkStartup(games: int, numPlayers: int) -> Dict:
+    runs = []
+    for _ in range(games):
+        output = subprocess.run(
+            [sys.executable, "-c", STARTUP_SCRIPT, str(numPlayers), *STARTUP_MODULES],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        runs.append(ast.literal_eval(output.strip().splitlines()[-1]))
+    return {key: float(np.median([run[key] for run in runs])) for key in runs[0]}
+
+
+def printStartup(results: Dict, baseline: Optional[Dict]):
+    for numPlayers, result in results["players"].items():
+        before = baseline["players"].get(numPlayers) if baseline else None
+        print(f"{numPlayers} players")
+        for key, seconds in result.items():
+            line = f"  {'import ' + key if key in STARTUP_MODULES else key:16} {seconds * 1e3:8.2f} ms"
+            if before and before.get(key):
+                line += f" ({seconds / before[key]:.2f}x)"
+            print(line)
+
+
+def printPlayouts(results: Dict, baseline: Optional[Dict]):
+    for numPlayers, result in results["players"].items():
+        before = baseline["players"].get(numPlayers) if baseline else None
+
+        def compare(key: str) -> str:
+            if not before:
+                return ""
+            return f" ({result[key] / before[key]:.2f}x)"
+
+        print(f"{numPlayers} players, {result['games']} games, {result['actions']} actions")
+        print(f"  games/s:   {result['gamesPerSecond']:10.1f}{compare('gamesPerSecond')}")
+        print(f"  actions/s: {result['actionsPerSecond']:10.1f}{compare('actionsPerSecond')}")
+        for name, stat in result["methods"].items():
+            perCall = stat["seconds"] / stat["calls"] * 1e6 if stat["calls"] else 0.0
+            line = f"  {name:24} {stat['calls']:8d} calls {perCall:8.2f} us/call"
+            if before and before["methods"].get(name, {}).get("calls"):
+                old = before["methods"][name]
+                line += f" ({old['seconds'] / old['calls'] * 1e6 / perCall:.2f}x)" if perCall else ""
+            print(line)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "benchmark", choices=["masks", "reset", "vec", "playouts", "memory", "startup"]
+    )
+    parser.add_argument("--games", type=int, default=5)
+    parser.add_argument("--players", type=int, default=2, choices=[2, 3, 4])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="playouts, memory, startup: write the results to this file")
+    parser.add_argument(
+        "--baseline",
+        help="playouts, memory, startup: results file of an earlier run to compare with",
+    )
+    args = parser.parse_args()
+
+    profileFromEnvironment()
+    random.seed(args.seed)
+    if args.benchmark == "masks":
+        benchmarkMasks(args.games, args.players)
+    elif args.benchmark == "reset":
+        benchmarkReset(args.games, args.players)
+    elif args.benchmark == "vec":
+        benchmarkVec(args.games, args.players)
+    else:
+        benchmark, printResults = {
+            "playouts": (benchmarkPlayouts, printPlayouts),
+            "memory": (benchmarkMemory, printMemory),
+            "startup": (benchmarkStartup, printStartup),
+        }[args.benchmark]
+        results = {
+            "benchmark": args.benchmark,
+            "python": platform.python_version(),
+            "seed": args.seed,
+            "players": {},
+        }
+        for numPlayers in [2, 3, 4]:
+            random.seed(args.seed)
+            results["players"][str(numPlayers)] = benchmark(args.games, numPlayers)
+        baseline = None
+        if args.baseline:
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        printResults(results, baseline)
+        if args.json:
+            with open(args.json, "w") as f:
+                json.dump(results, f, indent=2)
@@ -5,7 +5,13 @@ import gym
 import numpy as np
 from stable_baselines import logger
 
-from .classes.board import Board
+from actions import ACTIONS, NUM_ACTIONS
+from game import Game
+from mcts import MCTS
+from observation import OBSERVATION_SIZE, ObservationEncoder
+from profiling import profileFromEnvironment
+from rules import rulesPolicy
+from seeding import SeedStream
 
 
 # TODO delete stuff and make stuff :)
@@ -14,47 +20,92 @@ class BrassBirminghamEnv(gym.Env):
 
     def __init__(self, verbose=False):
         super(BrassBirminghamEnv, self).__init__()
+        profileFromEnvironment()  # BRASS_PROFILE=1 profiles the run
         self.name = "brassbirmingham"
 
         self.numPlayers = 2
-        self.board = Board(self.numPlayers)
-        self.action_space = gym.spaces.Discrete()
-        self.observation_space = gym.spaces.Box()
+        self.seeds = SeedStream()
+        self.game = Game(self.numPlayers, self.seeds.next(), record=True)
+        self.mcts = MCTS(iterations=200)  # search behind mcts_move, set budgets here
+        self.action_space = gym.spaces.Discrete(NUM_ACTIONS)
+        self.observation_space = gym.spaces.Box(0, 1, (OBSERVATION_SIZE + NUM_ACTIONS,))
+        self.encoder = ObservationEncoder()
         self.verbose = verbose
+        self.clearCache()
 
     @property
-    def observation(self):
-        raise Exception("observation is not yet implemented for BrassBirmingham!")
+    def board(self):
+        return self.game.board
 
     @property
-    def legal_actions(self):
-        raise Exception("legal_actions is not yet implemented for BrassBirmingham!")
+    def players(self):
+        return self.game.players
 
-    def score_game(self):
-        reward = [0.0] * self.numPlayers
+    @property
+    def current_player_num(self):
+        return self.game.currentPlayerNum
 
-        scores = [p.position.score for p in self.players]
-        best_score = max(scores)
-        worst_score = min(scores)
-        winners = []
-        losers = []
-        for i, s in enumerate(scores):
-            if s == best_score:
-                winners.append(i)
-            if s == worst_score:
-                losers.append(i)
+    # mask and observation of the current position, computed once and kept until the next
+    # step or reset - agents and the self-play wrapper read both several times per move
+    def clearCache(self):
+        self.legalActionsCache = None
+        self.observationCache = None
 
-        for w in winners:
-            reward[w] += 1.0 / len(winners)
+    @property
+    def observation(self):
+        if self.observationCache is None:
+            features = self.encoder.encode(self.board, self.current_player_num)
+            self.observationCache = np.concatenate([features, self.legal_actions])
+        return self.observationCache
 
-        for l in losers:
-            reward[l] -= 1.0 / len(losers)
+    @property
+    def legal_actions(self):
+        if self.legalActionsCache is None:
+            self.legalActionsCache = self.game.legalActions()
+        return self.legalActionsCache
 
-        return reward
+    def score_game(self):
+        return self.game.rewards()
 
     @property
     def current_player(self):
         return self.players[self.current_player_num]
 
+    def step(self, action):
+        reward = [0] * self.numPlayers
+        done = False
+
+        # check move legality
+        if self.legal_actions[action] == 0:
+            reward = [1.0 / (self.numPlayers - 1)] * self.numPlayers
+            reward[self.current_player_num] = -1
+            done = True
+        else:
+            actionType, args = ACTIONS[action]
+            logger.debug(f"\nPlayer {self.current_player.name}: {actionType.value} {args}")
+            self.game.step(action)
+            self.clearCache()
+            if self.game.isOver:
+                reward = self.score_game()
+                done = True
+
+        self.done = done
+        return self.observation, reward, done, {}
+
+    def seed(self, seed=None):
+        self.seeds = SeedStream(seed)
+        return [seed]
+
+    def reset(self):
+        self.game = Game(self.numPlayers, self.seeds.next(), record=True)
+        self.clearCache()
+        self.done = False
+        logger.debug(f"\n\n---- NEW GAME ----")
+
+        return self.observation
+
+    def mcts_move(self):
+        return self.mcts.search(self.game)
+
     def rules_move(self):
-        raise Exception("Rules based agent is not yet implemented for BrassBirmingham!")
+        return rulesPolicy(self.game)
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
-import copy
-from typing import TYPE_CHECKING, Dict, List
+import random
+from typing import TYPE_CHECKING, Dict, List, Optional
 
+import numpy as np
 from consts import (CANAL_PRICE, MAX_MARKET_COAL, MAX_MARKET_IRON,
                     ONE_RAILROAD_COAL_PRICE, ONE_RAILROAD_PRICE,
-                    ROAD_LOCATIONS, STARTING_CARDS, STARTING_HAND_SIZE,
-                    STARTING_ROADS, TOWNS, TRADEPOSTS, TWO_RAILROAD_COAL_PRICE, TWO_RAILROAD_BEER_PRICE,
+                    STARTING_HAND_SIZE, STARTING_ROADS, TWO_RAILROAD_COAL_PRICE, TWO_RAILROAD_BEER_PRICE,
                     TWO_RAILROAD_PRICE, MERCHANT_TILES)
+from layout import NODE_INDEX, NODE_ROADS, NUM_NODES, NUM_ROADS, NUM_SLOTS
 from python.id import id
 from python.print_colors import *
 
+from .board_snapshot import BoardSnapshot
+from .board_template import (createRoadLocations, createTowns, createTradePosts,
+                             linkRoadLocations, startingDeck)
 from .build_location import BuildLocation
 from .buildings.building import Building
 from .buildings.enums import BuildingName, BuildingType
@@ -19,30 +23,37 @@ from .buildings.market_building import MarketBuilding
 from .deck import Deck
 from .enums import Era
 from .hand import Hand
+from .journal import Journal
+from .market import COAL_MARKET, IRON_MARKET
+from .network_index import NetworkIndex
 from .road_location import RoadLocation
 from .roads.canal import Canal
 from .roads.railroad import Railroad
+from .score_index import ScoreIndex
 from .town import Town
+from .trade_index import TradeIndex
 from .trade_post import TradePost
+from .zobrist import ZobristHash
 
 if TYPE_CHECKING:
     from .player import Player
 
 
 class Board:
-    def __init__(self, numPlayers: int):
+    def __init__(self, numPlayers: int, rng: random.Random = random):
         self.id = id()
         self.numPlayers = numPlayers
+        self.random = rng  # shuffles deck and merchant tiles, see Game for seeded games
         self.era = Era.canal
-        self.deck = Deck(copy.deepcopy(STARTING_CARDS[str(numPlayers)]))
-        self.towns = copy.deepcopy(TOWNS)  # array of Town objects
+        self.deck = Deck(startingDeck(numPlayers), self.random)
+        self.towns = createTowns()  # array of Town objects
         self.townDict = {}
-        self.tradePosts = copy.deepcopy(TRADEPOSTS[str(numPlayers)])
+        self.tradePosts = createTradePosts(numPlayers)
         self.tradePostDict = {}
-        self.merchantTiles = copy.deepcopy(MERCHANT_TILES[str(numPlayers)])
+        self.merchantTiles = list(MERCHANT_TILES[str(numPlayers)])
         self.coalMarketRemaining = MAX_MARKET_COAL - 1  # coal market missing 1
         self.ironMarketRemaining = MAX_MARKET_IRON - 2  # iron market missing 1
-        self.roadLocations = copy.deepcopy(ROAD_LOCATIONS)
+        self.roadLocations = createRoadLocations()
         self.players: List[Player] = []  # array of Player objects
 
         for town in self.towns:
@@ -51,17 +62,46 @@ class Board:
         for town in self.towns:
             self.townDict[town.name] = town
 
+        # every build location, in layout slot order
+        self.buildLocations: List[BuildLocation] = [
+            buildLocation for town in self.towns for buildLocation in town.buildLocations
+        ]
+        for i, buildLocation in enumerate(self.buildLocations):
+            buildLocation.index = i
+
         for tradePost in self.tradePosts:
             self.tradePostDict[tradePost.name] = tradePost
         # network towns together
-        for town in self.towns:
-            for roadLocation in self.roadLocations:
-                if town.name in roadLocation.networks:
-                    town.addRoadLocation(roadLocation)
-        for tradePost in self.tradePosts:
-            for roadLocation in self.roadLocations:
-                if tradePost.name in roadLocation.networks:
-                    tradePost.addRoadLocation(roadLocation)
+        linkRoadLocations(self.towns, self.tradePostDict, self.roadLocations)
+
+        # change stamps - changeCounter value of the last change to each slot/road,
+        # observers remember the counter and only revisit what changed since
+        self.changeCounter = 0
+        self.slotChanged = np.zeros(NUM_SLOTS, dtype=np.int64)
+        self.roadChanged = np.zeros(NUM_ROADS, dtype=np.int64)
+
+        self.networkIndex = NetworkIndex(self)
+        self.journal = Journal()
+        # nodes each road links on this board (absent trade posts left out), and hop
+        # distances over built roads per source node, dropped whenever a road changes
+        self.roadNodes: List[List[int]] = [
+            [NODE_INDEX[town.name] for town in roadLocation.towns]
+            for roadLocation in self.roadLocations
+        ]
+        self.distanceCache: Dict[int, List[Optional[int]]] = {}
+        # live resource sources - per resource, slot index -> building with cubes left
+        self.resourceBuildings: Dict[BuildingName, Dict[int, IndustryBuilding]] = {
+            BuildingName.coal: {},
+            BuildingName.iron: {},
+            BuildingName.beer: {},
+        }
+        # trade posts and breweries each town reaches, dropped when roads or breweries change
+        self.tradeIndex = TradeIndex(self)
+        for i, roadLocation in enumerate(self.roadLocations):
+            roadLocation.index = i
+            roadLocation.addBoard(self)
+        self.scoreIndex = ScoreIndex(self)
+        self.zobrist = ZobristHash(self)
 
     """
     addPlayer
@@ -75,6 +115,79 @@ class Board:
         for _ in range(STARTING_HAND_SIZE):
             player.hand.draw()
 
+    """
+    dealMerchantTiles
+    game init use only - shuffle merchant tiles onto trade posts, one per starting beer
+    """
+
+    def dealMerchantTiles(self):
+        merchantTiles = list(self.merchantTiles)
+        self.random.shuffle(merchantTiles)
+        for tradePost in self.tradePosts:
+            for _ in range(tradePost.startingBeerAmount):
+                tradePost.addMerchantTile(merchantTiles.pop())
+
+    def markSlotChanged(self, buildLocation: BuildLocation):
+        self.changeCounter += 1
+        self.slotChanged[buildLocation.index] = self.changeCounter
+        breweries = self.resourceBuildings[BuildingName.beer]
+        brewery = breweries.get(buildLocation.index)
+        self.updateResourceBuildings(buildLocation)
+        if breweries.get(buildLocation.index) is not brewery:
+            self.tradeIndex.invalidate()
+        self.scoreIndex.updateSlot(buildLocation)
+        self.zobrist.updateSlot(buildLocation)
+
+    def markRoadChanged(self, roadLocation: RoadLocation):
+        self.changeCounter += 1
+        self.roadChanged[roadLocation.index] = self.changeCounter
+        self.distanceCache.clear()
+        self.tradeIndex.invalidate()
+        self.scoreIndex.updateRoad(roadLocation)
+        self.zobrist.updateRoad(roadLocation)
+
+    def markTileChanged(self, building: Building):
+        self.zobrist.updateTile(building)
+
+    def markAllChanged(self):
+        self.changeCounter += 1
+        self.slotChanged[:] = self.changeCounter
+        self.roadChanged[:] = self.changeCounter
+        self.distanceCache.clear()
+        for buildLocation in self.buildLocations:
+            self.updateResourceBuildings(buildLocation)
+        self.tradeIndex.invalidate()
+        self.scoreIndex.rebuild()
+        self.zobrist.rebuild()
+
+    """
+    zobristHash
+
+    :return: 64 bit hash of the position, equal for equal positions (see ZobristHash)
+    """
+
+    def zobristHash(self) -> int:
+        return self.zobrist.value()
+
+    """
+    updateResourceBuildings
+    keep resourceBuildings in step with a build location, called on every slot change
+
+    :param buildLocation: build location that changed
+    """
+
+    def updateResourceBuildings(self, buildLocation: BuildLocation):
+        for buildings in self.resourceBuildings.values():
+            buildings.pop(buildLocation.index, None)
+        building = buildLocation.building
+        if (
+            building
+            and building.type == BuildingType.industry
+            and building.resourceAmount > 0
+            and not building.isRetired
+        ):
+            self.resourceBuildings[building.name][buildLocation.index] = building
+
     def getAllBuildings(self) -> List[Building]:
         l = []
         for town in self.towns:
@@ -83,47 +196,139 @@ class Board:
                     l.append(buildLocation.building)
         return l
 
+    """
+    getState
+    export the whole game, walks every slot, road and player so keep it off the hot path
+
+    :return: array snapshot of the whole game, see BoardSnapshot
+    """
+
+    def getState(self) -> BoardSnapshot:
+        return BoardSnapshot.fromBoard(self)
+
+    """
+    setState
+    import a snapshot, rewrites every piece and rebuilds the board's indexes
+
+    :param state: BoardSnapshot to load into this board (same amount of players)
+    """
+
+    def setState(self, state: BoardSnapshot):
+        state.applyTo(self)
+        self.markAllChanged()
+
+    """
+    make
+    play a player action so that unmake can take it back
+
+    :param player: player taking the action
+    :param action: any of [buildBuilding, buildCanal, buildOneRailroad, buildTwoRailroads, develop, sell, loan, scout, passTurn]
+    :param args: arguments of that Player method
+    """
+
+    def make(self, player: Player, action: str, *args):
+        self.journal.begin()
+        self.recordAction(player, action, *args)
+        try:
+            getattr(player, action)(*args)
+        except Exception:
+            self.unmake()
+            raise
+
+    """
+    unmake
+    take back the last made action (or tentative change, see Journal)
+    """
+
+    def unmake(self):
+        for obj in self.journal.undo():
+            if isinstance(obj, RoadLocation):
+                self.networkIndex.invalidate()
+                self.markRoadChanged(obj)
+            elif isinstance(obj, BuildLocation):
+                self.markSlotChanged(obj)
+            elif isinstance(obj, Building):
+                if obj.buildLocation:
+                    self.markSlotChanged(obj.buildLocation)
+                else:
+                    self.markTileChanged(obj)
+
+    """
+    recordAction
+    journal everything a player action may change
+
+    :param player: player taking the action
+    :param action: name of the Player method
+    :param args: arguments of the Player method
+    """
+
+    def recordAction(self, player: Player, action: str, *args):
+        journal = self.journal
+        journal.record(player)
+        journal.record(player.hand)
+        journal.record(self.deck)
+        journal.record(self, ["coalMarketRemaining", "ironMarketRemaining"])
+
+        if action == "buildBuilding":
+            building, buildLocation = args
+            journal.record(building)
+            journal.record(buildLocation)
+            if buildLocation.building:
+                journal.record(buildLocation.building)
+            for resourceBuilding in self.getCoalBuildings() + self.getIronBuildings():
+                journal.record(resourceBuilding)
+        elif action in ["buildCanal", "buildOneRailroad", "buildTwoRailroads"]:
+            for roadLocation in args:
+                journal.record(roadLocation)
+            for resourceBuilding in self.getCoalBuildings() + self.getBeerBuildings():
+                journal.record(resourceBuilding)
+            for tradePost in self.tradePosts:
+                journal.record(tradePost)
+        elif action == "develop":
+            for building in args:
+                journal.record(building)
+        elif action == "sell":
+            journal.record(args[0])
+            for beerBuilding in self.getBeerBuildings():
+                journal.record(beerBuilding)
+            for tradePost in self.tradePosts:
+                journal.record(tradePost)
+
     def priceForCoal(self, coalNeeded: int) -> int:
-        price = 0
-        currCoalRemaining = self.coalMarketRemaining
-        for _ in range(coalNeeded):
-            if currCoalRemaining <= 0:
-                price += 8
-            elif currCoalRemaining == 1 or currCoalRemaining == 2:
-                price += 7
-            elif currCoalRemaining == 3 or currCoalRemaining == 4:
-                price += 6
-            elif currCoalRemaining == 5 or currCoalRemaining == 6:
-                price += 5
-            elif currCoalRemaining == 7 or currCoalRemaining == 8:
-                price += 4
-            elif currCoalRemaining == 9 or currCoalRemaining == 10:
-                price += 3
-            elif currCoalRemaining == 11 or currCoalRemaining == 12:
-                price += 2
-            elif currCoalRemaining >= 13:
-                price += 1
-            currCoalRemaining = max(currCoalRemaining - 1, 0)
-        return price
+        return COAL_MARKET.price(self.coalMarketRemaining, coalNeeded)
 
     def priceForIron(self, ironNeeded: int) -> int:
-        price = 0
-        currIronRemaining = self.ironMarketRemaining
-        for _ in range(ironNeeded):
-            if currIronRemaining <= 0:
-                price += 6
-            elif currIronRemaining == 1 or currIronRemaining == 2:
-                price += 5
-            elif currIronRemaining == 3 or currIronRemaining == 4:
-                price += 4
-            elif currIronRemaining == 5 or currIronRemaining == 6:
-                price += 3
-            elif currIronRemaining == 7 or currIronRemaining == 8:
-                price += 2
-            elif currIronRemaining >= 9:
-                price += 1
-            currIronRemaining = max(currIronRemaining - 1, 0)
-        return price
+        return IRON_MARKET.price(self.ironMarketRemaining, ironNeeded)
+
+    """
+    sellCoal
+    sell coal to the coal market, as much as fits
+
+    :param X: amount of coal to sell
+    :param player: player receiving the money
+    :return: amount of coal sold
+    """
+
+    def sellCoal(self, X: int, player: Player) -> int:
+        sold, income = COAL_MARKET.sale(self.coalMarketRemaining, X)
+        self.coalMarketRemaining += sold
+        player.money += income
+        return sold
+
+    """
+    sellIron
+    sell iron to the iron market, as much as fits
+
+    :param X: amount of iron to sell
+    :param player: player receiving the money
+    :return: amount of iron sold
+    """
+
+    def sellIron(self, X: int, player: Player) -> int:
+        sold, income = IRON_MARKET.sale(self.ironMarketRemaining, X)
+        self.ironMarketRemaining += sold
+        player.money += income
+        return sold
 
     """
     areNetworked
@@ -136,37 +341,7 @@ class Board:
     def areNetworked(
         self, t1: Town | Building | TradePost, t2: Town | Building | TradePost
     ) -> bool:
-        #town contains building
-        if type(t1) == Town and t2:
-            for buildLocation in t1.buildLocations:
-                if buildLocation.building and buildLocation.building.id == t2.id:
-                    return True
-        if type(t2) == Town and t1:
-            for buildLocation in t2.buildLocations:
-                if buildLocation.building and buildLocation.building.id == t1.id:
-                    return True
-                
-
-        q = [t1]
-        v = set(t1.id)
-
-        while q:
-            town = q.pop(0)  # bfs
-            # get town neighbors, add to q
-            for roadLocation in town.networks:
-                if roadLocation.isBuilt:
-                    for _town in roadLocation.towns:
-                        if _town.id not in v:
-                            q.append(_town)
-                            v.add(_town.id)
-                            if _town.id == t2.id:
-                                return True
-                            
-                            if type(_town) == Town:
-                                for buildLocation in _town.buildLocations:
-                                    if buildLocation.building and buildLocation.building.id == t2.id:
-                                        return True
-        return False
+        return self.networkIndex.areConnected(t1, t2)
 
     """
     removeXCoal
@@ -270,16 +445,8 @@ class Board:
     :return: array of buildings which have coal resources"""
 
     def getCoalBuildings(self) -> List[IndustryBuilding]:
-        l = []
-        for building in self.getAllBuildings():
-            if (
-                building
-                and building.type == BuildingType.industry
-                and building.name == BuildingName.coal
-                and building.resourceAmount > 0
-            ):
-                l.append(building)
-        return l
+        buildings = self.resourceBuildings[BuildingName.coal]
+        return [buildings[slot] for slot in sorted(buildings)]
 
     """
     getBeerBuildings
@@ -287,16 +454,8 @@ class Board:
     :return: array of buildings which have beer resources"""
 
     def getBeerBuildings(self) -> List[IndustryBuilding]:
-        l = []
-        for building in self.getAllBuildings():
-            if (
-                building
-                and building.type == BuildingType.industry
-                and building.name == BuildingName.beer
-                and building.resourceAmount > 0
-            ):
-                l.append(building)
-        return l
+        buildings = self.resourceBuildings[BuildingName.beer]
+        return [buildings[slot] for slot in sorted(buildings)]
 
     """
     getIronBuildings
@@ -304,16 +463,8 @@ class Board:
     :return: array of buildings which have iron resources"""
 
     def getIronBuildings(self) -> List[IndustryBuilding]:
-        l = []
-        for building in self.getAllBuildings():
-            if (
-                building
-                and building.type == BuildingType.industry
-                and building.name == BuildingName.iron
-                and building.resourceAmount > 0
-            ):
-                l.append(building)
-        return l
+        buildings = self.resourceBuildings[BuildingName.iron]
+        return [buildings[slot] for slot in sorted(buildings)]
 
     """
     isCoalAvailableFromBuildings
@@ -394,14 +545,7 @@ class Board:
     """
 
     def isBeerAvailableFromTradePosts(self, town: Town) -> bool:
-        # check for connection to tradeposts
-        for tradePost in self.tradePosts:
-            if self.areNetworked(town, tradePost):
-                # enough money for beer amount?
-                # tyler double check sale price on this
-                if tradePost.beerAmount > 0:
-                    return True
-        return False
+        return self.tradeIndex.hasTradePostBeer(town)
 
     """
     isIronAvailableFromTradePosts
@@ -440,16 +584,7 @@ class Board:
     :return: amount of beer"""
 
     def getAvailableBeerAmount(self, player: Player, town: Town) -> int:
-        beerBuildings = self.getBeerBuildings()
-        amount = 0
-        for beerBuilding in beerBuildings:
-            if beerBuilding.owner == player or self.areNetworked(town, beerBuilding):
-                amount += beerBuilding.resourceAmount
-        for tradePost in self.tradePosts:
-            if self.areNetworked(town, tradePost):
-                amount += tradePost.beerAmount
-                break
-        return amount
+        return self.tradeIndex.beerAmount(player, town)
 
     """
     getAvailableCoalBuildingsTradePosts
@@ -460,11 +595,7 @@ class Board:
     def getAvailableCoalBuildingsTradePosts(
         self, town: Town
     ) -> List[IndustryBuilding | TradePost]:
-        coalBuildings = self.getCoalBuildings()
-        l = []
-        for coalBuilding in coalBuildings:
-            if self.areNetworked(town, coalBuilding):
-                l.append(coalBuilding)
+        l = self.getResourceSources(BuildingName.coal, town)
         for tradePost in self.tradePosts:
             if self.areNetworked(town, tradePost):
                 l.append(tradePost)
@@ -495,17 +626,67 @@ class Board:
     def getAvailableBeerBuildingsTradePosts(
         self, player: Player, town: Town
     ) -> List[Building | TradePost]:
-        beerBuildings = self.getBeerBuildings()
-        l = []
-        for beerBuilding in beerBuildings:
-            if beerBuilding.owner == player or self.areNetworked(town, beerBuilding):
-                l.append(beerBuilding)
-        for tradePost in self.tradePosts:
-            if self.areNetworked(town, tradePost):
-                if tradePost.beerAmount > 0:
-                    l.append(tradePost)
+        l = self.getResourceSources(BuildingName.beer, town, player)
+        for tradePost in self.tradeIndex.reachOf(town).tradePosts:
+            if tradePost.beerAmount > 0:
+                l.append(tradePost)
         return l
 
+    """
+    distancesFrom
+
+    :param location: town or trade post
+    :return: hops over built roads to every node (layout.NODE_INDEX), None where not connected
+    """
+
+    def distancesFrom(self, location: Town | TradePost) -> List[Optional[int]]:
+        node = NODE_INDEX[location.name]
+        distances = self.distanceCache.get(node)
+        if distances is not None:
+            return distances
+
+        distances = [None] * NUM_NODES
+        distances[node] = 0
+        frontier = [node]
+        while frontier:
+            nextFrontier = []
+            for current in frontier:
+                for road in NODE_ROADS[current]:
+                    if not self.roadLocations[road].isBuilt:
+                        continue
+                    for neighbour in self.roadNodes[road]:
+                        if distances[neighbour] is None:
+                            distances[neighbour] = distances[current] + 1
+                            nextFrontier.append(neighbour)
+            frontier = nextFrontier
+        self.distanceCache[node] = distances
+        return distances
+
+    """
+    getResourceSources
+    the rules take coal and beer from the closest source, ties go by slot order
+
+    :param name: any of [coal, beer]
+    :param town: town where the resource is required
+    :param player: player inquiring, own breweries count from anywhere (after connected ones)
+    :return: buildings with that resource, closest first
+    """
+
+    def getResourceSources(
+        self, name: BuildingName, town: Town | TradePost, player: Optional[Player] = None
+    ) -> List[IndustryBuilding]:
+        distances = self.distancesFrom(town)
+        sources = []
+        for slot, building in self.resourceBuildings[name].items():
+            distance = distances[NODE_INDEX[building.town.name]]
+            if distance is None:
+                if building.owner != player:
+                    continue
+                distance = NUM_NODES
+            sources.append((distance, slot, building))
+        sources.sort(key=lambda source: source[:2])
+        return [building for _, _, building in sources]
+
 
     """
     buildBuilding
@@ -567,41 +748,34 @@ class Board:
         self.removeXBeer(building.beerCost, [building.town], player)
         building.sell()
 
-    def getVictoryPoints(self) -> Dict[Player, int]:
-        points = {player: player.victoryPoints for player in self.players}
-
-        for building in self.getAllBuildings():
-            if building.isFlipped and not building.isRetired:
-                points[building.owner] += building.victoryPointsGained
-
-        for town in self.towns:
-            for network in town.networks:
-                if network.road and network.isBuilt:
-                    points[network.road.owner] += town.getNetworkVictoryPoints()
+    """
+    getVictoryPoints
 
-        for tradePost in self.tradePosts:
-            for network in tradePost.networks:
-                if network.road and network.isBuilt:
-                    points[network.road.owner] += tradePost.networkPoints
+    :return: points of every player so far - banked plus flipped buildings and links, see ScoreIndex
+    """
 
-        return points
+    def getVictoryPoints(self) -> Dict[Player, int]:
+        return {
+            player: player.victoryPoints + self.scoreIndex.points(player)
+            for player in self.players
+        }
 
     def endRailEra(self):
-        assert len(self.deck.cards) == 0
+        assert self.deck.size == 0
         for player in self.players:
-            assert len(player.hand.cards) == 0
+            assert player.hand.size == 0
         # Nothing to do
 
     def endCanalEra(self):
-        assert len(self.deck.cards) == 0
+        assert self.deck.size == 0
         for player in self.players:
-            assert len(player.hand.cards) == 0
+            assert player.hand.size == 0
 
         # Calculate player points
         playerPoints = self.getVictoryPoints()
 
         # Shuffle draw deck
-        self.deck = Deck(copy.deepcopy(STARTING_CARDS[str(self.numPlayers)]))
+        self.deck = Deck(startingDeck(self.numPlayers), self.random)
         # Set points to each player
         # Draw new hand
         for [player, points] in playerPoints.items():
@@ -623,6 +797,8 @@ class Board:
                 if buildLocation.building and buildLocation.building.tier <= 1:
                     # Remove obsolete industries
                     buildLocation.building.isRetired = True
+        self.networkIndex.rebuild()
+        self.markAllChanged()
 
         # Reset merchant beer
         for tradepost in self.tradePosts:
@@ -0,0 +1,399 @@
+from __future__ import annotations
+
+import struct
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Tuple
+
+import numpy as np
+from layout import (BUILDING_NAME_INDEX, DECK_CAPACITY, MERCHANT_NAME_INDEX,
+                    MERCHANT_NAMES, MERCHANT_TILES_PER_TRADEPOST,
+                    NUM_BUILDINGS, NUM_CARD_KINDS, NUM_ROADS, NUM_SLOTS,
+                    NUM_TOWNS, NUM_TRADEPOSTS, SLOT_TOWN, TRADEPOST_INDEX)
+
+from .buildings.enums import BuildingName, BuildingType
+from .deck import kindCounts
+from .enums import Era
+from .roads.canal import Canal
+from .roads.railroad import Railroad
+
+if TYPE_CHECKING:
+    from .board import Board
+
+# building status flags
+ACTIVE = 1
+SOLD = 2
+RETIRED = 4
+FLIPPED = 8
+
+ERAS = [Era.canal, Era.railroad]
+
+# binary format - header, then every array of ARRAY_FIELDS in order, little endian.
+# Array shapes only depend on the amount of players, so there is nothing else to store.
+# Bump FORMAT_VERSION whenever a field or layout.py numbering changes
+FORMAT_MAGIC = b"BRSB"
+FORMAT_VERSION = 2
+HEADER = struct.Struct("<4sBBBBBBB")
+ARRAY_FIELDS = [
+    "slotBuilding",
+    "slotOwner",
+    "slotIndustry",
+    "slotTier",
+    "slotResources",
+    "slotStatus",
+    "buildingStatus",
+    "buildingResources",
+    "buildingSlot",
+    "roadOwner",
+    "tradePostBeer",
+    "merchantTiles",
+    "money",
+    "income",
+    "victoryPoints",
+    "spentThisTurn",
+    "roadCount",
+    "hands",
+    "deck",
+    "discardPile",
+]
+
+
+class BoardSnapshot:
+    """
+    BoardSnapshot - export snapshot of the game state as fixed shape NumPy arrays
+
+    Indices follow layout (slots, roads, trade posts, card kinds), players follow board.players.
+    The Board object graph is the engine: nothing reads these arrays while a game is played.
+    fromBoard/applyTo walk the whole board in Python (a few hundred microseconds each way
+    on a 4 player position), so take a snapshot to serialize, store or inspect a position,
+    not per move. Copies and the queries below only touch the snapshot.
+
+    :param numPlayers: amount of players
+    """
+
+    def __init__(self, numPlayers: int):
+        self.numPlayers = numPlayers
+        self.era = 0
+        self.coalMarketRemaining = 0
+        self.ironMarketRemaining = 0
+
+        # slots - what is built where
+        self.slotBuilding = np.full(NUM_SLOTS, -1, dtype=np.int16)  # building index
+        self.slotOwner = np.full(NUM_SLOTS, -1, dtype=np.int8)
+        self.slotIndustry = np.full(NUM_SLOTS, -1, dtype=np.int8)  # BuildingName index
+        self.slotTier = np.zeros(NUM_SLOTS, dtype=np.int8)
+        self.slotResources = np.zeros(NUM_SLOTS, dtype=np.int8)
+        self.slotStatus = np.zeros(NUM_SLOTS, dtype=np.uint8)
+
+        # every player's building tiles, in Player.buildings order
+        self.buildingStatus = np.zeros((numPlayers, NUM_BUILDINGS), dtype=np.uint8)
+        self.buildingResources = np.zeros((numPlayers, NUM_BUILDINGS), dtype=np.int8)
+        self.buildingSlot = np.full((numPlayers, NUM_BUILDINGS), -1, dtype=np.int8)
+
+        # network and merchants
+        self.roadOwner = np.full(NUM_ROADS, -1, dtype=np.int8)
+        self.tradePostBeer = np.full(NUM_TRADEPOSTS, -1, dtype=np.int8)
+        self.merchantTiles = np.full(
+            (NUM_TRADEPOSTS, MERCHANT_TILES_PER_TRADEPOST), -1, dtype=np.int8
+        )
+
+        # players
+        self.money = np.zeros(numPlayers, dtype=np.int32)
+        self.income = np.zeros(numPlayers, dtype=np.int32)
+        self.victoryPoints = np.zeros(numPlayers, dtype=np.int32)
+        self.spentThisTurn = np.zeros(numPlayers, dtype=np.int32)
+        self.roadCount = np.zeros(numPlayers, dtype=np.int32)
+        self.hands = np.zeros((numPlayers, NUM_CARD_KINDS), dtype=np.int8)
+
+        # card kinds, the deck in drawing order (Deck.cards, next card last), the discard
+        # pile kind by kind
+        self.deck = np.full(DECK_CAPACITY, -1, dtype=np.int8)
+        self.deckSize = 0
+        self.discardPile = np.full(DECK_CAPACITY, -1, dtype=np.int8)
+        self.discardPileSize = 0
+
+    """
+    fromBoard
+
+    :param board: board to read
+    :return: BoardSnapshot of board
+    """
+
+    @staticmethod
+    def fromBoard(board: Board) -> BoardSnapshot:
+        state = BoardSnapshot(len(board.players))
+        state.era = ERAS.index(board.era)
+        state.coalMarketRemaining = board.coalMarketRemaining
+        state.ironMarketRemaining = board.ironMarketRemaining
+
+        # rows are filled as lists and stored once, element writes into NumPy are slow
+        tiles = {}  # id() of the building -> (player, tile), tile ids repeat across players
+        for p, player in enumerate(board.players):
+            state.money[p] = player.money
+            state.income[p] = player.income
+            state.victoryPoints[p] = player.victoryPoints
+            state.spentThisTurn[p] = player.spentThisTurn
+            state.roadCount[p] = player.roadCount
+            state.hands[p] = player.hand.countsView
+
+            status = []
+            resources = []
+            slots = []
+            for b, building in enumerate(player.buildings):
+                tiles[id(building)] = (p, b)
+                status.append(buildingStatus(building))
+                resources.append(
+                    building.resourceAmount if building.type == BuildingType.industry else 0
+                )
+                slots.append(building.buildLocation.index if building.buildLocation else -1)
+            state.buildingStatus[p] = status
+            state.buildingResources[p] = resources
+            state.buildingSlot[p] = slots
+
+        for slot, buildLocation in enumerate(board.buildLocations):
+            building = buildLocation.building
+            if not building:
+                continue
+            p, b = tiles[id(building)]
+            state.slotBuilding[slot] = b
+            state.slotOwner[slot] = p
+            state.slotIndustry[slot] = BUILDING_NAME_INDEX[building.name]
+            state.slotTier[slot] = building.tier
+            state.slotResources[slot] = state.buildingResources[p, b]
+            state.slotStatus[slot] = state.buildingStatus[p, b]
+
+        for r, roadLocation in enumerate(board.roadLocations):
+            if roadLocation.isBuilt:
+                state.roadOwner[r] = board.players.index(roadLocation.road.owner)
+
+        for tradePost in board.tradePosts:
+            t = TRADEPOST_INDEX[tradePost.name]
+            state.tradePostBeer[t] = tradePost.beerAmount
+            for i, merchantTile in enumerate(tradePost.merchantTiles):
+                state.merchantTiles[t, i] = MERCHANT_NAME_INDEX[merchantTile]
+
+        state.deckSize = board.deck.size
+        state.deck[: state.deckSize] = board.deck.cards
+        discardPile = np.repeat(np.arange(NUM_CARD_KINDS), board.deck.discardCounts)
+        state.discardPileSize = len(discardPile)
+        state.discardPile[: state.discardPileSize] = discardPile
+        return state
+
+    """
+    applyTo
+    overwrite a board (with the same amount of players) with this state
+
+    :param board: board to write
+    """
+
+    def applyTo(self, board: Board):
+        assert len(board.players) == self.numPlayers
+        board.era = ERAS[self.era]
+        board.coalMarketRemaining = int(self.coalMarketRemaining)
+        board.ironMarketRemaining = int(self.ironMarketRemaining)
+
+        buildLocations = board.buildLocations
+        statuses = self.buildingStatus.tolist()
+        resources = self.buildingResources.tolist()
+        slots = self.buildingSlot.tolist()
+        for p, player in enumerate(board.players):
+            player.money = int(self.money[p])
+            player.income = int(self.income[p])
+            player.victoryPoints = int(self.victoryPoints[p])
+            player.spentThisTurn = int(self.spentThisTurn[p])
+            player.roadCount = int(self.roadCount[p])
+            player.hand.deck = board.deck
+            player.hand.setCounts(self.hands[p])
+
+            for building, status, resourceAmount, slot in zip(
+                player.buildings, statuses[p], resources[p], slots[p]
+            ):
+                building.isActive = bool(status & ACTIVE)
+                building.isSold = bool(status & SOLD)
+                building.isRetired = bool(status & RETIRED)
+                building.isFlipped = bool(status & FLIPPED)
+                if building.type == BuildingType.industry:
+                    building.resourceAmount = resourceAmount
+                if slot < 0:
+                    building.buildLocation = None
+                    building.town = None
+                else:
+                    building.buildLocation = buildLocations[slot]
+                    building.town = None if building.isSold else buildLocations[slot].town
+
+        players = board.players
+        for buildLocation, owner, b in zip(
+            buildLocations, self.slotOwner.tolist(), self.slotBuilding.tolist()
+        ):
+            buildLocation.building = players[owner].buildings[b] if owner >= 0 else None
+
+        RoadType = Canal if board.era == Era.canal else Railroad
+        for roadLocation, owner in zip(board.roadLocations, self.roadOwner.tolist()):
+            roadLocation.road = RoadType(players[owner]) if owner >= 0 else None
+            roadLocation.isBuilt = owner >= 0
+        board.networkIndex.rebuild()
+
+        for tradePost in board.tradePosts:
+            t = TRADEPOST_INDEX[tradePost.name]
+            tradePost.beerAmount = int(self.tradePostBeer[t])
+            tradePost.merchantTiles = [
+                MERCHANT_NAMES[m] for m in self.merchantTiles[t] if m >= 0
+            ]
+
+        board.deck.setCards(self.deck[: self.deckSize])
+        board.deck.discardCounts = kindCounts(self.discardPile[: self.discardPileSize])
+
+    """
+    toBytes
+
+    :return: fixed layout binary encoding, see FORMAT_VERSION
+    """
+
+    def toBytes(self) -> bytes:
+        header = HEADER.pack(
+            FORMAT_MAGIC,
+            FORMAT_VERSION,
+            self.numPlayers,
+            self.era,
+            self.coalMarketRemaining,
+            self.ironMarketRemaining,
+            self.deckSize,
+            self.discardPileSize,
+        )
+        chunks = [header]
+        for name in ARRAY_FIELDS:
+            values = getattr(self, name)
+            chunks.append(values.astype(values.dtype.newbyteorder("<"), copy=False).tobytes())
+        return b"".join(chunks)
+
+    """
+    fromBytes
+
+    :param data: output of toBytes
+    :return: decoded BoardSnapshot
+    """
+
+    @staticmethod
+    def fromBytes(data: bytes) -> BoardSnapshot:
+        (
+            magic,
+            version,
+            numPlayers,
+            era,
+            coalMarketRemaining,
+            ironMarketRemaining,
+            deckSize,
+            discardPileSize,
+        ) = HEADER.unpack_from(data)
+        if magic != FORMAT_MAGIC:
+            raise ValueError("not a Brass Birmingham board state")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"board state format {version}, expected {FORMAT_VERSION}")
+
+        fields, size = arrayLayout(numPlayers)
+        if len(data) != size:
+            raise ValueError(f"board state of {len(data)} bytes, expected {size}")
+
+        state = BoardSnapshot.__new__(BoardSnapshot)
+        state.numPlayers = numPlayers
+        state.era = era
+        state.coalMarketRemaining = coalMarketRemaining
+        state.ironMarketRemaining = ironMarketRemaining
+        state.deckSize = deckSize
+        state.discardPileSize = discardPileSize
+
+        buffer = bytearray(data)  # one copy, the arrays are writable views into it
+        for name, dtype, shape, count, offset in fields:
+            values = np.frombuffer(buffer, dtype, count, offset).reshape(shape)
+            if not dtype.isnative:
+                values = values.astype(dtype.newbyteorder("="))
+            setattr(state, name, values)
+        return state
+
+    def copy(self) -> BoardSnapshot:
+        state = BoardSnapshot.__new__(BoardSnapshot)
+        for key, value in self.__dict__.items():
+            state.__dict__[key] = value.copy() if isinstance(value, np.ndarray) else value
+        return state
+
+    """Queries over the snapshot"""
+
+    """
+    resourceSlots
+
+    :param name: any of [coal, iron, beer]
+    :return: slots holding a building of that industry with resources left
+    """
+
+    def resourceSlots(self, name: BuildingName) -> np.ndarray:
+        return np.flatnonzero(
+            (self.slotIndustry == BUILDING_NAME_INDEX[name])
+            & (self.slotResources > 0)
+            & ((self.slotStatus & RETIRED) == 0)
+        )
+
+    def totalResources(self, name: BuildingName) -> int:
+        return int(self.slotResources[self.resourceSlots(name)].sum())
+
+    """
+    playerSlots
+
+    :param p: player index
+    :return: slots where player p has a building
+    """
+
+    def playerSlots(self, p: int) -> np.ndarray:
+        return np.flatnonzero(self.slotOwner == p)
+
+    """
+    townOccupancy
+
+    :return: amount of buildings in each town, indexed by layout town index
+    """
+
+    def townOccupancy(self) -> np.ndarray:
+        return np.bincount(
+            np.asarray(SLOT_TOWN)[self.slotOwner >= 0], minlength=NUM_TOWNS
+        )
+
+    def roadCounts(self) -> np.ndarray:
+        return np.bincount(self.roadOwner[self.roadOwner >= 0], minlength=self.numPlayers)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, BoardSnapshot) or self.__dict__.keys() != other.__dict__.keys():
+            return False
+        for key, value in self.__dict__.items():
+            if not np.array_equal(value, other.__dict__[key]):
+                return False
+        return True
+
+
+"""
+arrayLayout
+
+:param numPlayers: amount of players
+:return: (name, little endian dtype, shape, size, byte offset) of every array field and the total bytes
+"""
+
+
+@lru_cache(maxsize=None)
+def arrayLayout(numPlayers: int) -> Tuple[List[Tuple], int]:
+    empty = BoardSnapshot(numPlayers)
+    fields = []
+    offset = HEADER.size
+    for name in ARRAY_FIELDS:
+        values = getattr(empty, name)
+        fields.append(
+            (name, values.dtype.newbyteorder("<"), values.shape, values.size, offset)
+        )
+        offset += values.nbytes
+    return fields, offset
+
+
+def buildingStatus(building) -> int:
+    return (
+        (ACTIVE if building.isActive else 0)
+        | (SOLD if building.isSold else 0)
+        | (RETIRED if building.isRetired else 0)
+        | (FLIPPED if building.isFlipped else 0)
+    )
+
@@ -0,0 +1,194 @@
+"""
+Board template
+
+The starting pieces as prototype objects, made from the consts tables the first time
+they are asked for (trade posts and cards per amount of players), so only the player
+counts in use ever get built. Boards and players are created by flat copies of these
+prototypes (same slots and ids a deepcopy would give) and linked with precomputed
+layout indices, instead of building every piece and matching names in nested loops
+on every new game. Decks and hands only count card kinds, startingDeck.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+from consts import (BUILDINGS, ROAD_LOCATIONS, STARTING_CARDS, TOWNS,
+                    TRADEPOSTS, BuildingData, CardData)
+from layout import CARD_KIND_INDEX, NUM_TOWNS, ROAD_NODES, TRADEPOST_NAMES
+from python.slots import slotCopier
+
+from .build_location import BuildLocation
+from .buildings.building import Building
+from .buildings.enums import BuildingType
+from .buildings.industry_building import IndustryBuilding
+from .buildings.market_building import MarketBuilding
+from .cards.card import Card
+from .cards.enums import CardType
+from .cards.industry_card import IndustryCard
+from .cards.location_card import LocationCard
+from .road_location import RoadLocation
+from .town import Town
+from .trade_post import TradePost
+
+# (road index, town index) and (road index, trade post name) pairs, in the order
+# towns/trade posts are linked to roads
+ROAD_TOWNS: List[Tuple[int, int]] = [
+    (road, node)
+    for road, nodes in enumerate(ROAD_NODES)
+    for node in sorted(nodes)
+    if node < NUM_TOWNS
+]
+ROAD_TRADEPOSTS: List[Tuple[int, str]] = [
+    (road, TRADEPOST_NAMES[node - NUM_TOWNS])
+    for road, nodes in enumerate(ROAD_NODES)
+    for node in sorted(nodes)
+    if node >= NUM_TOWNS
+]
+
+
+def clone(prototype):
+    return slotCopier(prototype.__class__)(prototype)
+
+
+def newBuilding(data: BuildingData) -> Building:
+    if data.type == BuildingType.market:
+        return MarketBuilding(
+            data.name,
+            data.tier,
+            data.cost,
+            data.coalCost,
+            data.ironCost,
+            data.beerCost,
+            data.victoryPointsGained,
+            data.incomeGained,
+            data.networkPoints,
+            data.canBeDeveloped,
+            data.onlyPhaseOne,
+            data.onlyPhaseTwo,
+        )
+    return IndustryBuilding(
+        data.name,
+        data.tier,
+        data.resourceAmount,
+        data.cost,
+        data.coalCost,
+        data.ironCost,
+        data.victoryPointsGained,
+        data.incomeGained,
+        data.networkPoints,
+        data.onlyPhaseOne,
+        data.onlyPhaseTwo,
+    )
+
+
+def newCard(data: CardData) -> Card:
+    if data.type == CardType.location:
+        return LocationCard(data.name)
+    return IndustryCard(data.name)
+
+
+@lru_cache(maxsize=None)
+def townPrototypes() -> Tuple[Town, ...]:
+    return tuple(
+        Town(data.color, data.name, [BuildLocation(list(slot)) for slot in data.slots])
+        for data in TOWNS
+    )
+
+
+@lru_cache(maxsize=None)
+def tradePostPrototypes(numPlayers: int) -> Tuple[TradePost, ...]:
+    return tuple(TradePost(*data) for data in TRADEPOSTS[str(numPlayers)])
+
+
+@lru_cache(maxsize=None)
+def roadLocationPrototypes() -> Tuple[RoadLocation, ...]:
+    return tuple(
+        RoadLocation(list(data.networks), data.canBuildCanal, data.canBuildRailroad)
+        for data in ROAD_LOCATIONS
+    )
+
+
+@lru_cache(maxsize=None)
+def cardPrototypes(numPlayers: int) -> Tuple[Card, ...]:
+    return tuple(newCard(data) for data in STARTING_CARDS[str(numPlayers)])
+
+
+@lru_cache(maxsize=None)
+def buildingPrototypes() -> Tuple[Building, ...]:
+    return tuple(newBuilding(data) for data in BUILDINGS)
+
+
+def createTowns() -> List[Town]:
+    towns = []
+    for prototype in townPrototypes():
+        town = clone(prototype)
+        town.networks = []
+        town.board = None
+        town.buildLocations = [
+            clone(buildLocation) for buildLocation in prototype.buildLocations
+        ]
+        for buildLocation in town.buildLocations:
+            buildLocation.addTown(town)
+        towns.append(town)
+    return towns
+
+
+def createTradePosts(numPlayers: int) -> List[TradePost]:
+    tradePosts = []
+    for prototype in tradePostPrototypes(numPlayers):
+        tradePost = clone(prototype)
+        tradePost.merchantTiles = []
+        tradePost.networks = []
+        tradePosts.append(tradePost)
+    return tradePosts
+
+
+def createRoadLocations() -> List[RoadLocation]:
+    roadLocations = []
+    for prototype in roadLocationPrototypes():
+        roadLocation = clone(prototype)
+        roadLocation.towns = []
+        roadLocations.append(roadLocation)
+    return roadLocations
+
+
+"""
+linkRoadLocations
+same links as Town/TradePost.addRoadLocation over every road location
+
+:param towns: towns, in consts.TOWNS order
+:param tradePostDict: trade posts of the board by name
+:param roadLocations: road locations, in consts.ROAD_LOCATIONS order
+"""
+
+
+def linkRoadLocations(
+    towns: List[Town],
+    tradePostDict: Dict[str, TradePost],
+    roadLocations: List[RoadLocation],
+):
+    for road, town in ROAD_TOWNS:
+        towns[town].addRoadLocation(roadLocations[road])
+    for road, name in ROAD_TRADEPOSTS:
+        if name in tradePostDict:
+            tradePostDict[name].addRoadLocation(roadLocations[road])
+
+
+"""
+startingDeck
+
+:param numPlayers: amount of players
+:return: card kinds (layout.CARD_KINDS) of the starting deck, what a Deck is made of
+"""
+
+
+@lru_cache(maxsize=None)
+def startingDeck(numPlayers: int) -> Tuple[int, ...]:
+    return tuple(
+        CARD_KIND_INDEX[(data.type, data.name)] for data in STARTING_CARDS[str(numPlayers)]
+    )
+
+
+def createBuildings() -> List[Building]:
+    return [clone(building) for building in buildingPrototypes()]
@@ -19,10 +19,19 @@ class BuildLocation:
     :param town: town
     """
 
+    __slots__ = (
+        "id",
+        "possibleBuilds",
+        "building",
+        "index",
+        "town",
+    )
+
     def __init__(self, possibleBuilds: List[BuildingName]):
         self.id = id()
         self.possibleBuilds = possibleBuilds
         self.building: Optional[Building] = None
+        self.index: Optional[int] = None  # layout slot index, set by the board
 
     """
     addTown
@@ -36,9 +45,20 @@ class BuildLocation:
 
     def addBuilding(self, building: Building):
         self.building = building
+        self.markChanged()
 
     def retireBuilding(self):
         self.building = None
+        self.markChanged()
+
+    """
+    markChanged
+    stamp this slot as changed on the board, for incremental observers
+    """
+
+    def markChanged(self):
+        if self.town.board:
+            self.town.board.markSlotChanged(self)
 
     """
     isPossibleBuild
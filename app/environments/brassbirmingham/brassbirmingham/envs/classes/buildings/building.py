@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from python.id import id
 
@@ -27,6 +27,29 @@ class Building:
     :param onlyPhaseTwo=False:
     """
 
+    __slots__ = (
+        "id",
+        "type",
+        "name",
+        "tier",
+        "cost",
+        "coalCost",
+        "ironCost",
+        "victoryPointsGained",
+        "incomeGained",
+        "networkPoints",
+        "canBeDeveloped",
+        "onlyPhaseOne",
+        "onlyPhaseTwo",
+        "buildLocation",
+        "town",
+        "isSold",
+        "isActive",
+        "isRetired",
+        "isFlipped",
+        "owner",
+    )
+
     def __init__(
         self,
         type: BuildingType,
@@ -64,6 +87,7 @@ class Building:
             False  # only used for retired buildings (tier 1's) in second phase (pieces 'put back in the box')
         )
         self.isFlipped = False
+        self.owner: Optional[Player] = None
 
     """
     addOwner - add player/owner to building
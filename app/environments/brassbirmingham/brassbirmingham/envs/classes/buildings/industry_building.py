@@ -19,6 +19,8 @@ class IndustryBuilding(Building):
     :param onlyPhaseTwo=False:
     """
 
+    __slots__ = ("resourceAmount", "resourcesType")
+
     def __init__(
         self,
         name: BuildingName,
@@ -55,3 +57,5 @@ class IndustryBuilding(Building):
         self.resourceAmount -= amount
 
         self.isFlipped = self.resourceAmount == 0
+        if self.buildLocation:
+            self.buildLocation.markChanged()
@@ -20,6 +20,8 @@ class MarketBuilding(Building):
     :param onlyPhaseTwo=False:
     """
 
+    __slots__ = ("beerCost",)
+
     def __init__(
         self,
         name: BuildingName,
@@ -56,3 +58,5 @@ class MarketBuilding(Building):
         self.isSold = True
         self.town = None
         self.isFlipped = True
+        if self.buildLocation:
+            self.buildLocation.markChanged()
@@ -11,6 +11,8 @@ class Card:
     :param name: name of location or industry
     """
 
+    __slots__ = ("id", "name", "type")
+
     def __init__(self, type: CardType, name: CardName):
         self.id = id()
         self.name = name
@@ -5,6 +5,8 @@ from .enums import CardName, CardType
 
 
 class IndustryCard(Card):
+    __slots__ = ("isWild",)
+
     def __init__(self, name: CardName):
         super(IndustryCard, self).__init__(CardType.industry, name=name)
         self.isWild = name == CardName.wild_industry
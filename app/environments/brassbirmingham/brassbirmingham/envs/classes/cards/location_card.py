@@ -7,6 +7,8 @@ from .enums import CardName, CardType
 
 
 class LocationCard(Card):
+    __slots__ = ("isWild",)
+
     def __init__(self, name: CardName, isWild=False):
         super(LocationCard, self).__init__(CardType.location, name=name)
         self.isWild = isWild
@@ -1,37 +1,100 @@
 import random
-from typing import List
+from array import array
+from typing import Iterable, List, Optional
+
+import numpy as np
+from layout import NUM_CARD_KINDS
 
 from python.id import id
 
-from .cards.card import Card
+
+"""
+kindCounts
+
+:param cards: card kinds
+:return: amount of cards per kind, array("b") of NUM_CARD_KINDS
+"""
+
+
+def kindCounts(cards: Iterable[int] = ()) -> array:
+    counts = array("b", bytes(NUM_CARD_KINDS))
+    for kind in cards:
+        counts[kind] += 1
+    return counts
 
 
 class Deck:
     """
-    Deck object
+    Deck object - cards as card kinds (layout.CARD_KINDS)
 
-    :param cards: array of Card objects
+    counts holds the amount of cards left per kind (countsView reads it as a NumPy
+    array without copying). cards holds the same kinds in drawing order, the next card
+    last: the deck is shuffled once when made (and when the discard pile becomes the
+    deck) and draw pops from the end, so the order alone decides what is drawn and a
+    saved deck (BoardSnapshot) draws the same cards after loading.
+
+    :param cards: card kinds in the deck
+    :param rng: random.Random shuffling the cards, the global random module by default
     """
 
-    def __init__(self, cards: List[Card]):
+    __slots__ = (
+        "id",
+        "cards",
+        "counts",
+        "discardCounts",
+        "random",
+    )
+
+    def __init__(self, cards: Iterable[int], rng: random.Random = random):
         self.id = id()
-        self.cards = cards
-        self.discardPile = []
+        self.random = rng
+        self.discardCounts = kindCounts()
+        self.setCards(cards)
         self.shuffle()
 
+    """
+    setCards
+
+    :param cards: card kinds the deck holds from now on, in drawing order (next card last)
+    """
+
+    def setCards(self, cards: Iterable[int]):
+        self.cards: List[int] = [int(kind) for kind in cards]
+        self.counts = kindCounts(self.cards)
+
     def shuffle(self):
-        random.shuffle(self.cards)
+        self.random.shuffle(self.cards)
+
+    @property
+    def size(self) -> int:
+        return len(self.cards)
 
-    def draw(self):
-        if len(self.cards) > 0:
-            return self.cards.pop()
-        else:
+    @property
+    def countsView(self) -> np.ndarray:
+        return np.frombuffer(self.counts, dtype=np.int8)
+
+    """
+    draw
+
+    :return: kind of the next card, None if the deck was empty (the discard pile becomes
+             the deck then)
+    """
+
+    def draw(self) -> Optional[int]:
+        if not self.cards:
             self.reset()
+            return None
+        kind = self.cards.pop()
+        self.counts[kind] -= 1
+        return kind
+
+    def discard(self, kind: int):
+        self.discardCounts[kind] += 1
 
     def reset(self):
-        self.cards = self.discardPile
-        self.discardPile = []
+        self.setCards(np.repeat(np.arange(NUM_CARD_KINDS), self.discardCounts))
         self.shuffle()
+        self.discardCounts = kindCounts()
 
     def __str__(self) -> str:
-        return str(self.cards)
+        return str(list(self.counts))
@@ -1,42 +1,96 @@
-from typing import List
+from array import array
+from typing import List, Sequence
+
+import numpy as np
+from layout import NUM_CARD_KINDS
 
 from python.id import id
 
-from .cards.card import Card
-from .deck import Deck
+from .deck import Deck, kindCounts
 
 
 class Hand:
     """
-    Hand object
+    Hand object - amount of cards per card kind (layout.CARD_KINDS)
+
+    countsView reads the counts as a NumPy array without copying, for observations
+    and masks. Cards have no order of their own, card(i) counts them kind by kind.
 
     :param deck: Deck object"""
 
+    __slots__ = (
+        "id",
+        "counts",
+        "size",
+        "deck",
+    )
+
     def __init__(self, deck: Deck):
         self.id = id()
-        self.cards: List[Card] = []
+        self.counts = kindCounts()
+        self.size = 0
         self.deck = deck
 
+    @property
+    def countsView(self) -> np.ndarray:
+        return np.frombuffer(self.counts, dtype=np.int8)
+
     def draw(self):
-        self.cards.append(self.deck.draw())
+        kind = self.deck.draw()
+        if kind is not None:
+            self.add(kind)
+
+    def spendCard(self, kind: int):
+        assert self.counts[kind] > 0
+        self.counts[kind] -= 1
+        self.size -= 1
+        self.deck.discard(kind)
+
+    def add(self, kind: int):
+        self.counts[kind] += 1
+        self.size += 1
+
+    """
+    setCounts
+
+    :param counts: amount of cards per kind the hand holds from now on
+    """
 
-    def spendCard(self, card: Card):
-        self.cards = list(
-            filter(lambda x: x.id != card.self.cards, self.cards)
-        )  # remove that card from hand
-        self.deck.discardPile.append(card)
+    def setCounts(self, counts: Sequence[int]):
+        self.counts = array("b", np.asarray(counts, dtype=np.int8).tobytes())
+        self.size = sum(self.counts)
 
-    def add(self, card: Card):
-        self.cards.append(card)
+    """
+    kinds
+
+    :return: kind of every card in the hand, in kind order
+    """
+
+    def kinds(self) -> List[int]:
+        return [kind for kind in range(NUM_CARD_KINDS) for _ in range(self.counts[kind])]
+
+    """
+    card
+
+    :param i: position of the card, in kind order
+    :return: kind of the card
+    """
+
+    def card(self, i: int) -> int:
+        for kind, count in enumerate(self.counts):
+            i -= count
+            if i < 0:
+                return kind
+        raise IndexError("card index out of range")
 
     """
     getTotal
-    
+
     :return: amount of cards in hand
     """
 
     def getTotal(self) -> int:
-        return len(self.cards)
+        return self.size
 
     def __repr__(self):
-        return self.cards
+        return str(self.kinds())
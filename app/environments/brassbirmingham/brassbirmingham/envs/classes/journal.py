@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from python.slots import MISSING, attributeNames
+
+
+class Journal:
+    """
+    Journal - undo log of attribute snapshots, one frame per made action
+
+    Objects are recorded before they change. Undoing a frame writes the recorded
+    attributes back, so the objects themselves (and every reference to them) survive.
+    Lists and arrays (card counts) are copied on record since actions change them in
+    place. Attributes are read by name, which covers __slots__ classes as well as plain
+    ones.
+    """
+
+    def __init__(self):
+        self.frames: List[List[Tuple[object, Dict]]] = []
+        self.recorded: List[set] = []
+
+    """
+    begin
+    open a new frame, following records belong to it
+    """
+
+    def begin(self):
+        self.frames.append([])
+        self.recorded.append(set())
+
+    """
+    record
+
+    :param obj: object about to change
+    :param attributes: names of the attributes to keep, all of them if None
+    """
+
+    def record(self, obj: object, attributes: Optional[Sequence[str]] = None):
+        recorded = self.recorded[-1]
+        if id(obj) in recorded:
+            return
+        recorded.add(id(obj))
+        values = {}
+        for attribute in attributeNames(obj) if attributes is None else attributes:
+            value = getattr(obj, attribute, MISSING)
+            if value is not MISSING:
+                values[attribute] = value[:] if isinstance(value, (list, array)) else value
+        self.frames[-1].append((obj, values))
+
+    """
+    undo
+    revert every object of the last frame
+
+    :return: reverted objects
+    """
+
+    def undo(self) -> List[object]:
+        frame = self.frames.pop()
+        self.recorded.pop()
+        for obj, values in reversed(frame):
+            for attribute, value in values.items():
+                setattr(obj, attribute, value)
+        return [obj for obj, _ in frame]
+
+    def __len__(self) -> int:
+        return len(self.frames)
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+from consts import MAX_MARKET_COAL, MAX_MARKET_IRON
+
+MAX_ORDER = 16  # largest amount kept in the tables, bigger orders are priced cube by cube
+
+
+class Market:
+    """
+    Market - price ladder of the coal or iron market, as lookup tables
+
+    Spaces are priced in pairs, cheapest at the top: with `remaining` cubes left the next
+    cube costs maxPrice - ceil(remaining / 2), an empty market still sells at maxPrice.
+    Selling fills the most expensive empty space first and pays its price.
+
+    :param capacity: amount of spaces
+    :param maxPrice: price once the market is empty
+    """
+
+    def __init__(self, capacity: int, maxPrice: int):
+        self.capacity = capacity
+        self.maxPrice = maxPrice
+
+        # buyCost[remaining, amount] - total cost of buying amount cubes
+        self.buyCost = np.zeros((capacity + 1, MAX_ORDER + 1), dtype=np.int32)
+        # sellIncome[remaining, amount] - money for selling amount cubes (as many as fit)
+        self.sellIncome = np.zeros((capacity + 1, MAX_ORDER + 1), dtype=np.int32)
+        # sellAmount[remaining, amount] - cubes that fit
+        self.sellAmount = np.zeros((capacity + 1, MAX_ORDER + 1), dtype=np.int32)
+
+        for remaining in range(capacity + 1):
+            for amount in range(1, MAX_ORDER + 1):
+                left = remaining - (amount - 1)
+                self.buyCost[remaining, amount] = self.buyCost[
+                    remaining, amount - 1
+                ] + self.spacePrice(left)
+
+                filled = remaining + amount
+                self.sellIncome[remaining, amount] = self.sellIncome[remaining, amount - 1]
+                self.sellAmount[remaining, amount] = min(amount, capacity - remaining)
+                if filled <= capacity:
+                    self.sellIncome[remaining, amount] += self.spacePrice(filled)
+
+        self.nextPrice = self.buyCost[:, 1].copy()  # price of one cube, per remaining
+
+    """
+    spacePrice
+
+    :param remaining: cubes left including the one bought (0 or less means empty)
+    :return: price of that cube
+    """
+
+    def spacePrice(self, remaining: int) -> int:
+        if remaining <= 0:
+            return self.maxPrice
+        return self.maxPrice - math.ceil(remaining / 2)
+
+    """
+    price
+
+    :param remaining: cubes left in the market
+    :param amount: cubes to buy
+    :return: total cost
+    """
+
+    def price(self, remaining: int, amount: int) -> int:
+        if amount <= MAX_ORDER:
+            return int(self.buyCost[remaining, amount])
+        return sum(self.spacePrice(remaining - i) for i in range(amount))
+
+    """
+    sale
+
+    :param remaining: cubes left in the market
+    :param amount: cubes to sell
+    :return: (cubes sold, money received)
+    """
+
+    def sale(self, remaining: int, amount: int) -> tuple:
+        if amount <= MAX_ORDER:
+            return int(self.sellAmount[remaining, amount]), int(self.sellIncome[remaining, amount])
+        sold = min(amount, self.capacity - remaining)
+        return sold, sum(self.spacePrice(remaining + i) for i in range(1, sold + 1))
+
+
+COAL_MARKET = Market(MAX_MARKET_COAL, 8)
+IRON_MARKET = Market(MAX_MARKET_IRON, 6)
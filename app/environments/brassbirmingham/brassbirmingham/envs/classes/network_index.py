@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from .board import Board
+    from .buildings.building import Building
+    from .road_location import RoadLocation
+    from .town import Town
+    from .trade_post import TradePost
+
+
+class NetworkIndex:
+    """
+    NetworkIndex - connected components of the built road network
+
+    Towns and trade posts are union-find nodes, building a road joins every node it touches.
+    Components only ever merge during an era, so building a road updates the index in place;
+    removing a road marks it stale and it is rebuilt on the next lookup
+
+    :param board: board
+    """
+
+    def __init__(self, board: Board):
+        self.board = board
+        self.nodes: Dict[str, int] = {}
+        for location in [*board.towns, *board.tradePosts]:
+            self.nodes[location.name] = len(self.nodes)
+        self.parent: List[int] = list(range(len(self.nodes)))
+        self.isStale = False
+
+    def find(self, node: int) -> int:
+        parent = self.parent
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]  # path halving
+            node = parent[node]
+        return node
+
+    def union(self, node1: int, node2: int):
+        root1 = self.find(node1)
+        root2 = self.find(node2)
+        if root1 != root2:
+            self.parent[root2] = root1
+
+    """
+    addRoadLocation
+    join every town/trade post a newly built road touches
+
+    :param roadLocation: roadLocation which was just built
+    """
+
+    def addRoadLocation(self, roadLocation: RoadLocation):
+        if self.isStale:
+            return  # picked up by the next rebuild
+        towns = roadLocation.towns
+        first = self.nodes[towns[0].name]
+        for town in towns[1:]:
+            self.union(first, self.nodes[town.name])
+
+    def invalidate(self):
+        self.isStale = True
+
+    def rebuild(self):
+        self.parent = list(range(len(self.nodes)))
+        self.isStale = False
+        for roadLocation in self.board.roadLocations:
+            if roadLocation.isBuilt:
+                self.addRoadLocation(roadLocation)
+
+    """
+    nodeOf
+
+    :param location: Town, TradePost or Building
+    :return: node index of the town/trade post, None if a building is not on the board
+    """
+
+    def nodeOf(self, location: Town | Building | TradePost) -> Optional[int]:
+        if location is None:
+            return None
+        if location.type == "Town" or location.type == "TradePost":
+            return self.nodes.get(location.name)
+        buildLocation = location.buildLocation
+        if buildLocation and buildLocation.building is location:
+            return self.nodes[buildLocation.town.name]
+        return None
+
+    def component(self, location: Town | Building | TradePost) -> Optional[int]:
+        node = self.nodeOf(location)
+        if node is None:
+            return None
+        if self.isStale:
+            self.rebuild()
+        return self.find(node)
+
+    """
+    areConnected
+
+    :param l1: Town, TradePost or Building
+    :param l2: Town, TradePost or Building
+    :return: whether both are in the same built network
+    """
+
+    def areConnected(
+        self, l1: Town | Building | TradePost, l2: Town | Building | TradePost
+    ) -> bool:
+        component1 = self.component(l1)
+        return component1 is not None and component1 == self.component(l2)
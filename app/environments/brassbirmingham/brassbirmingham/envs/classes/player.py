@@ -5,22 +5,19 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from .board import Board
 
-import copy
 import math
 
 from classes.buildings.enums import BuildingType
-from classes.cards.card import Card
-from classes.cards.enums import CardName
 from classes.enums import Era
-from classes.cards.industry_card import IndustryCard
-from classes.cards.location_card import LocationCard
 from classes.hand import Hand
-from consts import (BUILDINGS, CANAL_PRICE, ONE_RAILROAD_COAL_PRICE,
+from consts import (CANAL_PRICE, ONE_RAILROAD_COAL_PRICE,
                     ONE_RAILROAD_PRICE, STARTING_MONEY,
                     STARTING_ROADS, TWO_RAILROAD_BEER_PRICE,
                     TWO_RAILROAD_COAL_PRICE, TWO_RAILROAD_PRICE)
+from layout import WILD_INDUSTRY_KIND, WILD_KINDS, WILD_LOCATION_KIND
 from python.id import id
 
+from .board_template import createBuildings
 from .build_location import BuildLocation
 from .buildings.building import Building
 from .buildings.market_building import MarketBuilding
@@ -39,9 +36,7 @@ class Player:
         self.income = 10
         self.victoryPoints = 0
         self.spentThisTurn = 0
-        self.buildings = copy.deepcopy(
-            BUILDINGS
-        )  # buildings, array of Building objects
+        self.buildings = createBuildings()  # buildings, array of Building objects
         for building in self.buildings:
             building.addOwner(self)
         self.buildingDict = {}
@@ -180,37 +175,31 @@ class Player:
     def canAffordTwoRailroadIndustryResources(
         self, roadLocation1: RoadLocation, roadLocation2: RoadLocation
     ) -> bool:
-        # FIXED issue - building second road X - 1 - 2, '2' isn't "networked" to X I think?
-        # def fix second road - go one at a time func
-        road1 = False
-        road2 = False
-        for town in roadLocation1.towns:
-            if self.board.getAvailableCoalAmount(town) >= TWO_RAILROAD_COAL_PRICE and self.board.getAvailableBeerAmount(self, town) >= TWO_RAILROAD_BEER_PRICE:
-                road1 = True
-                # build tmp road (delete after)
-                roadLocation1.isBuilt = True
-                break
-        if road1:
-            for town in roadLocation2.towns:
-                if self.board.getAvailableCoalAmount(town) >= TWO_RAILROAD_COAL_PRICE and self.board.getAvailableBeerAmount(self, town) >= TWO_RAILROAD_BEER_PRICE:
-                    roadLocation1.isBuilt = False
-                    return True
-
-        for town in roadLocation2.towns:
+        # one road needs coal and beer on its own, the other once the first is built
+        return self.canAffordSecondRailroad(
+            roadLocation1, roadLocation2
+        ) or self.canAffordSecondRailroad(roadLocation2, roadLocation1)
+
+    def canAffordSecondRailroad(
+        self, roadLocation1: RoadLocation, roadLocation2: RoadLocation
+    ) -> bool:
+        if not self.hasTwoRailroadResources(roadLocation1):
+            return False
+        # build tmp road, journaled so unmake always takes it back
+        self.board.journal.begin()
+        self.board.journal.record(roadLocation1)
+        roadLocation1.isBuilt = True
+        try:
+            return self.hasTwoRailroadResources(roadLocation2)
+        finally:
+            self.board.unmake()
+
+    def hasTwoRailroadResources(self, roadLocation: RoadLocation) -> bool:
+        for town in roadLocation.towns:
             if self.board.getAvailableCoalAmount(town) >= TWO_RAILROAD_COAL_PRICE and self.board.getAvailableBeerAmount(self, town) >= TWO_RAILROAD_BEER_PRICE:
-                road2 = True
-                # build tmp road (delete after)
-                roadLocation2.isBuilt = True
-                break
-        
-        if road2:
-            for town in roadLocation1.towns:
-                if self.board.getAvailableCoalAmount(town) >= TWO_RAILROAD_COAL_PRICE and self.board.getAvailableBeerAmount(self, town) >= TWO_RAILROAD_BEER_PRICE:
-                    roadLocation2.isBuilt = False
-                    return True
-            
+                return True
         return False
-    
+
     def canAffordTwoRailroads(self) -> bool:
         return self.money >= TWO_RAILROAD_PRICE
 
@@ -241,11 +230,6 @@ class Player:
                     if buildLocation_.building and buildLocation_.building.owner.id == self.id:
                         return False
 
-        print(
-            self.canAffordBuildingIndustryResources(
-                buildLocation, building
-            ), self.canAffordBuilding(building), self.canPlaceBuilding(building, buildLocation), building.owner == self
-        )
         return (
             self.canAffordBuildingIndustryResources(
                 buildLocation, building
@@ -307,16 +291,12 @@ class Player:
         return self.income >= 3
 
     # 6 SCOUT
-    def canScout(self, additionalDiscard: Card) -> bool:
-        ownership = False
-        for card in self.hand.cards:
-            if card.name in [CardName.wild_location, CardName.wild_industry]:
-                # No scouting if player has at least 1 wild card already
-                return False
-            if card.id == additionalDiscard.id:
-                ownership = True
-
-        return ownership
+    def canScout(self, additionalDiscard: int) -> bool:
+        # No scouting if player has at least 1 wild card already
+        counts = self.hand.counts
+        return counts[additionalDiscard] > 0 and not any(
+            counts[kind] for kind in WILD_KINDS
+        )
 
     # 7 PASS
     def canPassTurn(self) -> bool:
@@ -354,6 +334,8 @@ class Player:
         assert self.canDevelop(building1, building2)
         building1.isRetired = True
         building2.isRetired = True
+        self.board.markTileChanged(building1)
+        self.board.markTileChanged(building2)
 
     # 4 SELL
     def sell(self, building: MarketBuilding):
@@ -367,10 +349,10 @@ class Player:
         self.money += 30
 
     # 6 SCOUT
-    def scout(self, additionalDiscard: Card):
+    def scout(self, additionalDiscard: int):
         assert self.canScout(additionalDiscard)
-        self.hand.add(LocationCard(name=CardName.wild_location))
-        self.hand.add(IndustryCard(name=CardName.wild_industry))
+        self.hand.add(WILD_LOCATION_KIND)
+        self.hand.add(WILD_INDUSTRY_KIND)
         self.hand.spendCard(additionalDiscard)
 
     # 7 PASS
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, List, Optional
 from python.id import id
 
 if TYPE_CHECKING:
+    from .board import Board
     from .roads.road import Road
     from .town import Town
 
@@ -18,6 +19,18 @@ class RoadLocation:
     :param canBuildRailroad=True: is railroad track
     """
 
+    __slots__ = (
+        "id",
+        "networks",
+        "canBuildCanal",
+        "canBuildRailroad",
+        "road",
+        "board",
+        "_isBuilt",
+        "index",
+        "towns",
+    )
+
     def __init__(
         self,
         networks: List[str],
@@ -29,9 +42,38 @@ class RoadLocation:
         self.canBuildCanal = canBuildCanal
         self.canBuildRailroad = canBuildRailroad
         self.road: Optional[Road] = None
-        self.isBuilt = False
+        self.board: Optional[Board] = None
+        self._isBuilt = False
+        self.index: Optional[int] = None  # layout road index, set by the board
         self.towns: List[Town] = []
 
+    """
+    addBoard
+    game init use only
+
+    :param board: board
+    """
+
+    def addBoard(self, board: Board):
+        self.board = board
+
+    @property
+    def isBuilt(self) -> bool:
+        return self._isBuilt
+
+    @isBuilt.setter
+    def isBuilt(self, isBuilt: bool):
+        wasBuilt = self._isBuilt
+        self._isBuilt = isBuilt
+        if self.board is None or wasBuilt == isBuilt:
+            return
+        self.board.markRoadChanged(self)
+        # keep the board's connectivity index in step with the roads
+        if isBuilt:
+            self.board.networkIndex.addRoadLocation(self)
+        else:
+            self.board.networkIndex.invalidate()
+
     """
     addTown
     game init use only
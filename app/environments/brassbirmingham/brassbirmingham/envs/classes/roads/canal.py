@@ -10,6 +10,8 @@ from .road import Road
 
 
 class Canal(Road):
+    __slots__ = ("cost",)
+
     def __init__(self, owner: Player):
         super(Canal, self).__init__(owner, RoadType.canal)
         self.cost = 3
@@ -5,6 +5,8 @@ from .road import Road
 
 
 class Railroad(Road):
+    __slots__ = ()
+
     def __init__(self, owner: Player):
         super(Railroad, self).__init__(owner, RoadType.railroad)
         # TODO cost
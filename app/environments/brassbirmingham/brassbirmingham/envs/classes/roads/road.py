@@ -11,6 +11,8 @@ from .enums import RoadType
 
 
 class Road:
+    __slots__ = ("id", "type", "owner")
+
     def __init__(self, owner: Player, type: RoadType):
         self.id = id()
         self.type = type
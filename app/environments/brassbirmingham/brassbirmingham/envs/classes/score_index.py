@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from layout import NODE_INDEX, NUM_NODES, NUM_ROADS, NUM_SLOTS, SLOT_TOWN
+
+if TYPE_CHECKING:
+    from .board import Board
+    from .build_location import BuildLocation
+    from .player import Player
+    from .road_location import RoadLocation
+
+
+class ScoreIndex:
+    """
+    ScoreIndex - running victory points of the board, per player
+
+    Every slot and road remembers what it last added to the totals, a change only
+    takes back the old share and adds the new one. Link values of towns and trade
+    posts are kept per node with the amount of built roads each player has there,
+    so a building flipping or a road being placed costs a handful of additions.
+    Banked points (player.victoryPoints) are not part of the index.
+
+    :param board: board
+    """
+
+    def __init__(self, board: Board):
+        self.board = board
+        self.rebuild()
+
+    def rebuild(self):
+        board = self.board
+        self.buildingPoints: Dict[Player, int] = defaultdict(int)
+        self.linkPoints: Dict[Player, int] = defaultdict(int)
+
+        self.slotOwner: List[Optional[Player]] = [None] * NUM_SLOTS
+        self.slotPoints: List[int] = [0] * NUM_SLOTS
+        self.slotLinkValue: List[int] = [0] * NUM_SLOTS
+        self.roadOwner: List[Optional[Player]] = [None] * NUM_ROADS
+
+        # link value of every node, trade posts are fixed
+        self.nodeValue: List[int] = [0] * NUM_NODES
+        for tradePost in board.tradePosts:
+            self.nodeValue[NODE_INDEX[tradePost.name]] = tradePost.networkPoints
+        # nodeRoads[node][player] - built roads of that player touching the node
+        self.nodeRoads: List[Dict[Player, int]] = [defaultdict(int) for _ in range(NUM_NODES)]
+
+        for buildLocation in board.buildLocations:
+            self.updateSlot(buildLocation)
+        for roadLocation in board.roadLocations:
+            self.updateRoad(roadLocation)
+
+    """
+    updateSlot
+
+    :param buildLocation: build location that changed
+    """
+
+    def updateSlot(self, buildLocation: BuildLocation):
+        slot = buildLocation.index
+        building = buildLocation.building
+        owner, points, linkValue = None, 0, 0
+        if building and not building.isRetired:
+            owner = building.owner
+            linkValue = building.networkPoints
+            if building.isFlipped:
+                points = building.victoryPointsGained
+
+        if self.slotPoints[slot]:
+            self.buildingPoints[self.slotOwner[slot]] -= self.slotPoints[slot]
+        if points:
+            self.buildingPoints[owner] += points
+        self.slotOwner[slot] = owner
+        self.slotPoints[slot] = points
+
+        change = linkValue - self.slotLinkValue[slot]
+        if change:
+            node = SLOT_TOWN[slot]  # towns come first among the nodes
+            self.nodeValue[node] += change
+            for player, roads in self.nodeRoads[node].items():
+                self.linkPoints[player] += change * roads
+            self.slotLinkValue[slot] = linkValue
+
+    """
+    updateRoad
+
+    :param roadLocation: road location that changed
+    """
+
+    def updateRoad(self, roadLocation: RoadLocation):
+        road = roadLocation.index
+        owner = None
+        if roadLocation.isBuilt and roadLocation.road:
+            owner = roadLocation.road.owner
+        previous = self.roadOwner[road]
+        if owner is previous:
+            return
+
+        nodes = self.board.roadNodes[road]
+        if previous is not None:
+            for node in nodes:
+                self.nodeRoads[node][previous] -= 1
+                self.linkPoints[previous] -= self.nodeValue[node]
+        if owner is not None:
+            for node in nodes:
+                self.nodeRoads[node][owner] += 1
+                self.linkPoints[owner] += self.nodeValue[node]
+        self.roadOwner[road] = owner
+
+    """
+    points
+
+    :param player: player
+    :return: points from flipped buildings and built roads, without banked points
+    """
+
+    def points(self, player: Player) -> int:
+        return self.buildingPoints[player] + self.linkPoints[player]
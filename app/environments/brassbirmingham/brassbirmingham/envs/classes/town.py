@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional
 
 import consts
 from python.id import id
@@ -22,6 +22,16 @@ class Town:
     :param name: name
     :param buildLocation: array of BuildLocation objects"""
 
+    __slots__ = (
+        "id",
+        "type",
+        "color",
+        "name",
+        "buildLocations",
+        "networks",
+        "board",
+    )
+
     def __init__(self, color: str, name: str, buildLocations: List[BuildLocation]):
         self.id = id()
         self.type = "Town"
@@ -32,6 +42,7 @@ class Town:
             buildLocation.addTown(self)
         # networks to other towns ex: Town('Leek') would have [Town('Stoke-On-Trent'), Town('Belper')]
         self.networks: List[RoadLocation] = []
+        self.board: Optional[Board] = None
 
     """
     addBoard
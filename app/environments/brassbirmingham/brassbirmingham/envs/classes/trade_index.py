@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Tuple
+
+from layout import NODE_INDEX
+
+from .buildings.enums import BuildingName, MerchantName
+
+if TYPE_CHECKING:
+    from .board import Board
+    from .buildings.industry_building import IndustryBuilding
+    from .player import Player
+    from .town import Town
+    from .trade_post import TradePost
+
+
+class TradeReach(NamedTuple):
+    """
+    TradeReach - what a town is connected to over built roads
+
+    :param tradePosts: connected trade posts in board order, the first one's beer is the one used
+    :param breweries: connected breweries with beer left, in slot order
+    """
+
+    tradePosts: Tuple[TradePost, ...]
+    breweries: Tuple[IndustryBuilding, ...]
+
+
+class TradeIndex:
+    """
+    TradeIndex - trade posts and breweries each town reaches, for selling
+
+    Mirrors Board.getAvailableBeerAmount/isBeerAvailableFromTradePosts without a
+    network lookup per brewery and trade post. Entries are made per town on first use
+    from the NetworkIndex components and dropped by the board's change hooks when a
+    road changes or a brewery is built, runs dry or leaves the board. Beer amounts and
+    merchant tiles are read live, so taking beer keeps the entries.
+
+    :param board: board
+    """
+
+    def __init__(self, board: Board):
+        self.board = board
+        self.reach: Dict[int, TradeReach] = {}
+
+    def invalidate(self):
+        self.reach.clear()
+
+    """
+    reachOf
+
+    :param town: town or trade post
+    :return: trade posts and breweries connected to it
+    """
+
+    def reachOf(self, town: Town | TradePost) -> TradeReach:
+        node = NODE_INDEX[town.name]
+        reach = self.reach.get(node)
+        if reach is None:
+            board = self.board
+            index = board.networkIndex
+            component = index.component(town)
+            if component is None:
+                reach = TradeReach((), ())
+            else:
+                reach = TradeReach(
+                    tuple(
+                        tradePost
+                        for tradePost in board.tradePosts
+                        if index.component(tradePost) == component
+                    ),
+                    tuple(
+                        brewery
+                        for brewery in board.getBeerBuildings()
+                        if index.component(brewery.town) == component
+                    ),
+                )
+            self.reach[node] = reach
+        return reach
+
+    """
+    beerAmount
+
+    :param player: player inquiring (own breweries count from anywhere)
+    :param town: town where beer is required
+    :return: amount of beer, see Board.getAvailableBeerAmount
+    """
+
+    def beerAmount(self, player: Player, town: Town | TradePost) -> int:
+        reach = self.reachOf(town)
+        amount = sum(
+            brewery.resourceAmount
+            for brewery in self.board.resourceBuildings[BuildingName.beer].values()
+            if brewery.owner == player
+        )
+        amount += sum(
+            brewery.resourceAmount for brewery in reach.breweries if brewery.owner != player
+        )
+        if reach.tradePosts:
+            amount += reach.tradePosts[0].beerAmount
+        return amount
+
+    def hasTradePostBeer(self, town: Town | TradePost) -> bool:
+        return any(tradePost.beerAmount > 0 for tradePost in self.reachOf(town).tradePosts)
+
+    """
+    merchantTiles
+
+    :param town: town of a market building
+    :return: merchant tiles of every connected trade post
+    """
+
+    def merchantTiles(self, town: Town | TradePost) -> List[MerchantName]:
+        return [
+            merchantTile
+            for tradePost in self.reachOf(town).tradePosts
+            for merchantTile in tradePost.merchantTiles
+        ]
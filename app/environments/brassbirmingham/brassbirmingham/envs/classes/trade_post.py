@@ -20,6 +20,21 @@ class TradePost:
     :param canDevelop: can develop after first trade
     """
 
+    __slots__ = (
+        "id",
+        "type",
+        "name",
+        "startingBeerAmount",
+        "beerAmount",
+        "moneyGained",
+        "victoryPointsGained",
+        "incomeGained",
+        "merchantTiles",
+        "networkPoints",
+        "canDevelop",
+        "networks",
+    )
+
     def __init__(
         self,
         name: str,
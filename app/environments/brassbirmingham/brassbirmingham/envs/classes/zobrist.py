@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+import numpy as np
+from consts import MAX_MARKET_COAL, MAX_MARKET_IRON, STARTING_HAND_SIZE
+from layout import (BUILDING_NAME_INDEX, BUILDING_NAMES, DECK_CAPACITY,
+                    MERCHANT_NAME_INDEX, MERCHANT_NAMES,
+                    MERCHANT_TILES_PER_TRADEPOST, NUM_BUILDINGS,
+                    NUM_CARD_KINDS, NUM_ROADS, NUM_SLOTS, NUM_TRADEPOSTS,
+                    TRADEPOST_INDEX)
+
+from .enums import Era
+
+if TYPE_CHECKING:
+    from .board import Board
+    from .build_location import BuildLocation
+    from .buildings.building import Building
+    from .player import Player
+    from .road_location import RoadLocation
+
+ZOBRIST_SEED = 0x42524153  # fixed, hashes must agree across processes and runs
+MAX_PLAYERS = 4
+MAX_TIER = 8
+MAX_RESOURCES = 8
+MAX_TRADEPOST_BEER = 2
+MASK64 = (1 << 64) - 1
+
+_keys = np.random.default_rng(ZOBRIST_SEED)
+
+
+def randomKeys(*shape: int) -> List:
+    return _keys.integers(0, 1 << 64, size=shape, dtype=np.uint64).tolist()
+
+
+# slot tables - what stands on a slot: owner, industry and tier, cubes left, flipped
+SLOT_KEYS = randomKeys(NUM_SLOTS, MAX_PLAYERS, len(BUILDING_NAMES), MAX_TIER + 1)
+SLOT_RESOURCE_KEYS = randomKeys(NUM_SLOTS, MAX_RESOURCES + 1)
+SLOT_FLIPPED_KEYS = randomKeys(NUM_SLOTS)
+ROAD_KEYS = randomKeys(NUM_ROADS, MAX_PLAYERS)
+# tiles developed away (retired without being built), per Player.buildings index
+TILE_KEYS = randomKeys(MAX_PLAYERS, NUM_BUILDINGS)
+# hands - key of holding n copies of a card kind
+HAND_KEYS = randomKeys(MAX_PLAYERS, NUM_CARD_KINDS, STARTING_HAND_SIZE + 1)
+ERA_KEYS = randomKeys(len(Era))
+COAL_MARKET_KEYS = randomKeys(MAX_MARKET_COAL + 1)
+IRON_MARKET_KEYS = randomKeys(MAX_MARKET_IRON + 1)
+TRADEPOST_BEER_KEYS = randomKeys(NUM_TRADEPOSTS, MAX_TRADEPOST_BEER + 1)
+MERCHANT_KEYS = randomKeys(NUM_TRADEPOSTS, MERCHANT_TILES_PER_TRADEPOST, len(MERCHANT_NAMES))
+DECK_SIZE_KEYS = randomKeys(DECK_CAPACITY + 1)
+ERA_INDEX = {era: i for i, era in enumerate(Era)}
+
+
+"""
+mixKey
+key of unbounded numbers (money, points, ...) without a table, splitmix64 over the values
+
+:param values: integers
+:return: 64 bit key
+"""
+
+
+def mixKey(*values: int) -> int:
+    key = 0
+    for value in values:
+        key = (key ^ value) + 0x9E3779B97F4A7C15 & MASK64
+        key = (key ^ key >> 30) * 0xBF58476D1CE4E5B9 & MASK64
+        key = (key ^ key >> 27) * 0x94D049BB133111EB & MASK64
+        key ^= key >> 31
+    return key
+
+
+class ZobristHash:
+    """
+    ZobristHash - 64 bit hash of the position, kept up to date with the board
+
+    Slots, roads and developed tiles are hashed incrementally from the board's change
+    hooks, like ScoreIndex: each remembers the key it last added and swaps it for the
+    new one. Markets, trade post beer, players' numbers, hands and the deck size are a
+    few dozen lookups and are folded in by value(). Equal positions hash equal however
+    they were reached; tiles of the same industry and tier are interchangeable.
+
+    :param board: board
+    """
+
+    def __init__(self, board: Board):
+        self.board = board
+        self.rebuild()
+
+    def rebuild(self):
+        board = self.board
+        self.slotKeys: List[int] = [0] * NUM_SLOTS
+        self.roadKeys: List[int] = [0] * NUM_ROADS
+        self.tileKeys: Dict[Tuple[int, int], int] = {}
+        self.key = 0
+
+        for buildLocation in board.buildLocations:
+            self.updateSlot(buildLocation)
+        for roadLocation in board.roadLocations:
+            self.updateRoad(roadLocation)
+        for seat, player in enumerate(board.players):
+            for i, building in enumerate(player.buildings):
+                if building.isRetired and building.buildLocation is None:
+                    self.tileKeys[(seat, i)] = TILE_KEYS[seat][i]
+                    self.key ^= TILE_KEYS[seat][i]
+
+    def seat(self, player: Player) -> int:
+        return self.board.players.index(player)
+
+    """
+    updateSlot
+
+    :param buildLocation: build location that changed
+    """
+
+    def updateSlot(self, buildLocation: BuildLocation):
+        slot = buildLocation.index
+        building = buildLocation.building
+        key = 0
+        if building and not building.isRetired:
+            key = SLOT_KEYS[slot][self.seat(building.owner)][
+                BUILDING_NAME_INDEX[building.name]
+            ][building.tier]
+            key ^= SLOT_RESOURCE_KEYS[slot][getattr(building, "resourceAmount", 0)]
+            if building.isFlipped:
+                key ^= SLOT_FLIPPED_KEYS[slot]
+        self.key ^= self.slotKeys[slot] ^ key
+        self.slotKeys[slot] = key
+
+    """
+    updateRoad
+
+    :param roadLocation: road location that changed
+    """
+
+    def updateRoad(self, roadLocation: RoadLocation):
+        road = roadLocation.index
+        key = 0
+        if roadLocation.isBuilt and roadLocation.road:
+            key = ROAD_KEYS[road][self.seat(roadLocation.road.owner)]
+        self.key ^= self.roadKeys[road] ^ key
+        self.roadKeys[road] = key
+
+    """
+    updateTile
+
+    :param building: tile that was developed, or brought back by unmake
+    """
+
+    def updateTile(self, building: Building):
+        seat = self.seat(building.owner)
+        tile = (seat, building.owner.buildings.index(building))
+        key = 0
+        if building.isRetired and building.buildLocation is None:
+            key = TILE_KEYS[seat][tile[1]]
+        self.key ^= self.tileKeys.get(tile, 0) ^ key
+        self.tileKeys[tile] = key
+
+    """
+    value
+
+    :return: hash of the whole position on the board
+    """
+
+    def value(self) -> int:
+        board = self.board
+        key = self.key
+        key ^= ERA_KEYS[ERA_INDEX[board.era]]
+        key ^= COAL_MARKET_KEYS[board.coalMarketRemaining]
+        key ^= IRON_MARKET_KEYS[board.ironMarketRemaining]
+        key ^= DECK_SIZE_KEYS[board.deck.size]
+
+        for tradePost in board.tradePosts:
+            t = TRADEPOST_INDEX[tradePost.name]
+            key ^= TRADEPOST_BEER_KEYS[t][tradePost.beerAmount]
+            for i, merchantTile in enumerate(tradePost.merchantTiles):
+                key ^= MERCHANT_KEYS[t][i][MERCHANT_NAME_INDEX[merchantTile]]
+
+        for seat, player in enumerate(board.players):
+            key ^= mixKey(
+                seat,
+                player.money,
+                player.income,
+                player.victoryPoints,
+                player.spentThisTurn,
+                player.roadCount,
+            )
+            for kind, count in enumerate(player.hand.counts):
+                if count:
+                    key ^= HAND_KEYS[seat][kind][count]
+        return key
@@ -1,17 +1,14 @@
-from typing import Dict, List
-
-from classes.build_location import BuildLocation
-from classes.buildings.building import Building
-from classes.buildings.enums import BuildingName, MerchantName
-from classes.buildings.industry_building import IndustryBuilding
-from classes.buildings.market_building import MarketBuilding
-from classes.cards.card import Card
-from classes.cards.enums import CardName
-from classes.cards.industry_card import IndustryCard
-from classes.cards.location_card import LocationCard
-from classes.road_location import RoadLocation
-from classes.town import Town
-from classes.trade_post import TradePost
+"""
+Static game data
+
+Plain tuples only, importing this module creates no game objects. The pieces are
+made from these tables by the factories of classes.board_template, lazily and only
+for the player counts in use.
+"""
+from typing import Dict, NamedTuple, Tuple
+
+from classes.buildings.enums import BuildingName, BuildingType, MerchantName
+from classes.cards.enums import CardName, CardType
 
 STARTING_ROADS = 14
 STARTING_MONEY = 17
@@ -58,15 +55,15 @@ OXFORD = "Oxford"
 GLOUCESTER = "Gloucester"
 
 # merchant tiles
-MERCHANT_TILES = {
-    "2": [
+MERCHANT_TILES: Dict[str, Tuple[MerchantName, ...]] = {
+    "2": (
         MerchantName.all,
         MerchantName.blank,
         MerchantName.blank,
         MerchantName.cotton,
         MerchantName.goods,
-    ],
-    "3": [
+    ),
+    "3": (
         MerchantName.all,
         MerchantName.blank,
         MerchantName.blank,
@@ -74,8 +71,8 @@ MERCHANT_TILES = {
         MerchantName.cotton,
         MerchantName.pottery,
         MerchantName.goods,
-    ],
-    "4": [
+    ),
+    "4": (
         MerchantName.all,
         MerchantName.blank,
         MerchantName.blank,
@@ -85,460 +82,592 @@ MERCHANT_TILES = {
         MerchantName.pottery,
         MerchantName.goods,
         MerchantName.goods,
-    ]
+    ),
 }
 
-TOWNS: List[Town] = [
-    Town(
+
+class TownData(NamedTuple):
+    color: str
+    name: str
+    slots: Tuple[Tuple[BuildingName, ...], ...]  # possible builds of each build location
+
+
+class TradePostData(NamedTuple):
+    name: str
+    beerAmount: int
+    moneyGained: int
+    victoryPointsGained: int
+    incomeGained: int
+    networkPoints: int
+    canDevelop: bool
+
+
+class RoadLocationData(NamedTuple):
+    networks: Tuple[str, ...]
+    canBuildCanal: bool = True
+    canBuildRailroad: bool = True
+
+
+class BuildingData(NamedTuple):
+    type: BuildingType
+    name: BuildingName
+    tier: int
+    cost: int
+    coalCost: int
+    ironCost: int
+    beerCost: int  # beer needed to sell, market buildings only
+    resourceAmount: int  # cubes placed when built, industry buildings only
+    victoryPointsGained: int
+    incomeGained: int
+    networkPoints: int
+    canBeDeveloped: bool
+    onlyPhaseOne: bool
+    onlyPhaseTwo: bool
+
+
+class CardData(NamedTuple):
+    type: CardType
+    name: object  # town name for location cards, CardName (or BuildingName) for industry cards
+
+
+"""
+market
+row of a MarketBuilding, arguments as MarketBuilding takes them
+
+:return: BuildingData
+"""
+
+
+def market(
+    name: BuildingName,
+    tier: int,
+    cost: int,
+    coalCost: int,
+    ironCost: int,
+    beerCost: int,
+    victoryPointsGained: int,
+    incomeGained: int,
+    networkPoints: int,
+    canBeDeveloped=True,
+    onlyPhaseOne=False,
+    onlyPhaseTwo=False,
+) -> BuildingData:
+    return BuildingData(
+        BuildingType.market,
+        name,
+        tier,
+        cost,
+        coalCost,
+        ironCost,
+        beerCost,
+        0,
+        victoryPointsGained,
+        incomeGained,
+        networkPoints,
+        canBeDeveloped,
+        onlyPhaseOne,
+        onlyPhaseTwo,
+    )
+
+
+"""
+industry
+row of an IndustryBuilding, arguments as IndustryBuilding takes them
+
+:return: BuildingData
+"""
+
+
+def industry(
+    name: BuildingName,
+    tier: int,
+    resourceAmount: int,
+    cost: int,
+    coalCost: int,
+    ironCost: int,
+    victoryPointsGained: int,
+    incomeGained: int,
+    networkPoints: int,
+    onlyPhaseOne=False,
+    onlyPhaseTwo=False,
+) -> BuildingData:
+    return BuildingData(
+        BuildingType.industry,
+        name,
+        tier,
+        cost,
+        coalCost,
+        ironCost,
+        0,
+        resourceAmount,
+        victoryPointsGained,
+        incomeGained,
+        networkPoints,
+        True,
+        onlyPhaseOne,
+        onlyPhaseTwo,
+    )
+
+
+def locationCard(name: str) -> CardData:
+    return CardData(CardType.location, name)
+
+
+def industryCard(name) -> CardData:
+    return CardData(CardType.industry, name)
+
+
+TOWNS: Tuple[TownData, ...] = (
+    TownData(
         "blue",
         LEEK,
-        [
-            BuildLocation([BuildingName.cotton, BuildingName.goods]),
-            BuildLocation([BuildingName.cotton, BuildingName.coal]),
-        ],
+        (
+            (BuildingName.cotton, BuildingName.goods),
+            (BuildingName.cotton, BuildingName.coal),
+        ),
     ),
-    Town(
+    TownData(
         "blue",
         STOKE_ON_TRENT,
-        [
-            BuildLocation([BuildingName.cotton, BuildingName.goods]),
-            BuildLocation([BuildingName.pottery, BuildingName.iron]),
-            BuildLocation([BuildingName.goods]),
-        ],
+        (
+            (BuildingName.cotton, BuildingName.goods),
+            (BuildingName.pottery, BuildingName.iron),
+            (BuildingName.goods,),
+        ),
     ),
-    Town(
+    TownData(
         "blue",
         STONE,
-        [
-            BuildLocation([BuildingName.cotton, BuildingName.beer]),
-            BuildLocation([BuildingName.goods, BuildingName.coal]),
-        ],
+        (
+            (BuildingName.cotton, BuildingName.beer),
+            (BuildingName.goods, BuildingName.coal),
+        ),
     ),
-    Town(
+    TownData(
         "blue",
         UTTOXETER,
-        [
-            BuildLocation([BuildingName.goods, BuildingName.beer]),
-            BuildLocation([BuildingName.cotton, BuildingName.beer]),
-        ],
+        (
+            (BuildingName.goods, BuildingName.beer),
+            (BuildingName.cotton, BuildingName.beer),
+        ),
     ),
-    Town(
+    TownData(
         "green",
         BELPER,
-        [
-            BuildLocation([BuildingName.cotton, BuildingName.goods]),
-            BuildLocation([BuildingName.coal]),
-            BuildLocation([BuildingName.pottery]),
-        ],
+        (
+            (BuildingName.cotton, BuildingName.goods),
+            (BuildingName.coal,),
+            (BuildingName.pottery,),
+        ),
     ),
-    Town(
+    TownData(
         "green",
         DERBY,
-        [
-            BuildLocation([BuildingName.cotton, BuildingName.beer]),
-            BuildLocation([BuildingName.cotton, BuildingName.goods]),
-            BuildLocation([BuildingName.iron]),
-        ],
+        (
+            (BuildingName.cotton, BuildingName.beer),
+            (BuildingName.cotton, BuildingName.goods),
+            (BuildingName.iron,),
+        ),
     ),
-    Town(
+    TownData(
         "red",
         STAFFORD,
-        [
-            BuildLocation([BuildingName.goods, BuildingName.beer]),
-            BuildLocation([BuildingName.pottery]),
-        ],
+        (
+            (BuildingName.goods, BuildingName.beer),
+            (BuildingName.pottery,),
+        ),
     ),
-    Town(
+    TownData(
         "red",
         BURTON_UPON_TRENT,
-        [
-            BuildLocation([BuildingName.goods, BuildingName.coal]),
-            BuildLocation([BuildingName.beer]),
-        ],
+        (
+            (BuildingName.goods, BuildingName.coal),
+            (BuildingName.beer,),
+        ),
     ),
-    Town(BEER1, BEER1, [BuildLocation([BuildingName.beer])]),
-    Town(
+    TownData(BEER1, BEER1, ((BuildingName.beer,),)),
+    TownData(
         "red",
         "Cannock",
-        [
-            BuildLocation([BuildingName.goods, BuildingName.coal]),
-            BuildLocation([BuildingName.coal]),
-        ],
+        (
+            (BuildingName.goods, BuildingName.coal),
+            (BuildingName.coal,),
+        ),
     ),
-    Town(
+    TownData(
         "red",
         TAMWORTH,
-        [
-            BuildLocation([BuildingName.cotton, BuildingName.coal]),
-            BuildLocation([BuildingName.cotton, BuildingName.coal]),
-        ],
+        (
+            (BuildingName.cotton, BuildingName.coal),
+            (BuildingName.cotton, BuildingName.coal),
+        ),
     ),
-    Town(
+    TownData(
         "red",
         WALSALL,
-        [
-            BuildLocation([BuildingName.iron, BuildingName.goods]),
-            BuildLocation([BuildingName.goods, BuildingName.beer]),
-        ],
+        (
+            (BuildingName.iron, BuildingName.goods),
+            (BuildingName.goods, BuildingName.beer),
+        ),
     ),
-    Town(
+    TownData(
         "yellow",
         COALBROOKDALE,
-        [
-            BuildLocation([BuildingName.iron, BuildingName.beer]),
-            BuildLocation([BuildingName.iron]),
-            BuildLocation([BuildingName.coal]),
-        ],
+        (
+            (BuildingName.iron, BuildingName.beer),
+            (BuildingName.iron,),
+            (BuildingName.coal,),
+        ),
     ),
-    Town(
+    TownData(
         "yellow",
         WOLVERHAMPTON,
-        [
-            BuildLocation([BuildingName.goods]),
-            BuildLocation([BuildingName.goods, BuildingName.coal]),
-        ],
+        (
+            (BuildingName.goods,),
+            (BuildingName.goods, BuildingName.coal),
+        ),
     ),
-    Town(
+    TownData(
         "yellow",
         DUDLEY,
-        [BuildLocation([BuildingName.coal]), BuildLocation([BuildingName.iron])],
+        ((BuildingName.coal,), (BuildingName.iron,)),
     ),
-    Town(
+    TownData(
         "yellow",
         KIDDERMINSTER,
-        [
-            BuildLocation([BuildingName.cotton, BuildingName.coal]),
-            BuildLocation([BuildingName.cotton]),
-        ],
+        (
+            (BuildingName.cotton, BuildingName.coal),
+            (BuildingName.cotton,),
+        ),
     ),
-    Town(BEER2, BEER2, [BuildLocation([BuildingName.beer])]),
-    Town(
+    TownData(BEER2, BEER2, ((BuildingName.beer,),)),
+    TownData(
         "yellow",
         WORCESTER,
-        [BuildLocation([BuildingName.cotton]), BuildLocation([BuildingName.cotton])],
+        ((BuildingName.cotton,), (BuildingName.cotton,)),
     ),
-    Town(
+    TownData(
         "purple",
         BIRMINGHAM,
-        [
-            BuildLocation([BuildingName.cotton, BuildingName.goods]),
-            BuildLocation([BuildingName.goods]),
-            BuildLocation([BuildingName.iron]),
-            BuildLocation([BuildingName.goods]),
-        ],
+        (
+            (BuildingName.cotton, BuildingName.goods),
+            (BuildingName.goods,),
+            (BuildingName.iron,),
+            (BuildingName.goods,),
+        ),
     ),
-    Town(
+    TownData(
         "purple",
         NUNEATON,
-        [
-            BuildLocation([BuildingName.goods, BuildingName.beer]),
-            BuildLocation([BuildingName.cotton, BuildingName.coal]),
-        ],
+        (
+            (BuildingName.goods, BuildingName.beer),
+            (BuildingName.cotton, BuildingName.coal),
+        ),
     ),
-    Town(
+    TownData(
         "purple",
         COVENTRY,
-        [
-            BuildLocation([BuildingName.pottery]),
-            BuildLocation([BuildingName.goods, BuildingName.coal]),
-            BuildLocation([BuildingName.iron, BuildingName.goods]),
-        ],
+        (
+            (BuildingName.pottery,),
+            (BuildingName.goods, BuildingName.coal),
+            (BuildingName.iron, BuildingName.goods),
+        ),
     ),
-    Town(
+    TownData(
         "purple",
         REDDITCH,
-        [
-            BuildLocation([BuildingName.goods, BuildingName.coal]),
-            BuildLocation([BuildingName.iron]),
-        ],
+        (
+            (BuildingName.goods, BuildingName.coal),
+            (BuildingName.iron,),
+        ),
+    ),
+)
+
+
+TRADEPOSTS: Dict[str, Tuple[TradePostData, ...]] = {
+    "2": (
+        TradePostData(SHREWBURY, 1, 0, 4, 0, 2, False),
+        TradePostData(OXFORD, 2, 0, 0, 2, 2, False),
+        TradePostData(GLOUCESTER, 2, 0, 0, 2, 2, True),
+    ),
+    "3": (
+        TradePostData(SHREWBURY, 1, 0, 4, 0, 2, False),
+        TradePostData(OXFORD, 2, 0, 0, 2, 2, False),
+        TradePostData(GLOUCESTER, 2, 0, 0, 2, 2, True),
+        TradePostData(WARRINGTON, 2, 5, 0, 0, 2, False),
+    ),
+    "4": (
+        TradePostData(SHREWBURY, 1, 0, 4, 0, 2, False),
+        TradePostData(OXFORD, 2, 0, 0, 2, 2, False),
+        TradePostData(GLOUCESTER, 2, 0, 0, 2, 2, True),
+        TradePostData(WARRINGTON, 2, 5, 0, 0, 2, False),
+        TradePostData(NOTTINGHAM, 2, 0, 3, 0, 2, False),
     ),
-]
-
-
-TRADEPOSTS: Dict[int, List[TradePost]] = {
-    "2": [
-        TradePost(SHREWBURY, 1, 0, 4, 0, 2, False),
-        TradePost(OXFORD, 2, 0, 0, 2, 2, False),
-        TradePost(GLOUCESTER, 2, 0, 0, 2, 2, True),
-    ],
-    "3": [
-        TradePost(SHREWBURY, 1, 0, 4, 0, 2, False),
-        TradePost(OXFORD, 2, 0, 0, 2, 2, False),
-        TradePost(GLOUCESTER, 2, 0, 0, 2, 2, True),
-        TradePost(WARRINGTON, 2, 5, 0, 0, 2, False),
-    ],
-    "4": [
-        TradePost(SHREWBURY, 1, 0, 4, 0, 2, False),
-        TradePost(OXFORD, 2, 0, 0, 2, 2, False),
-        TradePost(GLOUCESTER, 2, 0, 0, 2, 2, True),
-        TradePost(WARRINGTON, 2, 5, 0, 0, 2, False),
-        TradePost(NOTTINGHAM, 2, 0, 3, 0, 2, False),
-    ]
 }
 
-ROAD_LOCATIONS: List[RoadLocation] = [
-    RoadLocation([WARRINGTON, STOKE_ON_TRENT]),
-    RoadLocation([STOKE_ON_TRENT, LEEK]),
-    RoadLocation([LEEK, BELPER], False),
-    RoadLocation([BELPER, DERBY]),
-    RoadLocation([DERBY, NOTTINGHAM]),
-    RoadLocation([DERBY, UTTOXETER], False),
-    RoadLocation([DERBY, BURTON_UPON_TRENT]),
-    RoadLocation([STOKE_ON_TRENT, STONE]),
-    RoadLocation([STONE, UTTOXETER], False),
-    RoadLocation([STONE, STAFFORD]),
-    RoadLocation([STONE, BURTON_UPON_TRENT]),
-    RoadLocation([STAFFORD, CANNOCK]),
-    RoadLocation([CANNOCK, BURTON_UPON_TRENT], False),
-    RoadLocation([TAMWORTH, BURTON_UPON_TRENT]),
-    RoadLocation([WALSALL, BURTON_UPON_TRENT], canBuildRailroad=False),
-    RoadLocation([BEER1, CANNOCK]),
-    RoadLocation([WOLVERHAMPTON, CANNOCK]),
-    RoadLocation([WALSALL, CANNOCK]),
-    RoadLocation([WOLVERHAMPTON, COALBROOKDALE]),
-    RoadLocation([SHREWBURY, COALBROOKDALE]),
-    RoadLocation([KIDDERMINSTER, COALBROOKDALE]),
-    RoadLocation([KIDDERMINSTER, DUDLEY]),
-    RoadLocation([WOLVERHAMPTON, WALSALL]),
-    RoadLocation([WOLVERHAMPTON, DUDLEY]),
-    RoadLocation([TAMWORTH, WALSALL], False),
-    RoadLocation([TAMWORTH, NUNEATON]),
-    RoadLocation([NUNEATON, COVENTRY]),
-    RoadLocation([BIRMINGHAM, WALSALL]),
-    RoadLocation([BIRMINGHAM, TAMWORTH]),
-    RoadLocation([BIRMINGHAM, NUNEATON], False),
-    RoadLocation([BIRMINGHAM, COVENTRY]),
-    RoadLocation([BIRMINGHAM, OXFORD]),
-    RoadLocation([BIRMINGHAM, REDDITCH], False),
-    RoadLocation([BIRMINGHAM, WORCESTER]),
-    RoadLocation([BIRMINGHAM, DUDLEY]),
-    RoadLocation([REDDITCH, OXFORD]),
-    RoadLocation([REDDITCH, GLOUCESTER]),
-    RoadLocation([WORCESTER, GLOUCESTER]),
-    RoadLocation([WORCESTER, BEER2, KIDDERMINSTER]),
-]
-
-BUILDINGS: List[Building] = [
-    MarketBuilding(BuildingName.goods, 1, 8, 1, 0, 1, 3, 5, 2, onlyPhaseOne=True),
-    MarketBuilding(BuildingName.goods, 2, 10, 0, 1, 1, 5, 0, 1),
-    MarketBuilding(BuildingName.goods, 2, 10, 0, 1, 1, 5, 0, 1),
-    MarketBuilding(BuildingName.goods, 3, 12, 2, 0, 0, 4, 4, 0),
-    MarketBuilding(BuildingName.goods, 4, 8, 0, 1, 1, 3, 6, 1),
-    MarketBuilding(BuildingName.goods, 5, 16, 1, 0, 2, 8, 2, 2),
-    MarketBuilding(BuildingName.goods, 5, 16, 1, 0, 2, 8, 2, 2),
-    MarketBuilding(BuildingName.goods, 6, 20, 0, 0, 1, 7, 6, 1),
-    MarketBuilding(BuildingName.goods, 7, 16, 1, 1, 0, 9, 4, 0),
-    MarketBuilding(BuildingName.goods, 8, 20, 0, 2, 1, 11, 1, 1),
-    MarketBuilding(BuildingName.cotton, 1, 12, 0, 0, 1, 5, 5, 1, onlyPhaseOne=True),
-    MarketBuilding(BuildingName.cotton, 1, 12, 0, 0, 1, 5, 5, 1, onlyPhaseOne=True),
-    MarketBuilding(BuildingName.cotton, 1, 12, 0, 0, 1, 5, 5, 1, onlyPhaseOne=True),
-    MarketBuilding(BuildingName.cotton, 2, 14, 1, 0, 1, 5, 4, 2),
-    MarketBuilding(BuildingName.cotton, 2, 14, 1, 0, 1, 5, 4, 2),
-    MarketBuilding(BuildingName.cotton, 3, 16, 1, 1, 1, 9, 3, 1),
-    MarketBuilding(BuildingName.cotton, 3, 16, 1, 1, 1, 9, 3, 1),
-    MarketBuilding(BuildingName.cotton, 3, 16, 1, 1, 1, 9, 3, 1),
-    MarketBuilding(BuildingName.cotton, 4, 18, 1, 1, 1, 12, 2, 1),
-    MarketBuilding(BuildingName.cotton, 4, 18, 1, 1, 1, 12, 2, 1),
-    MarketBuilding(BuildingName.cotton, 4, 18, 1, 1, 1, 12, 2, 1),
-    MarketBuilding(
+ROAD_LOCATIONS: Tuple[RoadLocationData, ...] = (
+    RoadLocationData((WARRINGTON, STOKE_ON_TRENT)),
+    RoadLocationData((STOKE_ON_TRENT, LEEK)),
+    RoadLocationData((LEEK, BELPER), False),
+    RoadLocationData((BELPER, DERBY)),
+    RoadLocationData((DERBY, NOTTINGHAM)),
+    RoadLocationData((DERBY, UTTOXETER), False),
+    RoadLocationData((DERBY, BURTON_UPON_TRENT)),
+    RoadLocationData((STOKE_ON_TRENT, STONE)),
+    RoadLocationData((STONE, UTTOXETER), False),
+    RoadLocationData((STONE, STAFFORD)),
+    RoadLocationData((STONE, BURTON_UPON_TRENT)),
+    RoadLocationData((STAFFORD, CANNOCK)),
+    RoadLocationData((CANNOCK, BURTON_UPON_TRENT), False),
+    RoadLocationData((TAMWORTH, BURTON_UPON_TRENT)),
+    RoadLocationData((WALSALL, BURTON_UPON_TRENT), canBuildRailroad=False),
+    RoadLocationData((BEER1, CANNOCK)),
+    RoadLocationData((WOLVERHAMPTON, CANNOCK)),
+    RoadLocationData((WALSALL, CANNOCK)),
+    RoadLocationData((WOLVERHAMPTON, COALBROOKDALE)),
+    RoadLocationData((SHREWBURY, COALBROOKDALE)),
+    RoadLocationData((KIDDERMINSTER, COALBROOKDALE)),
+    RoadLocationData((KIDDERMINSTER, DUDLEY)),
+    RoadLocationData((WOLVERHAMPTON, WALSALL)),
+    RoadLocationData((WOLVERHAMPTON, DUDLEY)),
+    RoadLocationData((TAMWORTH, WALSALL), False),
+    RoadLocationData((TAMWORTH, NUNEATON)),
+    RoadLocationData((NUNEATON, COVENTRY)),
+    RoadLocationData((BIRMINGHAM, WALSALL)),
+    RoadLocationData((BIRMINGHAM, TAMWORTH)),
+    RoadLocationData((BIRMINGHAM, NUNEATON), False),
+    RoadLocationData((BIRMINGHAM, COVENTRY)),
+    RoadLocationData((BIRMINGHAM, OXFORD)),
+    RoadLocationData((BIRMINGHAM, REDDITCH), False),
+    RoadLocationData((BIRMINGHAM, WORCESTER)),
+    RoadLocationData((BIRMINGHAM, DUDLEY)),
+    RoadLocationData((REDDITCH, OXFORD)),
+    RoadLocationData((REDDITCH, GLOUCESTER)),
+    RoadLocationData((WORCESTER, GLOUCESTER)),
+    RoadLocationData((WORCESTER, BEER2, KIDDERMINSTER)),
+)
+
+BUILDINGS: Tuple[BuildingData, ...] = (
+    market(BuildingName.goods, 1, 8, 1, 0, 1, 3, 5, 2, onlyPhaseOne=True),
+    market(BuildingName.goods, 2, 10, 0, 1, 1, 5, 0, 1),
+    market(BuildingName.goods, 2, 10, 0, 1, 1, 5, 0, 1),
+    market(BuildingName.goods, 3, 12, 2, 0, 0, 4, 4, 0),
+    market(BuildingName.goods, 4, 8, 0, 1, 1, 3, 6, 1),
+    market(BuildingName.goods, 5, 16, 1, 0, 2, 8, 2, 2),
+    market(BuildingName.goods, 5, 16, 1, 0, 2, 8, 2, 2),
+    market(BuildingName.goods, 6, 20, 0, 0, 1, 7, 6, 1),
+    market(BuildingName.goods, 7, 16, 1, 1, 0, 9, 4, 0),
+    market(BuildingName.goods, 8, 20, 0, 2, 1, 11, 1, 1),
+    market(BuildingName.cotton, 1, 12, 0, 0, 1, 5, 5, 1, onlyPhaseOne=True),
+    market(BuildingName.cotton, 1, 12, 0, 0, 1, 5, 5, 1, onlyPhaseOne=True),
+    market(BuildingName.cotton, 1, 12, 0, 0, 1, 5, 5, 1, onlyPhaseOne=True),
+    market(BuildingName.cotton, 2, 14, 1, 0, 1, 5, 4, 2),
+    market(BuildingName.cotton, 2, 14, 1, 0, 1, 5, 4, 2),
+    market(BuildingName.cotton, 3, 16, 1, 1, 1, 9, 3, 1),
+    market(BuildingName.cotton, 3, 16, 1, 1, 1, 9, 3, 1),
+    market(BuildingName.cotton, 3, 16, 1, 1, 1, 9, 3, 1),
+    market(BuildingName.cotton, 4, 18, 1, 1, 1, 12, 2, 1),
+    market(BuildingName.cotton, 4, 18, 1, 1, 1, 12, 2, 1),
+    market(BuildingName.cotton, 4, 18, 1, 1, 1, 12, 2, 1),
+    market(
         BuildingName.pottery, 1, 17, 0, 1, 1, 10, 5, 1, canBeDeveloped=False
     ),
-    MarketBuilding(BuildingName.pottery, 2, 0, 1, 0, 1, 1, 1, 1),
-    MarketBuilding(
+    market(BuildingName.pottery, 2, 0, 1, 0, 1, 1, 1, 1),
+    market(
         BuildingName.pottery, 3, 22, 2, 0, 2, 11, 5, 1, canBeDeveloped=False
     ),
-    MarketBuilding(BuildingName.pottery, 4, 0, 1, 0, 1, 1, 1, 1),
-    MarketBuilding(BuildingName.pottery, 5, 24, 2, 0, 2, 20, 5, 1, onlyPhaseTwo=True),
-    IndustryBuilding(BuildingName.iron, 1, 4, 5, 1, 0, 3, 3, 1, onlyPhaseOne=True),
-    IndustryBuilding(BuildingName.iron, 2, 4, 7, 1, 0, 5, 3, 1),
-    IndustryBuilding(BuildingName.iron, 3, 5, 9, 1, 0, 7, 2, 1),
-    IndustryBuilding(BuildingName.iron, 4, 6, 12, 1, 0, 9, 1, 1),
-    IndustryBuilding(BuildingName.beer, 1, 1, 5, 0, 1, 4, 4, 2),
-    IndustryBuilding(BuildingName.beer, 1, 1, 5, 0, 1, 4, 4, 2),
-    IndustryBuilding(
+    market(BuildingName.pottery, 4, 0, 1, 0, 1, 1, 1, 1),
+    market(BuildingName.pottery, 5, 24, 2, 0, 2, 20, 5, 1, onlyPhaseTwo=True),
+    industry(BuildingName.iron, 1, 4, 5, 1, 0, 3, 3, 1, onlyPhaseOne=True),
+    industry(BuildingName.iron, 2, 4, 7, 1, 0, 5, 3, 1),
+    industry(BuildingName.iron, 3, 5, 9, 1, 0, 7, 2, 1),
+    industry(BuildingName.iron, 4, 6, 12, 1, 0, 9, 1, 1),
+    industry(BuildingName.beer, 1, 1, 5, 0, 1, 4, 4, 2),
+    industry(BuildingName.beer, 1, 1, 5, 0, 1, 4, 4, 2),
+    industry(
         BuildingName.beer, 2, 1, 7, 0, 1, 5, 5, 2
     ),  # add logic somewhere to add +1 beer to tier ^2 in second phase
-    IndustryBuilding(BuildingName.beer, 2, 1, 7, 0, 1, 5, 5, 2),
-    IndustryBuilding(BuildingName.beer, 3, 1, 9, 0, 1, 7, 5, 2),
-    IndustryBuilding(BuildingName.beer, 3, 1, 9, 0, 1, 7, 5, 2),
-    IndustryBuilding(BuildingName.beer, 4, 1, 9, 0, 1, 10, 5, 2),
-    IndustryBuilding(BuildingName.coal, 1, 2, 5, 0, 0, 1, 4, 2, onlyPhaseOne=True),
-    IndustryBuilding(BuildingName.coal, 2, 3, 7, 0, 0, 2, 7, 1),
-    IndustryBuilding(BuildingName.coal, 2, 3, 7, 0, 0, 2, 7, 1),
-    IndustryBuilding(BuildingName.coal, 3, 4, 8, 0, 1, 3, 6, 1),
-    IndustryBuilding(BuildingName.coal, 3, 4, 8, 0, 1, 3, 6, 1),
-    IndustryBuilding(BuildingName.coal, 4, 5, 10, 0, 1, 4, 5, 1),
-    IndustryBuilding(BuildingName.coal, 4, 5, 10, 0, 1, 4, 5, 1),
-]
+    industry(BuildingName.beer, 2, 1, 7, 0, 1, 5, 5, 2),
+    industry(BuildingName.beer, 3, 1, 9, 0, 1, 7, 5, 2),
+    industry(BuildingName.beer, 3, 1, 9, 0, 1, 7, 5, 2),
+    industry(BuildingName.beer, 4, 1, 9, 0, 1, 10, 5, 2),
+    industry(BuildingName.coal, 1, 2, 5, 0, 0, 1, 4, 2, onlyPhaseOne=True),
+    industry(BuildingName.coal, 2, 3, 7, 0, 0, 2, 7, 1),
+    industry(BuildingName.coal, 2, 3, 7, 0, 0, 2, 7, 1),
+    industry(BuildingName.coal, 3, 4, 8, 0, 1, 3, 6, 1),
+    industry(BuildingName.coal, 3, 4, 8, 0, 1, 3, 6, 1),
+    industry(BuildingName.coal, 4, 5, 10, 0, 1, 4, 5, 1),
+    industry(BuildingName.coal, 4, 5, 10, 0, 1, 4, 5, 1),
+)
 
 """
 Starting deck
 
 Key is (str) amount of players playing
 """
-STARTING_CARDS: Dict[str, List[Card]] = {
-    "2": [
-        LocationCard(STAFFORD),
-        LocationCard(STAFFORD),
-        LocationCard(BURTON_UPON_TRENT),
-        LocationCard(BURTON_UPON_TRENT),
-        LocationCard(CANNOCK),
-        LocationCard(CANNOCK),
-        LocationCard(TAMWORTH),
-        LocationCard(WALSALL),
-        LocationCard(COALBROOKDALE),
-        LocationCard(COALBROOKDALE),
-        LocationCard(COALBROOKDALE),
-        LocationCard(DUDLEY),
-        LocationCard(DUDLEY),
-        LocationCard(KIDDERMINSTER),
-        LocationCard(KIDDERMINSTER),
-        LocationCard(WOLVERHAMPTON),
-        LocationCard(WOLVERHAMPTON),
-        LocationCard(WORCESTER),
-        LocationCard(WORCESTER),
-        LocationCard(BIRMINGHAM),
-        LocationCard(BIRMINGHAM),
-        LocationCard(BIRMINGHAM),
-        LocationCard(COVENTRY),
-        LocationCard(COVENTRY),
-        LocationCard(COVENTRY),
-        LocationCard(NUNEATON),
-        LocationCard(REDDITCH),
-        IndustryCard(CardName.iron_works),
-        IndustryCard(CardName.iron_works),
-        IndustryCard(CardName.iron_works),
-        IndustryCard(CardName.iron_works),
-        IndustryCard(CardName.coal_mine),
-        IndustryCard(CardName.coal_mine),
-        IndustryCard(CardName.pottery),
-        IndustryCard(CardName.pottery),
-        IndustryCard(CardName.brewery),
-        IndustryCard(CardName.brewery),
-        IndustryCard(CardName.brewery),
-        IndustryCard(CardName.brewery),
-        IndustryCard(CardName.brewery),
-    ],
-    "3": [
-        LocationCard(LEEK),
-        LocationCard(LEEK),
-        LocationCard(STOKE_ON_TRENT),
-        LocationCard(STOKE_ON_TRENT),
-        LocationCard(STOKE_ON_TRENT),
-        LocationCard(STONE),
-        LocationCard(STONE),
-        LocationCard(UTTOXETER),
-        LocationCard(STAFFORD),
-        LocationCard(STAFFORD),
-        LocationCard(BURTON_UPON_TRENT),
-        LocationCard(BURTON_UPON_TRENT),
-        LocationCard(CANNOCK),
-        LocationCard(CANNOCK),
-        LocationCard(TAMWORTH),
-        LocationCard(WALSALL),
-        LocationCard(COALBROOKDALE),
-        LocationCard(COALBROOKDALE),
-        LocationCard(COALBROOKDALE),
-        LocationCard(DUDLEY),
-        LocationCard(DUDLEY),
-        LocationCard(KIDDERMINSTER),
-        LocationCard(KIDDERMINSTER),
-        LocationCard(WOLVERHAMPTON),
-        LocationCard(WOLVERHAMPTON),
-        LocationCard(WORCESTER),
-        LocationCard(WORCESTER),
-        LocationCard(BIRMINGHAM),
-        LocationCard(BIRMINGHAM),
-        LocationCard(BIRMINGHAM),
-        LocationCard(COVENTRY),
-        LocationCard(COVENTRY),
-        LocationCard(COVENTRY),
-        LocationCard(NUNEATON),
-        LocationCard(REDDITCH),
-        IndustryCard(CardName.iron_works),
-        IndustryCard(CardName.iron_works),
-        IndustryCard(CardName.iron_works),
-        IndustryCard(CardName.iron_works),
-        IndustryCard(CardName.coal_mine),
-        IndustryCard(CardName.coal_mine),
-        IndustryCard(BuildingName.cotton),
-        IndustryCard(BuildingName.cotton),
-        IndustryCard(BuildingName.cotton),
-        IndustryCard(BuildingName.cotton),
-        IndustryCard(BuildingName.cotton),
-        IndustryCard(BuildingName.cotton),
-        IndustryCard(CardName.pottery),
-        IndustryCard(CardName.pottery),
-        IndustryCard(CardName.brewery),
-        IndustryCard(CardName.brewery),
-        IndustryCard(CardName.brewery),
-        IndustryCard(CardName.brewery),
-        IndustryCard(CardName.brewery),
-    ],
-    "4": [
-        LocationCard(BELPER),
-        LocationCard(BELPER),
-        LocationCard(DERBY),
-        LocationCard(DERBY),
-        LocationCard(DERBY),
-        LocationCard(LEEK),
-        LocationCard(LEEK),
-        LocationCard(STOKE_ON_TRENT),
-        LocationCard(STOKE_ON_TRENT),
-        LocationCard(STOKE_ON_TRENT),
-        LocationCard(STONE),
-        LocationCard(STONE),
-        LocationCard(UTTOXETER),
-        LocationCard(UTTOXETER),
-        LocationCard(STAFFORD),
-        LocationCard(STAFFORD),
-        LocationCard(BURTON_UPON_TRENT),
-        LocationCard(BURTON_UPON_TRENT),
-        LocationCard(CANNOCK),
-        LocationCard(CANNOCK),
-        LocationCard(TAMWORTH),
-        LocationCard(WALSALL),
-        LocationCard(COALBROOKDALE),
-        LocationCard(COALBROOKDALE),
-        LocationCard(COALBROOKDALE),
-        LocationCard(DUDLEY),
-        LocationCard(DUDLEY),
-        LocationCard(KIDDERMINSTER),
-        LocationCard(KIDDERMINSTER),
-        LocationCard(WOLVERHAMPTON),
-        LocationCard(WOLVERHAMPTON),
-        LocationCard(WORCESTER),
-        LocationCard(WORCESTER),
-        LocationCard(BIRMINGHAM),
-        LocationCard(BIRMINGHAM),
-        LocationCard(BIRMINGHAM),
-        LocationCard(COVENTRY),
-        LocationCard(COVENTRY),
-        LocationCard(COVENTRY),
-        LocationCard(NUNEATON),
-        LocationCard(REDDITCH),
-        IndustryCard(CardName.iron_works),
-        IndustryCard(CardName.iron_works),
-        IndustryCard(CardName.iron_works),
-        IndustryCard(CardName.iron_works),
-        IndustryCard(CardName.coal_mine),
-        IndustryCard(CardName.coal_mine),
-        IndustryCard(CardName.coal_mine),
-        IndustryCard(CardName.man_goods_or_cotton),
-        IndustryCard(CardName.man_goods_or_cotton),
-        IndustryCard(CardName.man_goods_or_cotton),
-        IndustryCard(CardName.man_goods_or_cotton),
-        IndustryCard(CardName.man_goods_or_cotton),
-        IndustryCard(CardName.man_goods_or_cotton),
-        IndustryCard(CardName.man_goods_or_cotton),
-        IndustryCard(CardName.man_goods_or_cotton),
-        IndustryCard(CardName.pottery),
-        IndustryCard(CardName.pottery),
-        IndustryCard(CardName.pottery),
-        IndustryCard(CardName.brewery),
-        IndustryCard(CardName.brewery),
-        IndustryCard(CardName.brewery),
-        IndustryCard(CardName.brewery),
-        IndustryCard(CardName.brewery),
-    ],
+STARTING_CARDS: Dict[str, Tuple[CardData, ...]] = {
+    "2": (
+        locationCard(STAFFORD),
+        locationCard(STAFFORD),
+        locationCard(BURTON_UPON_TRENT),
+        locationCard(BURTON_UPON_TRENT),
+        locationCard(CANNOCK),
+        locationCard(CANNOCK),
+        locationCard(TAMWORTH),
+        locationCard(WALSALL),
+        locationCard(COALBROOKDALE),
+        locationCard(COALBROOKDALE),
+        locationCard(COALBROOKDALE),
+        locationCard(DUDLEY),
+        locationCard(DUDLEY),
+        locationCard(KIDDERMINSTER),
+        locationCard(KIDDERMINSTER),
+        locationCard(WOLVERHAMPTON),
+        locationCard(WOLVERHAMPTON),
+        locationCard(WORCESTER),
+        locationCard(WORCESTER),
+        locationCard(BIRMINGHAM),
+        locationCard(BIRMINGHAM),
+        locationCard(BIRMINGHAM),
+        locationCard(COVENTRY),
+        locationCard(COVENTRY),
+        locationCard(COVENTRY),
+        locationCard(NUNEATON),
+        locationCard(REDDITCH),
+        industryCard(CardName.iron_works),
+        industryCard(CardName.iron_works),
+        industryCard(CardName.iron_works),
+        industryCard(CardName.iron_works),
+        industryCard(CardName.coal_mine),
+        industryCard(CardName.coal_mine),
+        industryCard(CardName.pottery),
+        industryCard(CardName.pottery),
+        industryCard(CardName.brewery),
+        industryCard(CardName.brewery),
+        industryCard(CardName.brewery),
+        industryCard(CardName.brewery),
+        industryCard(CardName.brewery),
+    ),
+    "3": (
+        locationCard(LEEK),
+        locationCard(LEEK),
+        locationCard(STOKE_ON_TRENT),
+        locationCard(STOKE_ON_TRENT),
+        locationCard(STOKE_ON_TRENT),
+        locationCard(STONE),
+        locationCard(STONE),
+        locationCard(UTTOXETER),
+        locationCard(STAFFORD),
+        locationCard(STAFFORD),
+        locationCard(BURTON_UPON_TRENT),
+        locationCard(BURTON_UPON_TRENT),
+        locationCard(CANNOCK),
+        locationCard(CANNOCK),
+        locationCard(TAMWORTH),
+        locationCard(WALSALL),
+        locationCard(COALBROOKDALE),
+        locationCard(COALBROOKDALE),
+        locationCard(COALBROOKDALE),
+        locationCard(DUDLEY),
+        locationCard(DUDLEY),
+        locationCard(KIDDERMINSTER),
+        locationCard(KIDDERMINSTER),
+        locationCard(WOLVERHAMPTON),
+        locationCard(WOLVERHAMPTON),
+        locationCard(WORCESTER),
+        locationCard(WORCESTER),
+        locationCard(BIRMINGHAM),
+        locationCard(BIRMINGHAM),
+        locationCard(BIRMINGHAM),
+        locationCard(COVENTRY),
+        locationCard(COVENTRY),
+        locationCard(COVENTRY),
+        locationCard(NUNEATON),
+        locationCard(REDDITCH),
+        industryCard(CardName.iron_works),
+        industryCard(CardName.iron_works),
+        industryCard(CardName.iron_works),
+        industryCard(CardName.iron_works),
+        industryCard(CardName.coal_mine),
+        industryCard(CardName.coal_mine),
+        industryCard(BuildingName.cotton),
+        industryCard(BuildingName.cotton),
+        industryCard(BuildingName.cotton),
+        industryCard(BuildingName.cotton),
+        industryCard(BuildingName.cotton),
+        industryCard(BuildingName.cotton),
+        industryCard(CardName.pottery),
+        industryCard(CardName.pottery),
+        industryCard(CardName.brewery),
+        industryCard(CardName.brewery),
+        industryCard(CardName.brewery),
+        industryCard(CardName.brewery),
+        industryCard(CardName.brewery),
+    ),
+    "4": (
+        locationCard(BELPER),
+        locationCard(BELPER),
+        locationCard(DERBY),
+        locationCard(DERBY),
+        locationCard(DERBY),
+        locationCard(LEEK),
+        locationCard(LEEK),
+        locationCard(STOKE_ON_TRENT),
+        locationCard(STOKE_ON_TRENT),
+        locationCard(STOKE_ON_TRENT),
+        locationCard(STONE),
+        locationCard(STONE),
+        locationCard(UTTOXETER),
+        locationCard(UTTOXETER),
+        locationCard(STAFFORD),
+        locationCard(STAFFORD),
+        locationCard(BURTON_UPON_TRENT),
+        locationCard(BURTON_UPON_TRENT),
+        locationCard(CANNOCK),
+        locationCard(CANNOCK),
+        locationCard(TAMWORTH),
+        locationCard(WALSALL),
+        locationCard(COALBROOKDALE),
+        locationCard(COALBROOKDALE),
+        locationCard(COALBROOKDALE),
+        locationCard(DUDLEY),
+        locationCard(DUDLEY),
+        locationCard(KIDDERMINSTER),
+        locationCard(KIDDERMINSTER),
+        locationCard(WOLVERHAMPTON),
+        locationCard(WOLVERHAMPTON),
+        locationCard(WORCESTER),
+        locationCard(WORCESTER),
+        locationCard(BIRMINGHAM),
+        locationCard(BIRMINGHAM),
+        locationCard(BIRMINGHAM),
+        locationCard(COVENTRY),
+        locationCard(COVENTRY),
+        locationCard(COVENTRY),
+        locationCard(NUNEATON),
+        locationCard(REDDITCH),
+        industryCard(CardName.iron_works),
+        industryCard(CardName.iron_works),
+        industryCard(CardName.iron_works),
+        industryCard(CardName.iron_works),
+        industryCard(CardName.coal_mine),
+        industryCard(CardName.coal_mine),
+        industryCard(CardName.coal_mine),
+        industryCard(CardName.man_goods_or_cotton),
+        industryCard(CardName.man_goods_or_cotton),
+        industryCard(CardName.man_goods_or_cotton),
+        industryCard(CardName.man_goods_or_cotton),
+        industryCard(CardName.man_goods_or_cotton),
+        industryCard(CardName.man_goods_or_cotton),
+        industryCard(CardName.man_goods_or_cotton),
+        industryCard(CardName.man_goods_or_cotton),
+        industryCard(CardName.pottery),
+        industryCard(CardName.pottery),
+        industryCard(CardName.pottery),
+        industryCard(CardName.brewery),
+        industryCard(CardName.brewery),
+        industryCard(CardName.brewery),
+        industryCard(CardName.brewery),
+        industryCard(CardName.brewery),
+    ),
 }
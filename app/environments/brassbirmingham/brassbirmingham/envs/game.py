@@ -0,0 +1,318 @@
+"""
+Turn controller for Brass Birmingham, independent of gym
+
+Every action uses one card from the hand (scout one more). A turn is 2 actions,
+1 in the first round of the canal era; hands are refilled from the deck at the
+end of a turn. An era ends once the deck and every hand are empty.
+"""
+from __future__ import annotations
+
+import math
+import random
+import struct
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from actions import (ACTIONS, ActionType, actionCard, availableBuildings,
+                     developBuildings, legalActions)
+from classes.board import Board
+from classes.board_snapshot import BoardSnapshot
+from classes.enums import Era
+from classes.player import Player
+from classes.zobrist import mixKey
+from consts import STARTING_HAND_SIZE
+from record import GameRecord
+
+# Game.toBytes - header, then BoardSnapshot.toBytes. The header holds the turn state, the
+# seed and the full state of the game's random.Random (624 words, position, gauss_next
+# or NaN), so a restored game draws the same cards and tiles as the original.
+# Bump GAME_FORMAT_VERSION whenever the header changes
+GAME_FORMAT_MAGIC = b"BRSG"
+GAME_FORMAT_VERSION = 1
+TURN_HEADER = struct.Struct("<4sBBHBBQ625Id")
+
+
+class Game:
+    """
+    Game - board, players and turn order of one game
+
+    :param numPlayers: amount of players
+    :param seed: seed of the game's shuffles, drawn from the global random module if None
+    :param record: keep a GameRecord of the actions played, see replay
+    """
+
+    def __init__(self, numPlayers: int, seed: Optional[int] = None, record: bool = False):
+        self.numPlayers = numPlayers
+        self.seed = random.getrandbits(64) if seed is None else seed
+        self.random = random.Random(self.seed)
+        self.record = GameRecord(numPlayers, self.seed) if record else None
+        self.board = Board(numPlayers, self.random)
+        self.players: List[Player] = [
+            Player(str(p + 1), self.board) for p in range(numPlayers)
+        ]
+        self.board.dealMerchantTiles()
+
+        self.currentPlayerNum = 0
+        self.turn = 0  # turns played this era
+        self.actionsRemaining = 1  # first round of canal era is 1 action each
+        self.isOver = False
+
+    @property
+    def currentPlayer(self) -> Player:
+        return self.players[self.currentPlayerNum]
+
+    """
+    legalActions
+
+    :return: legal action mask of the current player, see actions.legalActions
+    """
+
+    def legalActions(self) -> np.ndarray:
+        if self.isOver:
+            return np.zeros(len(ACTIONS), dtype=np.float32)
+        return legalActions(self.board, self.currentPlayer)
+
+    """
+    step
+    play one action of the current player, must be legal
+
+    :param action: index into actions.ACTIONS
+    """
+
+    def step(self, action: int):
+        assert not self.isOver
+        player = self.currentPlayer
+        card = actionCard(player.hand, action)
+        self.applyAction(player, action)
+        if self.record is not None:
+            self.record.actions.append(action)
+        player.hand.spendCard(card)
+
+        self.actionsRemaining -= 1
+        if self.actionsRemaining == 0 or not player.hand.size:
+            self.endTurn()
+
+    def applyAction(self, player: Player, action: int):
+        method, args = self.actionCall(player, action)
+        getattr(player, method)(*args)
+
+    """
+    actionCall
+
+    :param player: player taking the action
+    :param action: index into actions.ACTIONS
+    :return: name and arguments of the Player method playing it, ready for Board.make
+    """
+
+    def actionCall(self, player: Player, action: int) -> Tuple[str, tuple]:
+        actionType, args = ACTIONS[action]
+        board = self.board
+
+        if actionType == ActionType.build:
+            slot, name = args
+            building = availableBuildings(player)[name][0]
+            return "buildBuilding", (building, board.buildLocations[slot])
+        if actionType == ActionType.network:
+            roadLocation = board.roadLocations[args[0]]
+            if board.era == Era.canal:
+                return "buildCanal", (roadLocation,)
+            return "buildOneRailroad", (roadLocation,)
+        if actionType == ActionType.twoRailroads:
+            return "buildTwoRailroads", (
+                board.roadLocations[args[0]],
+                board.roadLocations[args[1]],
+            )
+        if actionType == ActionType.develop:
+            return "develop", developBuildings(availableBuildings(player), *args)
+        if actionType == ActionType.sell:
+            return "sell", (board.buildLocations[args[0]].building,)
+        if actionType == ActionType.loan:
+            return "loan", ()
+        if actionType == ActionType.scout:
+            return "scout", (player.hand.card(1),)
+        return "passTurn", ()
+
+    def endTurn(self):
+        player = self.currentPlayer
+        while player.hand.size < STARTING_HAND_SIZE and self.board.deck.size:
+            player.hand.draw()
+        self.turn += 1
+
+        for i in range(1, self.numPlayers + 1):
+            playerNum = (self.currentPlayerNum + i) % self.numPlayers
+            if self.players[playerNum].hand.size:
+                self.currentPlayerNum = playerNum
+                self.actionsRemaining = self.actionsPerTurn()
+                return
+        self.endEra()
+
+    def actionsPerTurn(self) -> int:
+        if self.board.era == Era.canal and self.turn < self.numPlayers:
+            return 1
+        return 2
+
+    def endEra(self):
+        if self.board.era == Era.canal:
+            self.board.endCanalEra()
+            self.turn = 0
+            self.currentPlayerNum = 0
+            self.actionsRemaining = self.actionsPerTurn()
+        else:
+            self.board.endRailEra()
+            self.isOver = True
+
+    """
+    toBytes
+
+    :return: turn state, random state and BoardSnapshot.toBytes, for checkpoints and other
+             processes
+    """
+
+    def toBytes(self) -> bytes:
+        _, words, gaussNext = self.random.getstate()
+        header = TURN_HEADER.pack(
+            GAME_FORMAT_MAGIC,
+            GAME_FORMAT_VERSION,
+            self.currentPlayerNum,
+            self.turn,
+            self.actionsRemaining,
+            self.isOver,
+            self.seed,
+            *words,
+            math.nan if gaussNext is None else gaussNext,
+        )
+        return header + self.board.getState().toBytes()
+
+    """
+    fromBytes
+
+    :param data: output of toBytes
+    :return: game in that position, built from the game's own seed
+    """
+
+    @staticmethod
+    def fromBytes(data: bytes) -> Game:
+        seed = unpackTurnHeader(data)[4]
+        state = BoardSnapshot.fromBytes(data[TURN_HEADER.size :])
+        game = Game(state.numPlayers, seed)
+        game.loadBytes(data, state)
+        return game
+
+    """
+    loadBytes
+    put this game (same amount of players) in a position, seed and random state included,
+    cheaper than fromBytes for scratch games
+
+    :param data: output of toBytes
+    :param state: the board state of data, if already decoded
+    """
+
+    def loadBytes(self, data: bytes, state: Optional[BoardSnapshot] = None):
+        currentPlayerNum, turn, actionsRemaining, isOver, seed, randomState = unpackTurnHeader(
+            data
+        )
+        if state is None:
+            state = BoardSnapshot.fromBytes(data[TURN_HEADER.size :])
+        self.board.setState(state)
+        self.currentPlayerNum = currentPlayerNum
+        self.turn = turn
+        self.actionsRemaining = actionsRemaining
+        self.isOver = bool(isOver)
+        self.seed = seed
+        self.random.setstate(randomState)
+
+    """
+    scores
+
+    :return: victory points of every player, in player order
+    """
+
+    def scores(self) -> List[int]:
+        points = self.board.getVictoryPoints()
+        return [points[player] for player in self.players]
+
+    """
+    rewards
+    +1 split between the leaders, -1 split between the last placed
+
+    :return: reward of every player, in player order
+    """
+
+    def rewards(self) -> List[float]:
+        reward = [0.0] * self.numPlayers
+        scores = self.scores()
+        winners = [i for i, score in enumerate(scores) if score == max(scores)]
+        losers = [i for i, score in enumerate(scores) if score == min(scores)]
+        for w in winners:
+            reward[w] += 1.0 / len(winners)
+        for l in losers:
+            reward[l] -= 1.0 / len(losers)
+        return reward
+
+    """
+    zobristHash
+
+    :return: 64 bit hash of the position including whose turn it is, see Board.zobristHash
+    """
+
+    def zobristHash(self) -> int:
+        return self.board.zobristHash() ^ mixKey(
+            self.numPlayers, self.currentPlayerNum, self.turn, self.actionsRemaining
+        )
+
+
+"""
+unpackTurnHeader
+
+:param data: output of Game.toBytes
+:return: currentPlayerNum, turn, actionsRemaining, isOver, seed and the random.Random state
+"""
+
+
+def unpackTurnHeader(data: bytes) -> Tuple:
+    magic, version, currentPlayerNum, turn, actionsRemaining, isOver, seed, *words = (
+        TURN_HEADER.unpack_from(data)
+    )
+    if magic != GAME_FORMAT_MAGIC:
+        raise ValueError("not a Brass Birmingham game")
+    if version != GAME_FORMAT_VERSION:
+        raise ValueError(f"game format {version}, expected {GAME_FORMAT_VERSION}")
+    gaussNext = words.pop()
+    randomState = (3, tuple(words), None if math.isnan(gaussNext) else gaussNext)
+    return currentPlayerNum, turn, actionsRemaining, isOver, seed, randomState
+
+
+"""
+replay
+rebuild a recorded game by playing its actions again, nothing is rendered or logged
+
+:param record: GameRecord of the game
+:param numActions: amount of actions to play, all of them if None
+:return: game after those actions
+"""
+
+
+def replay(record: GameRecord, numActions: Optional[int] = None) -> Game:
+    for game in replayPositions(record, numActions):
+        pass
+    return game
+
+
+"""
+replayPositions
+
+:param record: GameRecord of the game
+:param numActions: amount of actions to play, all of them if None
+:return: generator of the game before the first action and after every action,
+         the same Game object each time, use toBytes or getState to keep a position
+"""
+
+
+def replayPositions(record: GameRecord, numActions: Optional[int] = None) -> Iterator[Game]:
+    game = Game(record.numPlayers, record.seed)
+    yield game
+    for action in record.actions[:numActions]:
+        game.step(action)
+        yield game
+
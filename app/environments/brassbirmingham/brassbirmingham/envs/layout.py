@@ -0,0 +1,108 @@
+"""
+Static board layout
+
+Fixed integer indices for every town, build slot, trade post, road location,
+building tile and card kind. Derived once from consts so array based code
+(board state, observations, action masks) agrees on a single numbering.
+"""
+from typing import Dict, List, Optional, Tuple
+
+from classes.buildings.enums import BuildingName, MerchantName
+from classes.cards.enums import CardName, CardType
+from consts import BUILDINGS, ROAD_LOCATIONS, STARTING_CARDS, TOWNS, TRADEPOSTS
+
+# towns, in consts.TOWNS order
+TOWN_NAMES: List[str] = [town.name for town in TOWNS]
+TOWN_INDEX: Dict[str, int] = {name: i for i, name in enumerate(TOWN_NAMES)}
+NUM_TOWNS = len(TOWN_NAMES)
+
+# build slots, town by town - (town index, build location index within the town)
+SLOTS: List[Tuple[int, int]] = [
+    (townIndex, i)
+    for townIndex, town in enumerate(TOWNS)
+    for i in range(len(town.slots))
+]
+SLOT_INDEX: Dict[Tuple[int, int], int] = {slot: i for i, slot in enumerate(SLOTS)}
+NUM_SLOTS = len(SLOTS)
+SLOT_TOWN: List[int] = [townIndex for townIndex, _ in SLOTS]
+SLOT_POSSIBLE_BUILDS: List[Tuple[BuildingName, ...]] = [
+    TOWNS[townIndex].slots[i] for townIndex, i in SLOTS
+]
+TOWN_SLOTS: List[List[int]] = [[] for _ in TOWNS]
+for _slot, (_townIndex, _) in enumerate(SLOTS):
+    TOWN_SLOTS[_townIndex].append(_slot)
+
+# trade posts, 4 player list is a superset of the others
+TRADEPOST_NAMES: List[str] = [tradePost.name for tradePost in TRADEPOSTS["4"]]
+TRADEPOST_INDEX: Dict[str, int] = {name: i for i, name in enumerate(TRADEPOST_NAMES)}
+NUM_TRADEPOSTS = len(TRADEPOST_NAMES)
+MERCHANT_TILES_PER_TRADEPOST = 2
+
+# network nodes - towns then trade posts
+NODE_NAMES: List[str] = TOWN_NAMES + TRADEPOST_NAMES
+NODE_INDEX: Dict[str, int] = {name: i for i, name in enumerate(NODE_NAMES)}
+NUM_NODES = len(NODE_NAMES)
+
+# road locations, in consts.ROAD_LOCATIONS order
+ROAD_NODES: List[Tuple[int, ...]] = [
+    tuple(NODE_INDEX[name] for name in roadLocation.networks)
+    for roadLocation in ROAD_LOCATIONS
+]
+NUM_ROADS = len(ROAD_NODES)
+# road locations touching each node, the road graph adjacency
+NODE_ROADS: List[List[int]] = [[] for _ in NODE_NAMES]
+for _road, _nodes in enumerate(ROAD_NODES):
+    for _node in _nodes:
+        NODE_ROADS[_node].append(_road)
+
+# building tiles, in consts.BUILDINGS order (same order as Player.buildings)
+NUM_BUILDINGS = len(BUILDINGS)
+BUILDING_NAMES: List[BuildingName] = list(BuildingName)
+BUILDING_NAME_INDEX: Dict[BuildingName, int] = {
+    name: i for i, name in enumerate(BUILDING_NAMES)
+}
+MERCHANT_NAMES: List[MerchantName] = list(MerchantName)
+MERCHANT_NAME_INDEX: Dict[MerchantName, int] = {
+    name: i for i, name in enumerate(MERCHANT_NAMES)
+}
+
+# card kinds - every distinct (type, name) a card can have, locations in town order
+_deckKinds = []
+for _cards in STARTING_CARDS.values():
+    for _card in _cards:
+        if (_card.type, _card.name) not in _deckKinds:
+            _deckKinds.append((_card.type, _card.name))
+CARD_KINDS: List[Tuple[CardType, object]] = sorted(
+    _deckKinds,
+    key=lambda kind: (kind[0] != CardType.location, TOWN_INDEX.get(kind[1], 0)),
+) + [
+    (CardType.location, CardName.wild_location),
+    (CardType.industry, CardName.wild_industry),
+]
+CARD_KIND_INDEX: Dict[Tuple[CardType, object], int] = {
+    kind: i for i, kind in enumerate(CARD_KINDS)
+}
+NUM_CARD_KINDS = len(CARD_KINDS)
+WILD_LOCATION_KIND = CARD_KIND_INDEX[(CardType.location, CardName.wild_location)]
+WILD_INDUSTRY_KIND = CARD_KIND_INDEX[(CardType.industry, CardName.wild_industry)]
+WILD_KINDS: List[int] = [WILD_LOCATION_KIND, WILD_INDUSTRY_KIND]
+# location card of every town, None for the farm breweries which have none
+TOWN_CARD_KIND: List[Optional[int]] = [
+    CARD_KIND_INDEX.get((CardType.location, name)) for name in TOWN_NAMES
+]
+# industry cards that build each industry, the exact one first
+_industryCards = {
+    BuildingName.goods: (CardName.man_goods_or_cotton,),
+    BuildingName.cotton: (BuildingName.cotton, CardName.man_goods_or_cotton),
+    BuildingName.pottery: (CardName.pottery,),
+    BuildingName.coal: (CardName.coal_mine,),
+    BuildingName.beer: (CardName.brewery,),
+    BuildingName.iron: (CardName.iron_works,),
+}
+INDUSTRY_CARD_KINDS: Dict[BuildingName, Tuple[int, ...]] = {
+    name: tuple(CARD_KIND_INDEX[(CardType.industry, card)] for card in cards)
+    for name, cards in _industryCards.items()
+}
+DECK_CAPACITY = 80  # largest deck plus room for wild cards in the discard pile
+
+del _deckKinds, _industryCards, _cards, _card, _slot, _townIndex, _road, _nodes, _node
@@ -0,0 +1,339 @@
+"""
+Monte Carlo tree search for Brass Birmingham
+
+Open loop UCT over action indices (actions.ACTIONS): a node stands for the actions
+played from the root, every iteration replays them on a scratch copy of the game,
+so card draws are sampled again each time instead of being branched on. Hidden
+cards (other hands and the deck) are shuffled among themselves before each
+iteration, the searching player only uses what it could see.
+
+Rollouts play random legal actions, or sample a policy, until the game ends or
+rolloutDepth actions were played; unfinished games are valued by Game.rewards on
+the points so far.
+"""
+from __future__ import annotations
+
+import math
+import multiprocessing
+import random
+import time
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from actions import NUM_ACTIONS
+from classes.deck import kindCounts
+from game import Game
+
+# policy(game) -> probability per action, used for rollouts and as priors (PUCT)
+Policy = Callable[[Game], np.ndarray]
+
+
+class Node:
+    """
+    Node - visit statistics of one sequence of actions from the root
+
+    :param prior: probability the policy gave the action leading here, 1 without a policy
+    """
+
+    def __init__(self, prior: float = 1.0):
+        self.prior = prior
+        self.children: Dict[int, Node] = {}
+        self.visits = 0
+        self.values: Optional[np.ndarray] = None  # summed rewards per player
+        self.player: Optional[int] = None  # player to move, set on first visit
+        self.priors: Optional[np.ndarray] = None
+
+
+class MCTS:
+    """
+    MCTS - search the best action of the player to move
+
+    Budgets hold per search and, with workers, per worker process. Searching a later
+    position of the same game starts from the matching subtree of the last search,
+    which needs the game's GameRecord (Game(record=True)) to know the actions played.
+
+    :param iterations: iterations per search, unlimited if None (seconds must be set)
+    :param seconds: time per search, unlimited if None
+    :param exploration: UCT/PUCT exploration constant
+    :param rolloutDepth: actions per rollout before valuing the position, until the end if None
+    :param policy: rollout policy and priors, uniform random if None
+    :param determinize: shuffle hidden cards before every iteration
+    :param reuseTree: keep the subtree of the position reached between searches
+    :param workers: processes searching the same position (root parallel), visits are summed
+    :param seed: seed of the search, drawn from the global random module if None
+    """
+
+    def __init__(
+        self,
+        iterations: Optional[int] = 200,
+        seconds: Optional[float] = None,
+        exploration: float = 1.4,
+        rolloutDepth: Optional[int] = None,
+        policy: Optional[Policy] = None,
+        determinize: bool = True,
+        reuseTree: bool = True,
+        workers: int = 1,
+        seed: Optional[int] = None,
+    ):
+        assert iterations is not None or seconds is not None
+        self.iterations = iterations
+        self.seconds = seconds
+        self.exploration = exploration
+        self.rolloutDepth = rolloutDepth
+        self.policy = policy
+        self.determinize = determinize
+        self.reuseTree = reuseTree
+        self.workers = workers
+        self.random = random.Random(random.getrandbits(64) if seed is None else seed)
+
+        self.root: Optional[Node] = None
+        self.rootSeed: Optional[int] = None
+        self.rootActions: List[int] = []
+        self.scratch: Optional[Game] = None
+        self.pool: List = []
+
+    """
+    search
+
+    :param game: game to search, the current player is the searching one
+    :return: share of root visits per action (zero for illegal actions)
+    """
+
+    def search(self, game: Game) -> np.ndarray:
+        if self.workers > 1:
+            visits = self.searchParallel(game)
+        else:
+            visits = self.searchVisits(game)
+        total = visits.sum()
+        if total == 0:
+            return game.legalActions() / max(game.legalActions().sum(), 1)
+        return (visits / total).astype(np.float32)
+
+    """
+    bestAction
+
+    :param game: game to search
+    :return: most visited action
+    """
+
+    def bestAction(self, game: Game) -> int:
+        return int(np.argmax(self.search(game)))
+
+    def searchVisits(self, game: Game) -> np.ndarray:
+        root = self.rootFor(game)
+        data = game.toBytes()
+        if self.scratch is None or self.scratch.numPlayers != game.numPlayers:
+            self.scratch = Game(game.numPlayers, self.random.getrandbits(64))
+
+        start = time.perf_counter()
+        iterations = 0
+        while (self.iterations is None or iterations < self.iterations) and (
+            self.seconds is None or time.perf_counter() - start < self.seconds
+        ):
+            self.iterate(root, data, game.currentPlayerNum)
+            iterations += 1
+
+        visits = np.zeros(NUM_ACTIONS, dtype=np.float64)
+        legal = game.legalActions()
+        for action, child in root.children.items():
+            if legal[action]:
+                visits[action] = child.visits
+        return visits
+
+    """
+    rootFor
+    reuse the subtree of the position if the game continues the last searched one
+
+    :param game: game to search
+    :return: root node
+    """
+
+    def rootFor(self, game: Game) -> Node:
+        record = game.record
+        node = None
+        if self.reuseTree and record is not None and self.root is not None:
+            played = len(self.rootActions)
+            if record.seed == self.rootSeed and record.actions[:played] == self.rootActions:
+                node = self.root
+                for action in record.actions[played:]:
+                    node = node.children.get(action)
+                    if node is None:
+                        break
+
+        self.root = node or Node()
+        self.rootSeed = record.seed if record is not None else None
+        self.rootActions = list(record.actions) if record is not None else []
+        return self.root
+
+    def iterate(self, root: Node, data: bytes, searcher: int):
+        game = self.scratch
+        game.loadBytes(data)
+        game.board.random.seed(self.random.getrandbits(64))
+        if self.determinize:
+            self.shuffleHiddenCards(game, searcher)
+        else:
+            game.board.deck.shuffle()  # nobody knows the deck order, only what is left
+
+        node = root
+        path = [root]
+        while not game.isOver:
+            legal = np.flatnonzero(game.legalActions()).tolist()
+            if node.player is None:
+                node.player = game.currentPlayerNum
+                if self.policy:
+                    node.priors = self.policy(game)
+
+            untried = [action for action in legal if action not in node.children]
+            if untried:
+                if node.priors is not None:
+                    action = max(untried, key=lambda a: node.priors[a])
+                else:
+                    action = self.random.choice(untried)
+                prior = node.priors[action] if node.priors is not None else 1.0
+                node.children[action] = Node(prior)
+                game.step(int(action))
+                path.append(node.children[action])
+                break
+
+            action = self.select(node, legal)
+            game.step(int(action))
+            node = node.children[action]
+            path.append(node)
+
+        rewards = np.asarray(self.rollout(game))
+        for visited in path:
+            visited.visits += 1
+            if visited.values is None:
+                visited.values = np.zeros(len(rewards))
+            visited.values += rewards
+
+    """
+    select
+
+    :param node: node with every legal action expanded
+    :param legal: legal actions in this iteration's position
+    :return: action with the best UCT (or PUCT with a policy) score for the player to move
+    """
+
+    def select(self, node: Node, legal: List[int]) -> int:
+        player = node.player
+        logVisits = math.log(max(node.visits, 1))
+        best, bestScore = None, -math.inf
+        for action in legal:
+            child = node.children[action]
+            value = child.values[player] / child.visits if child.visits else 0.0
+            if self.policy:
+                explore = child.prior * math.sqrt(node.visits) / (1 + child.visits)
+            else:
+                explore = math.sqrt(logVisits / max(child.visits, 1))
+            score = value + self.exploration * explore
+            if score > bestScore:
+                best, bestScore = action, score
+        return best
+
+    """
+    rollout
+
+    :param game: game to play on from
+    :return: rewards of every player, see Game.rewards
+    """
+
+    def rollout(self, game: Game) -> List[float]:
+        depth = 0
+        while not game.isOver and (self.rolloutDepth is None or depth < self.rolloutDepth):
+            mask = game.legalActions()
+            if self.policy:
+                probs = self.policy(game) * mask
+                if probs.sum() > 0:
+                    probs = probs / probs.sum()
+                    game.step(int(self.random.choices(range(NUM_ACTIONS), probs)[0]))
+                    depth += 1
+                    continue
+            game.step(int(self.random.choice(np.flatnonzero(mask))))
+            depth += 1
+        return game.rewards()
+
+    """
+    shuffleHiddenCards
+    deal the cards the searching player cannot see (deck and other hands) again
+
+    :param game: game to change
+    :param searcher: index of the searching player
+    """
+
+    def shuffleHiddenCards(self, game: Game, searcher: int):
+        hands = [
+            player.hand for i, player in enumerate(game.players) if i != searcher
+        ]
+        deck = game.board.deck
+        hidden = list(deck.cards)
+        for hand in hands:
+            hidden += hand.kinds()
+        self.random.shuffle(hidden)
+
+        dealt = deck.size
+        deck.setCards(hidden[:dealt])
+        for hand in hands:
+            hand.setCounts(kindCounts(hidden[dealt : dealt + hand.size]))
+            dealt += hand.size
+
+    """Root parallel search"""
+
+    def searchParallel(self, game: Game) -> np.ndarray:
+        if not self.pool:
+            settings = dict(
+                iterations=self.iterations,
+                seconds=self.seconds,
+                exploration=self.exploration,
+                rolloutDepth=self.rolloutDepth,
+                policy=self.policy,
+                determinize=self.determinize,
+                reuseTree=self.reuseTree,
+            )
+            for _ in range(self.workers):
+                connection, workerConnection = multiprocessing.Pipe()
+                process = multiprocessing.Process(
+                    target=searchWorker,
+                    args=(workerConnection, settings, self.random.getrandbits(64)),
+                    daemon=True,
+                )
+                process.start()
+                self.pool.append((process, connection))
+
+        for _, connection in self.pool:
+            connection.send((game.toBytes(), game.record))
+        return sum(connection.recv() for _, connection in self.pool)
+
+    """
+    close
+    stop the worker processes
+    """
+
+    def close(self):
+        for process, connection in self.pool:
+            connection.send(None)
+            process.join()
+        self.pool = []
+
+
+"""
+searchWorker
+process loop of root parallel search, keeps its own tree between searches
+
+:param connection: receives (Game.toBytes, GameRecord) per search, None to stop; sends root visits
+:param settings: MCTS arguments
+:param seed: seed of this worker's search
+"""
+
+
+def searchWorker(connection, settings: Dict, seed: int):
+    mcts = MCTS(workers=1, seed=seed, **settings)
+    while True:
+        message = connection.recv()
+        if message is None:
+            break
+        data, record = message
+        game = Game.fromBytes(data)
+        game.record = record
+        connection.send(mcts.searchVisits(game))
@@ -0,0 +1,198 @@
+"""
+Observation encoder for BrassBirminghamEnv
+
+Every feature lives at a fixed offset of one preallocated float32 buffer, laid out
+from the layout indices (slots from consts.TOWNS, trade posts from consts.TRADEPOSTS,
+roads from consts.ROAD_LOCATIONS). Slots and roads are only re-encoded when the board's
+change stamps say they changed since the last call; the small per-player, market and
+trade post sections are rewritten every time.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from classes.buildings.enums import BuildingType
+from classes.enums import Era
+from classes.market import COAL_MARKET, IRON_MARKET
+from consts import (MAX_MARKET_COAL, MAX_MARKET_IRON, STARTING_HAND_SIZE,
+                    STARTING_ROADS)
+from layout import (BUILDING_NAME_INDEX, BUILDING_NAMES, MERCHANT_NAME_INDEX,
+                    MERCHANT_NAMES, NUM_CARD_KINDS, NUM_ROADS, NUM_SLOTS,
+                    NUM_TRADEPOSTS, TRADEPOST_INDEX)
+
+if TYPE_CHECKING:
+    from classes.board import Board
+    from classes.build_location import BuildLocation
+    from classes.road_location import RoadLocation
+
+MAX_PLAYERS = 4
+MAX_TIER = 8
+MAX_RESOURCES = 6
+MAX_MONEY = 100
+MAX_INCOME = 99
+MAX_VICTORY_POINTS = 200
+MAX_DECK = 64
+MAX_CARDS_OF_KIND = 4
+
+# slot features
+SLOT_OCCUPIED = 0
+SLOT_OWNER = 1
+SLOT_INDUSTRY = SLOT_OWNER + MAX_PLAYERS
+SLOT_TIER = SLOT_INDUSTRY + len(BUILDING_NAMES)
+SLOT_RESOURCES = SLOT_TIER + 1
+SLOT_FLIPPED = SLOT_RESOURCES + 1
+SLOT_FEATURES = SLOT_FLIPPED + 1
+
+# road features
+ROAD_BUILT = 0
+ROAD_OWNER = 1
+ROAD_FEATURES = ROAD_OWNER + MAX_PLAYERS
+
+# trade post features
+TRADEPOST_PRESENT = 0
+TRADEPOST_BEER = 1
+TRADEPOST_MERCHANTS = 2
+TRADEPOST_FEATURES = TRADEPOST_MERCHANTS + len(MERCHANT_NAMES)
+
+# player features
+PLAYER_CURRENT = 0
+PLAYER_MONEY = 1
+PLAYER_INCOME = 2
+PLAYER_VICTORY_POINTS = 3
+PLAYER_ROADS = 4
+PLAYER_HAND = 5
+PLAYER_SCORE = 6  # points if the game were scored now, from the board's ScoreIndex
+PLAYER_FEATURES = 7
+
+# global features
+GLOBAL_COAL = 0
+GLOBAL_IRON = 1
+GLOBAL_ERA = 2
+GLOBAL_DECK = 3
+GLOBAL_COAL_PRICE = 4  # price of the next cube, from the market tables
+GLOBAL_IRON_PRICE = 5
+GLOBAL_FEATURES = 6
+
+# section offsets into the buffer
+SLOTS_OFFSET = 0
+ROADS_OFFSET = SLOTS_OFFSET + NUM_SLOTS * SLOT_FEATURES
+TRADEPOSTS_OFFSET = ROADS_OFFSET + NUM_ROADS * ROAD_FEATURES
+PLAYERS_OFFSET = TRADEPOSTS_OFFSET + NUM_TRADEPOSTS * TRADEPOST_FEATURES
+HAND_OFFSET = PLAYERS_OFFSET + MAX_PLAYERS * PLAYER_FEATURES
+GLOBAL_OFFSET = HAND_OFFSET + NUM_CARD_KINDS
+OBSERVATION_SIZE = GLOBAL_OFFSET + GLOBAL_FEATURES
+
+
+class ObservationEncoder:
+    """
+    ObservationEncoder - incremental, allocation free observation for one game
+
+    encode returns the same buffer on every call, copy it to keep an old observation
+    """
+
+    def __init__(self):
+        self.buffer = np.zeros(OBSERVATION_SIZE, dtype=np.float32)
+        self.slots = self.buffer[SLOTS_OFFSET:ROADS_OFFSET].reshape(NUM_SLOTS, SLOT_FEATURES)
+        self.roads = self.buffer[ROADS_OFFSET:TRADEPOSTS_OFFSET].reshape(
+            NUM_ROADS, ROAD_FEATURES
+        )
+        self.tradePosts = self.buffer[TRADEPOSTS_OFFSET:PLAYERS_OFFSET].reshape(
+            NUM_TRADEPOSTS, TRADEPOST_FEATURES
+        )
+        self.players = self.buffer[PLAYERS_OFFSET:HAND_OFFSET].reshape(
+            MAX_PLAYERS, PLAYER_FEATURES
+        )
+        self.hand = self.buffer[HAND_OFFSET:GLOBAL_OFFSET]
+        self.globals = self.buffer[GLOBAL_OFFSET:]
+
+        self.board = None
+        self.lastChange = -1
+
+    """
+    encode
+
+    :param board: board to observe
+    :param playerNum: index of the player the observation is for
+    :return: observation buffer
+    """
+
+    def encode(self, board: Board, playerNum: int) -> np.ndarray:
+        if board is not self.board:
+            # new game, refresh everything
+            self.board = board
+            self.lastChange = -1
+
+        players = {player: i for i, player in enumerate(board.players)}
+        for slot in np.flatnonzero(board.slotChanged > self.lastChange):
+            self.encodeSlot(board.buildLocations[slot], players)
+        for road in np.flatnonzero(board.roadChanged > self.lastChange):
+            self.encodeRoad(board.roadLocations[road], players)
+        self.lastChange = board.changeCounter
+
+        self.encodeTradePosts(board)
+        self.encodePlayers(board, playerNum)
+        self.encodeGlobals(board)
+        return self.buffer
+
+    def encodeSlot(self, buildLocation: BuildLocation, players):
+        features = self.slots[buildLocation.index]
+        features[:] = 0
+        building = buildLocation.building
+        if not building or building.isRetired:
+            return
+        features[SLOT_OCCUPIED] = 1
+        features[SLOT_OWNER + players[building.owner]] = 1
+        features[SLOT_INDUSTRY + BUILDING_NAME_INDEX[building.name]] = 1
+        features[SLOT_TIER] = building.tier / MAX_TIER
+        if building.type == BuildingType.industry:
+            features[SLOT_RESOURCES] = building.resourceAmount / MAX_RESOURCES
+        features[SLOT_FLIPPED] = building.isFlipped
+
+    def encodeRoad(self, roadLocation: RoadLocation, players):
+        features = self.roads[roadLocation.index]
+        features[:] = 0
+        if roadLocation.isBuilt:
+            features[ROAD_BUILT] = 1
+            features[ROAD_OWNER + players[roadLocation.road.owner]] = 1
+
+    def encodeTradePosts(self, board: Board):
+        self.tradePosts[:] = 0
+        for tradePost in board.tradePosts:
+            features = self.tradePosts[TRADEPOST_INDEX[tradePost.name]]
+            features[TRADEPOST_PRESENT] = 1
+            features[TRADEPOST_BEER] = tradePost.beerAmount / 2
+            for merchantTile in tradePost.merchantTiles:
+                features[TRADEPOST_MERCHANTS + MERCHANT_NAME_INDEX[merchantTile]] += 0.5
+
+    def encodePlayers(self, board: Board, playerNum: int):
+        self.players[:] = 0
+        for i, player in enumerate(board.players):
+            features = self.players[i]
+            features[PLAYER_CURRENT] = i == playerNum
+            features[PLAYER_MONEY] = min(player.money / MAX_MONEY, 1)
+            features[PLAYER_INCOME] = player.income / MAX_INCOME
+            features[PLAYER_VICTORY_POINTS] = min(player.victoryPoints / MAX_VICTORY_POINTS, 1)
+            features[PLAYER_ROADS] = player.roadCount / STARTING_ROADS
+            features[PLAYER_HAND] = player.hand.size / STARTING_HAND_SIZE
+            features[PLAYER_SCORE] = min(
+                (player.victoryPoints + board.scoreIndex.points(player)) / MAX_VICTORY_POINTS, 1
+            )
+
+        # only the observing player's hand is visible
+        hand = board.players[playerNum].hand
+        np.divide(hand.countsView, MAX_CARDS_OF_KIND, out=self.hand)
+        np.minimum(self.hand, 1, out=self.hand)
+
+    def encodeGlobals(self, board: Board):
+        self.globals[GLOBAL_COAL] = board.coalMarketRemaining / MAX_MARKET_COAL
+        self.globals[GLOBAL_IRON] = board.ironMarketRemaining / MAX_MARKET_IRON
+        self.globals[GLOBAL_ERA] = board.era == Era.railroad
+        self.globals[GLOBAL_DECK] = board.deck.size / MAX_DECK
+        self.globals[GLOBAL_COAL_PRICE] = (
+            COAL_MARKET.nextPrice[board.coalMarketRemaining] / COAL_MARKET.maxPrice
+        )
+        self.globals[GLOBAL_IRON_PRICE] = (
+            IRON_MARKET.nextPrice[board.ironMarketRemaining] / IRON_MARKET.maxPrice
+        )
@@ -0,0 +1,200 @@
+"""
+Opt-in profiling of the engine
+
+    with Profiler() as profiler:
+        ...  # self-play, benchmarks
+    print(profiler.report())
+
+or set BRASS_PROFILE=1 to get the report on stderr at exit of anything that
+calls profileFromEnvironment (the gym env, the vectorized env and benchmark.py).
+Methods are only wrapped while a Profiler is enabled, the classes are left
+untouched otherwise so there is no cost when profiling is off. Memory stays
+fixed however long the run: every method keeps its calls, total time and a
+histogram of call times (Timings), the percentiles are read from that.
+"""
+from __future__ import annotations
+
+import atexit
+import functools
+import inspect
+import math
+import os
+import sys
+import time
+from typing import Dict, List, Optional
+
+# call time histogram - OCTAVE_BUCKETS buckets per power of two between 2^MIN_EXPONENT
+# and 2^MAX_EXPONENT seconds (about 1 ns to 4 minutes), percentiles are within ~5%
+OCTAVE_BUCKETS = 8
+MIN_EXPONENT = -30
+MAX_EXPONENT = 8
+NUM_BUCKETS = (MAX_EXPONENT - MIN_EXPONENT) * OCTAVE_BUCKETS
+
+
+"""
+publicMethods
+
+:param cls: class
+:return: names of the public methods the class itself defines
+"""
+
+
+def publicMethods(cls) -> List[str]:
+    return [
+        name
+        for name, value in vars(cls).items()
+        if inspect.isfunction(value) and not name.startswith("_")
+    ]
+
+
+def defaultMethods() -> Dict[type, List[str]]:
+    from classes.board import Board
+    from classes.player import Player
+    from game import Game
+
+    return {
+        Board: publicMethods(Board),
+        Player: publicMethods(Player),
+        Game: ["step", "legalActions", "endTurn", "endEra"],
+    }
+
+
+class Timings:
+    """
+    Timings - calls, total seconds and call time histogram of one method
+    """
+
+    __slots__ = ("calls", "seconds", "buckets")
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.buckets = [0] * NUM_BUCKETS
+
+    def add(self, seconds: float):
+        self.calls += 1
+        self.seconds += seconds
+        mantissa, exponent = math.frexp(seconds)  # seconds = mantissa * 2^exponent, 0.5 <= mantissa < 1
+        bucket = (exponent - MIN_EXPONENT) * OCTAVE_BUCKETS + int(
+            (mantissa - 0.5) * 2 * OCTAVE_BUCKETS
+        )
+        self.buckets[min(max(bucket, 0), NUM_BUCKETS - 1)] += 1
+
+    """
+    percentile
+
+    :param q: percentile, 0 to 100
+    :return: seconds per call at that percentile, the middle of its histogram bucket
+    """
+
+    def percentile(self, q: float) -> float:
+        rank = q / 100 * (self.calls - 1)
+        seen = 0
+        for bucket, count in enumerate(self.buckets):
+            seen += count
+            if seen > rank:
+                break
+        exponent, step = divmod(bucket, OCTAVE_BUCKETS)
+        return math.ldexp(0.5 + (step + 0.5) / (2 * OCTAVE_BUCKETS), exponent + MIN_EXPONENT)
+
+
+class Profiler:
+    """
+    Profiler - call counts and timings per method, while enabled
+
+    Times are inclusive, a method calling another profiled method counts both.
+
+    :param methods: class -> method names to profile, every Board and Player method
+                    and the Game turn methods if None
+    """
+
+    def __init__(self, methods: Optional[Dict[type, List[str]]] = None):
+        self.methods = methods if methods is not None else defaultMethods()
+        self.timings: Dict[str, Timings] = {}
+        self.originals: Dict[type, Dict[str, object]] = {}
+
+    def enable(self):
+        if self.originals:
+            return
+        for cls, names in self.methods.items():
+            originals = self.originals[cls] = {}
+            for name in names:
+                originals[name] = vars(cls)[name]
+                setattr(cls, name, self.wrap(cls, name, originals[name]))
+
+    def disable(self):
+        for cls, originals in self.originals.items():
+            for name, original in originals.items():
+                setattr(cls, name, original)
+        self.originals = {}
+
+    def wrap(self, cls: type, name: str, method):
+        add = self.timings.setdefault(f"{cls.__name__}.{name}", Timings()).add
+        clock = time.perf_counter
+
+        @functools.wraps(method)
+        def profiled(*args, **kwargs):
+            start = clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                add(clock() - start)
+
+        return profiled
+
+    def __enter__(self) -> Profiler:
+        self.enable()
+        return self
+
+    def __exit__(self, *exc):
+        self.disable()
+
+    """
+    stats
+
+    :return: method -> {calls, seconds, p50, p99} of the methods called so far, seconds per call
+             for the percentiles, slowest in total first
+    """
+
+    def stats(self) -> Dict[str, Dict]:
+        stats = {}
+        for name, timings in self.timings.items():
+            if not timings.calls:
+                continue
+            stats[name] = {
+                "calls": timings.calls,
+                "seconds": timings.seconds,
+                "p50": timings.percentile(50),
+                "p99": timings.percentile(99),
+            }
+        return dict(sorted(stats.items(), key=lambda item: -item[1]["seconds"]))
+
+    def report(self) -> str:
+        lines = [f"{'method':44} {'calls':>9} {'total s':>9} {'p50 us':>9} {'p99 us':>9}"]
+        for name, stat in self.stats().items():
+            lines.append(
+                f"{name:44} {stat['calls']:9d} {stat['seconds']:9.3f}"
+                f" {stat['p50'] * 1e6:9.2f} {stat['p99'] * 1e6:9.2f}"
+            )
+        return "\n".join(lines)
+
+
+ENVIRONMENT_PROFILER: Optional[Profiler] = None  # see profileFromEnvironment
+
+
+"""
+profileFromEnvironment
+enable a Profiler for the rest of the run if BRASS_PROFILE is set, the report goes to stderr
+at exit. Called by entry points (envs, benchmark.py), importing the engine profiles nothing
+
+:return: the running Profiler, the same one on every call, None if profiling is off
+"""
+
+
+def profileFromEnvironment() -> Optional[Profiler]:
+    global ENVIRONMENT_PROFILER
+    if ENVIRONMENT_PROFILER is None and os.environ.get("BRASS_PROFILE"):
+        profiler = ENVIRONMENT_PROFILER = Profiler()
+        profiler.enable()
+        atexit.register(lambda: print(profiler.report(), file=sys.stderr))
+    return ENVIRONMENT_PROFILER
@@ -1,5 +1,7 @@
-import uuid
+import itertools
 
+_ids = itertools.count(1)
 
-def id() -> str:
-    return str(uuid.uuid4())
+
+def id() -> int:
+    return next(_ids)
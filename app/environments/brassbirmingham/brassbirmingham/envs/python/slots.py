@@ -0,0 +1,56 @@
+from functools import lru_cache
+from typing import Callable, Tuple
+
+MISSING = object()  # getattr default for slots that were never assigned
+
+
+"""
+slotNames
+
+:param cls: class
+:return: names declared in __slots__ by the class and its bases, bases first
+"""
+
+
+@lru_cache(maxsize=None)
+def slotNames(cls: type) -> Tuple[str, ...]:
+    names = []
+    for klass in reversed(cls.__mro__):
+        for name in vars(klass).get("__slots__", ()):
+            if name not in names and name not in ("__dict__", "__weakref__"):
+                names.append(name)
+    return tuple(names)
+
+
+"""
+attributeNames
+
+:param obj: object, with __slots__, a __dict__ or both
+:return: names of its instance attributes
+"""
+
+
+def attributeNames(obj) -> Tuple[str, ...]:
+    names = slotNames(type(obj))
+    if hasattr(obj, "__dict__"):
+        return names + tuple(obj.__dict__)
+    return names
+
+
+"""
+slotCopier
+compiled like the methods dataclasses generate, one plain attribute copy per slot,
+several times faster than a setattr loop
+
+:param cls: class with __slots__, every slot set on the instances copied
+:return: function taking an instance and returning a shallow copy of it
+"""
+
+
+@lru_cache(maxsize=None)
+def slotCopier(cls: type) -> Callable:
+    body = "".join(f"    obj.{name} = instance.{name}\n" for name in slotNames(cls))
+    source = f"def copy(instance):\n    obj = new(cls)\n{body}    return obj\n"
+    namespace = {"new": cls.__new__, "cls": cls}
+    exec(source, namespace)
+    return namespace["copy"]
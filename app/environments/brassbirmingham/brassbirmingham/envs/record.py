@@ -0,0 +1,74 @@
+"""
+Game records
+
+A game is fully determined by its amount of players, its seed and the actions
+played, see game.Game(record=True) to keep one and game.replay to rebuild it.
+"""
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+from typing import List
+
+from actions import NUM_ACTIONS
+
+RECORD_MAGIC = b"BRSR"
+RECORD_VERSION = 2  # 2: decks are shuffled once and dealt in order, seeds deal other games
+RECORD_HEADER = struct.Struct("<4sBBQ")
+
+
+class GameRecord:
+    """
+    GameRecord - seed, amount of players and action indices of one game
+
+    Actions index actions.ACTIONS, so a record is only valid for the action table
+    (NUM_ACTIONS) it was written with.
+
+    :param numPlayers: amount of players
+    :param seed: seed the game was created with
+    :param actions: actions played so far
+    """
+
+    def __init__(self, numPlayers: int, seed: int, actions: List[int] = None):
+        self.numPlayers = numPlayers
+        self.seed = seed
+        self.actions: List[int] = list(actions) if actions else []
+
+    """
+    toBytes
+
+    :return: header, action table size and one uint16 per action
+    """
+
+    def toBytes(self) -> bytes:
+        header = RECORD_HEADER.pack(RECORD_MAGIC, RECORD_VERSION, self.numPlayers, self.seed)
+        actions = array("H", [NUM_ACTIONS, *self.actions])
+        if sys.byteorder == "big":
+            actions.byteswap()
+        return header + actions.tobytes()
+
+    """
+    fromBytes
+
+    :param data: output of toBytes
+    :return: decoded GameRecord
+    """
+
+    @staticmethod
+    def fromBytes(data: bytes) -> GameRecord:
+        magic, version, numPlayers, seed = RECORD_HEADER.unpack_from(data)
+        if magic != RECORD_MAGIC:
+            raise ValueError("not a Brass Birmingham game record")
+        if version != RECORD_VERSION:
+            raise ValueError(f"game record format {version}, expected {RECORD_VERSION}")
+        actions = array("H")
+        actions.frombytes(data[RECORD_HEADER.size :])
+        if sys.byteorder == "big":
+            actions.byteswap()
+        if actions[0] != NUM_ACTIONS:
+            raise ValueError(f"game record of {actions[0]} actions, expected {NUM_ACTIONS}")
+        return GameRecord(numPlayers, seed, actions[1:])
+
+    def __len__(self) -> int:
+        return len(self.actions)
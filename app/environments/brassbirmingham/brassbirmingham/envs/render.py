@@ -6,8 +6,10 @@ from classes.town import Town
 from classes.player import Player
 from classes.build_location import BuildLocation
 from classes.buildings.enums import BuildingName
+from classes.buildings.enums import BuildingType
 import asyncio
-pygame.init()
+import numpy as np
+# only fonts at import, headless drawing needs nothing else - the window path starts the display
 pygame.font.init()
 font = pygame.font.Font(None, 24)
 
@@ -134,25 +136,71 @@ DECK_POSITION = (170, 190)
 CARD_WIDTH = 130
 CARD_HEIGHT = 180
 
+FPS = 30  # window redraws per second
 
-class Render:
-	def __init__(self, board=None, callback=None, x=0, y=0):
+# static board backgrounds by (x, y) offset, loaded and scaled once per process
+BACKGROUNDS = {}
+
+
+def loadBackground(x=0, y=0):
+	if (x, y) not in BACKGROUNDS:
 		local_dir = os.path.dirname(__file__)
+		img = pygame.image.load(f'{local_dir}/render/board.jpg')
+		if img.get_size() != (WIDTH, HEIGHT):
+			img = pygame.transform.scale(img, (WIDTH, HEIGHT))
+		background = pygame.Surface((WIDTH, HEIGHT))
+		background.fill(WHITE)
+		background.blit(img, (x, y))
+		BACKGROUNDS[(x, y)] = background
+	return BACKGROUNDS[(x, y)]
+
+
+# card images by file name, scaled and turned once per process
+CARDS = {}
+
+
+def loadCard(name):
+	if name not in CARDS:
+		local_dir = os.path.dirname(__file__)
+		card = pygame.image.load(f"{local_dir}/render/{name}.png")
+		card = pygame.transform.scale(card, (CARD_WIDTH, CARD_HEIGHT))
+		CARDS[name] = pygame.transform.rotate(card, 90)
+	return CARDS[name]
+
+
+class Render:
+	"""
+	Render - pygame view of a board
+
+	In a window by default, redrawn FPS times a second until closed. headless=True draws
+	offscreen instead, without a display or loop: every rgbArray call copies the cached
+	background only where something changed, redraws what overlaps there and returns the frame
+
+	:param board: board to draw
+	:param callback: coroutine function run next to the window loop, called with the board
+	:param headless: draw offscreen, see rgbArray
+	"""
+	def __init__(self, board=None, callback=None, x=0, y=0, headless=False):
 		self.board = board
 		self.callback = callback
-		self.img = pygame.image.load(f'{local_dir}/render/board.jpg')
-		self.goldCard = pygame.image.load(f"{local_dir}/render/gold-card.png")
-		self.greyCard = pygame.image.load(f"{local_dir}/render/grey-card.png")
-		self.greyCard = pygame.transform.scale(self.greyCard, (CARD_WIDTH, CARD_HEIGHT))
-		self.goldCard = pygame.transform.scale(self.goldCard, (CARD_WIDTH, CARD_HEIGHT))
-		self.greyCard = pygame.transform.rotate(self.greyCard, 90)
-		self.goldCard = pygame.transform.rotate(self.goldCard, 90)
-		self.win = pygame.display.set_mode((WIDTH, HEIGHT))
+		self.headless = headless
+		self.greyCard = loadCard("grey-card")
 		self.x = x
 		self.y = y
 		self.frame = Rect(MARGIN/2, MARGIN/2, WIDTH-MARGIN, HEIGHT-MARGIN)
 		self.running = True
 
+		if headless:
+			self.background = loadBackground(x, y)
+			self.win = self.background.copy()
+			self.items = None  # drawn items, see rgbArray
+			return
+
+		local_dir = os.path.dirname(__file__)
+		self.img = pygame.image.load(f'{local_dir}/render/board.jpg')
+		self.goldCard = loadCard("gold-card")
+		pygame.display.init()
+		self.win = pygame.display.set_mode((WIDTH, HEIGHT))
 		self.draw()
 
 	def createGame(self, numPlayers, p1Name="Noah", p2Name="Tyler", p3Name="Sam", p4Name="Mr. McDonald"):
@@ -177,43 +225,38 @@ class Render:
 
 	def drawTradingPostBeer(self):
 		for trade in self.board.tradePosts:
-			coords = BEER_COORDS[trade.name]
-			if trade.beerAmount > 0:
-				pygame.draw.circle(self.win, TAN, coords[0], BEER_SIZE)
-			if trade.beerAmount > 1:
-				pygame.draw.circle(self.win, TAN, coords[1], BEER_SIZE)
+			self.drawTradePostBeer(trade)
+
+	def drawTradePostBeer(self, trade):
+		coords = BEER_COORDS[trade.name]
+		if trade.beerAmount > 0:
+			pygame.draw.circle(self.win, TAN, coords[0], BEER_SIZE)
+		if trade.beerAmount > 1:
+			pygame.draw.circle(self.win, TAN, coords[1], BEER_SIZE)
 
 	def drawMerchantTiles(self):
 		for trade in self.board.tradePosts:
-			coords = TRADE_POST_COORDS[trade.name]
-			if len(trade.merchantTiles) > 0:
-				x, y = coords[0]
-				
-				rect = Rect(x, y, 30, 30)
-				pygame.draw.rect(self.win, BLUE, rect)
-				img = font.render(f"{trade.merchantTiles[0].value}", True, WHITE)
-				self.win.blit(img, (x-23, y))
-
-			if len(trade.merchantTiles) > 1:
-				x, y = coords[1]
-				
-				rect = Rect(x, y, 30, 30)
-				pygame.draw.rect(self.win, BLUE, rect)
-				img = font.render(f"{trade.merchantTiles[1].value}", True, WHITE)
-				self.win.blit(img, (x-23, y))
+			self.drawTradePostMerchants(trade)
+
+	def drawTradePostMerchants(self, trade):
+		coords = TRADE_POST_COORDS[trade.name]
+		for i, merchantTile in enumerate(trade.merchantTiles[:len(coords)]):
+			x, y = coords[i]
+
+			rect = Rect(x, y, 30, 30)
+			pygame.draw.rect(self.win, BLUE, rect)
+			img = font.render(f"{merchantTile.value}", True, WHITE)
+			self.win.blit(img, (x-23, y))
 
 	def drawRoads(self):
 		for i, road in enumerate(self.board.roadLocations):
-			if road.isBuilt:
-				coords = ROAD_LOCATION_COORDS[i]
-				x, y = coords
+			self.drawRoad(i)
 
-				pygame.draw.circle(self.win, PLAYER_COLOR_MAP[road.road.owner.color], coords, 10)
-				# if i % 2 == 0:
-				# 	img = font.render(f"{road.towns[0].name}, {road.towns[1].name}", True, WHITE)
-				# else:
-				# 	img = font.render(f"{road.towns[0].name}, {road.towns[1].name}", True, RED)
-				# self.win.blit(img, (x, y))
+	def drawRoad(self, i):
+		road = self.board.roadLocations[i]
+		if road.isBuilt:
+			coords = ROAD_LOCATION_COORDS[i]
+			pygame.draw.circle(self.win, PLAYER_COLOR_MAP[road.road.owner.color], coords, 10)
 
 	def drawBuildings(self):
 		for town in self.board.towns:
@@ -267,69 +310,135 @@ class Render:
 
 	def drawDeck(self):
 		x, y = DECK_POSITION
-		for i in range(len(self.board.deck.cards)):
+		for i in range(self.board.deck.size):
 			self.win.blit(self.greyCard, (x-(i*.5)-90, y-(i*.5)-70))
 			# pygame.draw.circle(self.win, WHITE, (x, y), 5)
 	
 	def drawResourcesOnBuildings(self):
-		for building in self.board.getCoalBuildings():
-			coords = BUILDING_COORDS[building.town.name]
-			for i, location in enumerate(building.town.buildLocations):
-				if building.buildLocation.id == location.id:
-					x, y = coords[i]
-				
-			startX = x
-
-			assert building.resourcesType.name == "coal"
-			for i in range(building.resourceAmount):
-				if i > 0 and i % 3 == 0:
-					y += 30
-				x = startX + (i % 3) * 18
-
-				# y += i//2*18
-				rect = Rect(x-23, y-23, 15, 15)
-				pygame.draw.rect(self.win, BLACK, rect)
-
-		for building in self.board.getIronBuildings():
-			coords = BUILDING_COORDS[building.town.name]
-			for i, location in enumerate(building.town.buildLocations):
-				if building.buildLocation.id == location.id:
-					x, y = coords[i]
-				
-			startX = x
-
-			print(building)
-			print(building.resourcesType.name)
-			assert building.resourcesType.name == "iron"
-			for i in range(building.resourceAmount):
-				if i > 0 and i % 3 == 0:
-					y += 30
-				x = startX + (i % 3) * 18
-
-				# y += i//2*18
-				rect = Rect(x-23, y-23, 15, 15)
-				pygame.draw.rect(self.win, ORANGE, rect)
-
-		for building in self.board.getBeerBuildings():
-			coords = BUILDING_COORDS[building.town.name]
-			for i, location in enumerate(building.town.buildLocations):
-				if building.buildLocation.id == location.id:
-					x, y = coords[i]
-				
-			startX = x
-
-			assert building.resourcesType.name == "beer"
-			for i in range(building.resourceAmount):
-				if i > 0 and i % 3 == 0:
-					y += 30
-				x = startX + (i % 3) * 18
-
-				# y += i//2*18
+		for name in [BuildingName.coal, BuildingName.iron, BuildingName.beer]:
+			for building in self.board.resourceBuildings[name].values():
+				self.drawResources(building.buildLocation)
+
+	def drawResources(self, buildLocation: BuildLocation):
+		building = buildLocation.building
+		if buildLocation.index not in self.board.resourceBuildings.get(building.name, {}):
+			return
+		x, y = slotCoords(buildLocation)
+		startX = x
+
+		for i in range(building.resourceAmount):
+			if i > 0 and i % 3 == 0:
+				y += 30
+			x = startX + (i % 3) * 18
+
+			if building.name == BuildingName.beer:
 				pygame.draw.circle(self.win, TAN, (x+10, y+10), BEER_SIZE)
+			else:
+				rect = Rect(x-23, y-23, 15, 15)
+				pygame.draw.rect(self.win, BLACK if building.name == BuildingName.coal else ORANGE, rect)
+
+	"""Headless rendering"""
+
+	"""
+	rgbArray
+	bring the offscreen frame up to date, only redrawing around what changed since the last call
+
+	:return: frame as a (HEIGHT, WIDTH, 3) uint8 array
+	"""
+	def rgbArray(self) -> np.ndarray:
+		assert self.headless
+		items = self.drawItems()
+		if self.items is None or [key for key, _, _ in self.items] != [key for key, _, _ in items]:
+			dirty = [Rect(0, 0, WIDTH, HEIGHT)]  # first frame or another board
+		else:
+			dirty = [
+				rect
+				for (_, state, rect), (_, oldState, _) in zip(items, self.items)
+				if state != oldState
+			]
+		self.items = items
+
+		for area in dirty:
+			self.win.set_clip(area)
+			self.win.blit(self.background, area, area)
+			for key, _, rect in items:
+				if rect.colliderect(area):
+					self.win.set_clip(area.clip(rect))
+					self.drawItem(key)
+		self.win.set_clip(None)
+		return pygame.surfarray.array3d(self.win).swapaxes(0, 1)
+
+	"""
+	drawItems
+	everything drawn on top of the background, in drawing order
+
+	:return: (key, state, rect) per item - drawItem(key) draws it, it is redrawn when its
+	         state changes and never draws outside of rect
+	"""
+	def drawItems(self):
+		board = self.board
+		items = [
+			(("coal",), board.coalMarketRemaining, Rect(995, 325, 50, 295)),
+			(("iron",), board.ironMarketRemaining, Rect(1060, 395, 80, 225)),
+		]
+		for trade in board.tradePosts:
+			x, y = TRADE_POST_COORDS[trade.name][0]
+			x2, y2 = TRADE_POST_COORDS[trade.name][-1]
+			rect = Rect(x-25, y-2, x2-x+60, y2-y+34)
+			items.append((("merchants", trade.name), tuple(trade.merchantTiles), rect))
+		for i, road in enumerate(board.roadLocations):
+			x, y = ROAD_LOCATION_COORDS[i]
+			owner = road.road.owner.color if road.isBuilt else None
+			items.append((("road", i), owner, Rect(x-11, y-11, 22, 22)))
+		items.append((("deck",), board.deck.size, Rect(40, 80, 230, 180)))
+		for buildLocation in board.buildLocations:
+			building = buildLocation.building
+			state = building and (building.id, building.isFlipped)
+			x, y = slotCoords(buildLocation)
+			items.append((("building", buildLocation.index), state, Rect(x-23, y-22, 60, 50)))
+		for trade in board.tradePosts:
+			x, y = BEER_COORDS[trade.name][0]
+			x2, y2 = BEER_COORDS[trade.name][-1]
+			rect = Rect(min(x, x2)-13, min(y, y2)-13, abs(x2-x)+26, abs(y2-y)+26)
+			items.append((("beer", trade.name), trade.beerAmount, rect))
+		money = tuple((player.name, player.money) for player in board.players)
+		items.append((("money",), money, Rect(0, 0, 260, 110)))
+		for buildLocation in board.buildLocations:
+			building = buildLocation.building
+			state = None
+			if building and building.type == BuildingType.industry and not building.isRetired:
+				state = (building.id, building.resourceAmount)
+			x, y = slotCoords(buildLocation)
+			items.append((("resources", buildLocation.index), state, Rect(x-23, y-23, 94, 106)))
+		return items
+
+	def drawItem(self, key):
+		board = self.board
+		kind = key[0]
+		if kind == "coal":
+			self.drawCoal()
+		elif kind == "iron":
+			self.drawIron()
+		elif kind == "merchants":
+			self.drawTradePostMerchants(board.tradePostDict[key[1]])
+		elif kind == "road":
+			self.drawRoad(key[1])
+		elif kind == "deck":
+			self.drawDeck()
+		elif kind == "building":
+			if board.buildLocations[key[1]].building:
+				self.drawBuilding(board.buildLocations[key[1]])
+		elif kind == "beer":
+			self.drawTradePostBeer(board.tradePostDict[key[1]])
+		elif kind == "money":
+			self.drawMoney()
+		elif kind == "resources":
+			if board.buildLocations[key[1]].building:
+				self.drawResources(board.buildLocations[key[1]])
 
 	async def drawWindow(self):
 		while self.running:
-			await asyncio.sleep(0.00001)
+			await asyncio.sleep(1 / FPS)
 			self.win.fill((255, 255, 255))
 			self.win.blit(self.win, (self.x, self.y))
 			self.win.blit(self.img, (self.x, self.y))
@@ -348,7 +457,7 @@ class Render:
 
 	async def handleEvents(self):
 		while self.running:
-			await asyncio.sleep(0.00001)
+			await asyncio.sleep(1 / FPS)
 			# event = pygame.event.wait()
 			for event in pygame.event.get():
 				if event.type == pygame.MOUSEBUTTONUP:
@@ -388,5 +497,24 @@ class Render:
 		loop.create_task(self.drawWindow())
 		loop.create_task(self.handleEvents())
 
+def slotCoords(buildLocation: BuildLocation):
+	town = buildLocation.town
+	return BUILDING_COORDS[town.name][town.buildLocations.index(buildLocation)]
+
+
 def render(board, callback=None):
-	Render(board, callback)
\ No newline at end of file
+	Render(board, callback)
+
+
+"""
+renderFrames
+draw positions headless, e.g. a replay (game.replayPositions) turned into video frames
+
+:param boards: boards to draw, usually the same board at successive positions
+:return: generator of (HEIGHT, WIDTH, 3) uint8 frames
+"""
+def renderFrames(boards):
+	renderer = Render(headless=True)
+	for board in boards:
+		renderer.board = board
+		yield renderer.rgbArray()
\ No newline at end of file
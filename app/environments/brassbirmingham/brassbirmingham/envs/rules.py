@@ -0,0 +1,199 @@
+"""
+Heuristic rules agent for Brass Birmingham
+
+Scores every legal action in one pass, without lookahead. Tiles are valued from
+tables built once out of consts.BUILDINGS (victory points, income, link value and
+price), coal and iron at the current market prices, roads by the link value of the
+nodes they touch and whether they grow the player's network. rulesPolicy turns the
+scores into action probabilities, for BrassBirminghamEnv.rules_move or as the
+policy of an MCTS.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Optional
+
+import numpy as np
+
+from actions import (BUILD_ACTIONS, BUILD_OFFSET, DEVELOP_ACTIONS,
+                     DEVELOP_OFFSET, LOAN, NETWORK_OFFSET, NUM_ACTIONS, PASS,
+                     SCOUT, SELL_ACTIONS, SELL_OFFSET, TWO_RAILROADS_ACTIONS,
+                     TWO_RAILROADS_OFFSET)
+from classes.enums import Era
+from consts import (BUILDINGS, CANAL_PRICE, ONE_RAILROAD_COAL_PRICE,
+                    ONE_RAILROAD_PRICE, TWO_RAILROAD_COAL_PRICE,
+                    TWO_RAILROAD_PRICE)
+from layout import (BUILDING_NAME_INDEX, BUILDING_NAMES, NUM_NODES, NUM_ROADS,
+                    ROAD_NODES, SLOT_TOWN)
+
+if TYPE_CHECKING:
+    from classes.player import Player
+    from game import Game
+
+# worth of one unit, in victory points
+VP_WEIGHT = 1.0
+INCOME_WEIGHT = 0.25
+LINK_WEIGHT = 0.5
+MONEY_WEIGHT = 0.2
+REACH_BONUS = 1.5  # road from the player's network to a node it does not touch yet
+DEVELOP_WEIGHT = 0.2
+LOAN_MONEY = 10  # take loans below this much money
+LOAN_SCORE = 1.0
+SCOUT_SCORE = -1.0
+PASS_SCORE = -2.0
+TEMPERATURE = 0.5  # softmax temperature of rulesPolicy, lower plays greedier
+
+# per tile of consts.BUILDINGS (same order as Player.buildings)
+TILE_VALUE = np.array(
+    [
+        VP_WEIGHT * building.victoryPointsGained
+        + INCOME_WEIGHT * building.incomeGained
+        + LINK_WEIGHT * building.networkPoints
+        - MONEY_WEIGHT * building.cost
+        for building in BUILDINGS
+    ]
+)
+TILE_LINK = np.array([building.networkPoints for building in BUILDINGS])
+
+BUILD_NAME = np.array([BUILDING_NAME_INDEX[name] for _, name in BUILD_ACTIONS])
+BUILD_TOWN = np.array([SLOT_TOWN[slot] for slot, _ in BUILD_ACTIONS])
+# nodes of every road padded with NUM_NODES, an extra entry that is worth nothing
+ROAD_NODE_MATRIX = np.full((NUM_ROADS, max(map(len, ROAD_NODES))), NUM_NODES)
+for _road, _nodes in enumerate(ROAD_NODES):
+    ROAD_NODE_MATRIX[_road, : len(_nodes)] = _nodes
+TWO_RAILROADS_FIRST = np.array([first for first, _ in TWO_RAILROADS_ACTIONS])
+TWO_RAILROADS_SECOND = np.array([second for _, second in TWO_RAILROADS_ACTIONS])
+
+
+"""
+nextTiles
+
+:param player: player
+:return: indexes into consts.BUILDINGS of the player's tiles not yet built/developed,
+         per industry in tier order (see actions.availableBuildings)
+"""
+
+
+def nextTiles(player: Player) -> List[List[int]]:
+    tiles = [[] for _ in BUILDING_NAMES]
+    for i, building in enumerate(player.buildings):
+        if building.buildLocation is None and not building.isRetired:
+            tiles[BUILDING_NAME_INDEX[building.name]].append(i)
+    return tiles
+
+
+"""
+scoreActions
+
+:param game: game, scored for the current player
+:param mask: legal actions of the current player, computed if None
+:return: score per action, -inf for illegal actions
+"""
+
+
+def scoreActions(game: Game, mask: Optional[np.ndarray] = None) -> np.ndarray:
+    if mask is None:
+        mask = game.legalActions()
+    board = game.board
+    player = game.currentPlayer
+    isCanal = board.era == Era.canal
+    scores = np.zeros(NUM_ACTIONS)
+
+    # network of the player: its roads per node, nodes it touches
+    scoreIndex = board.scoreIndex
+    roadsAt = np.zeros(NUM_NODES + 1)
+    for node in range(NUM_NODES):
+        roadsAt[node] = scoreIndex.nodeRoads[node].get(player, 0)
+    touched = roadsAt > 0
+    for slot, owner in enumerate(scoreIndex.slotOwner):
+        if owner is player:
+            touched[SLOT_TOWN[slot]] = True
+    touched[NUM_NODES] = True
+
+    # 1 BUILD - next tile of the industry, coal and iron bought at market price
+    tiles = nextTiles(player)
+    nameValue = np.zeros(len(BUILDING_NAMES))
+    nameLink = np.zeros(len(BUILDING_NAMES))
+    for n, available in enumerate(tiles):
+        if available:
+            building = BUILDINGS[available[0]]
+            resourceCost = board.priceForCoal(building.coalCost) + board.priceForIron(
+                building.ironCost
+            )
+            nameValue[n] = TILE_VALUE[available[0]] - MONEY_WEIGHT * resourceCost
+            nameLink[n] = TILE_LINK[available[0]]
+    buildScores = nameValue[BUILD_NAME] + LINK_WEIGHT * nameLink[BUILD_NAME] * roadsAt[BUILD_TOWN]
+    scores[BUILD_OFFSET : BUILD_OFFSET + len(BUILD_ACTIONS)] = buildScores
+
+    # 2 NETWORK - link value of the nodes, growing the network
+    nodeValue = np.append(np.asarray(scoreIndex.nodeValue, dtype=np.float64), 0)
+    nodeTouched = touched[ROAD_NODE_MATRIX]
+    reaches = nodeTouched.any(axis=1) & ~nodeTouched.all(axis=1)
+    roadScores = (
+        LINK_WEIGHT * nodeValue[ROAD_NODE_MATRIX].sum(axis=1) + REACH_BONUS * reaches
+    )
+    if isCanal:
+        roadPrice = CANAL_PRICE
+    else:
+        roadPrice = ONE_RAILROAD_PRICE + board.priceForCoal(ONE_RAILROAD_COAL_PRICE)
+    scores[NETWORK_OFFSET : NETWORK_OFFSET + NUM_ROADS] = roadScores - MONEY_WEIGHT * roadPrice
+    twoRailroadsPrice = TWO_RAILROAD_PRICE + board.priceForCoal(TWO_RAILROAD_COAL_PRICE)
+    scores[TWO_RAILROADS_OFFSET : TWO_RAILROADS_OFFSET + len(TWO_RAILROADS_ACTIONS)] = (
+        roadScores[TWO_RAILROADS_FIRST]
+        + roadScores[TWO_RAILROADS_SECOND]
+        - MONEY_WEIGHT * twoRailroadsPrice
+    )
+
+    # 3 DEVELOP - worth of the tiles it brings forward over the ones it retires
+    for i, (name1, name2) in enumerate(DEVELOP_ACTIONS):
+        if not mask[DEVELOP_OFFSET + i]:
+            continue
+        remaining = {name: list(tiles[BUILDING_NAME_INDEX[name]]) for name in (name1, name2)}
+        gain = 0.0
+        for name in (name1, name2):
+            retired = remaining[name].pop(0)
+            if not (BUILDINGS[retired].onlyPhaseOne and not isCanal):
+                gain -= TILE_VALUE[retired]
+            if remaining[name]:
+                gain += TILE_VALUE[remaining[name][0]]
+        scores[DEVELOP_OFFSET + i] = DEVELOP_WEIGHT * gain
+
+    # 4 SELL - the tile flips: its victory points and income
+    for i, slot in enumerate(SELL_ACTIONS):
+        if not mask[SELL_OFFSET + i]:
+            continue
+        building = board.buildLocations[slot].building
+        scores[SELL_OFFSET + i] = (
+            VP_WEIGHT * building.victoryPointsGained
+            + INCOME_WEIGHT * building.incomeGained
+        )
+
+    # 5 LOAN, 6 SCOUT, 7 PASS
+    scores[LOAN] = LOAN_SCORE if player.money < LOAN_MONEY else SCOUT_SCORE
+    scores[SCOUT] = SCOUT_SCORE
+    scores[PASS] = PASS_SCORE
+
+    scores[mask == 0] = -np.inf
+    return scores
+
+
+"""
+rulesPolicy
+
+:param game: game, played by the current player
+:param temperature: softmax temperature over the scores, 0 for the best action only
+:return: probability per action, zero for illegal actions
+"""
+
+
+def rulesPolicy(game: Game, temperature: float = TEMPERATURE) -> np.ndarray:
+    mask = game.legalActions()
+    probs = np.zeros(NUM_ACTIONS, dtype=np.float32)
+    if not mask.any():
+        return probs
+    scores = scoreActions(game, mask)
+    if temperature <= 0:
+        probs[np.argmax(scores)] = 1
+        return probs
+    weights = np.exp((scores - scores.max()) / temperature)
+    probs[:] = weights / weights.sum()
+    return probs
@@ -0,0 +1,48 @@
+"""
+Seeds for many games at once
+
+Every Game shuffles with its own random.Random, so games only need distinct seeds to
+run side by side in one process, in vector slots or in worker processes. splitSeed
+derives independent child seeds from one seed (numpy SeedSequence), SeedStream turns
+a seed into an endless, reproducible sequence of game seeds. Without a seed both draw
+one from the global random module, so global seeding (set_global_seeds) still applies.
+"""
+from __future__ import annotations
+
+import random
+from typing import List, Optional
+
+import numpy as np
+
+
+"""
+splitSeed
+
+:param seed: parent seed, drawn from the global random module if None
+:param n: amount of child seeds
+:return: n independent 64 bit seeds, the same ones for the same parent seed
+"""
+
+
+def splitSeed(seed: Optional[int], n: int) -> List[int]:
+    if seed is None:
+        seed = random.getrandbits(64)
+    children = np.random.SeedSequence(seed).spawn(n)
+    return [int(child.generate_state(1, np.uint64)[0]) for child in children]
+
+
+class SeedStream:
+    """
+    SeedStream - game seeds one after another, e.g. for the games a vector slot resets into
+
+    :param seed: seed of the stream, drawn from the global random module if None
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        if seed is None:
+            seed = random.getrandbits(64)
+        self.seed = seed
+        self.random = random.Random(seed)
+
+    def next(self) -> int:
+        return self.random.getrandbits(64)
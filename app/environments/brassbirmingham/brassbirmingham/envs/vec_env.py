@@ -0,0 +1,129 @@
+"""
+Lockstep simulator for many Brass Birmingham games, independent of gym
+
+Every step call plays one action in each of N games and returns stacked arrays,
+so a single policy forward pass can serve all of them. Finished games are reset
+right away; their last observation and final rewards are kept in the info dicts.
+"""
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from actions import NUM_ACTIONS
+from game import Game
+from observation import OBSERVATION_SIZE, ObservationEncoder
+from profiling import profileFromEnvironment
+from seeding import SeedStream, splitSeed
+
+
+class BrassBirminghamVecEnv:
+    """
+    BrassBirminghamVecEnv - N independent games stepped together
+
+    Observations are laid out like BrassBirminghamEnv (encoder features followed by
+    the legal action mask), masks is a view on the mask columns of observations.
+    The returned arrays are reused by the next call, copy them to keep them.
+
+    :param numGames: amount of games
+    :param numPlayers: amount of players in each game
+    :param seed: seed of the whole batch, every slot gets its own SeedStream from it
+    """
+
+    def __init__(self, numGames: int, numPlayers: int = 2, seed: Optional[int] = None):
+        profileFromEnvironment()  # BRASS_PROFILE=1 profiles the run
+        self.numGames = numGames
+        self.numPlayers = numPlayers
+        self.seed(seed)
+        self.games: List[Game] = [self.newGame(i) for i in range(numGames)]
+        self.encoders = [ObservationEncoder() for _ in range(numGames)]
+
+        self.observations = np.zeros(
+            (numGames, OBSERVATION_SIZE + NUM_ACTIONS), dtype=np.float32
+        )
+        self.masks = self.observations[:, OBSERVATION_SIZE:]
+        self.rewards = np.zeros((numGames, numPlayers), dtype=np.float32)
+        self.dones = np.zeros(numGames, dtype=bool)
+        self.currentPlayerNums = np.zeros(numGames, dtype=np.int64)
+
+    """
+    seed
+    reseed every slot, taking effect from the next game each slot starts
+
+    :param seed: seed of the whole batch, see seeding.splitSeed
+    """
+
+    def seed(self, seed: Optional[int] = None):
+        self.seedStreams = [
+            SeedStream(slotSeed) for slotSeed in splitSeed(seed, self.numGames)
+        ]
+
+    def newGame(self, i: int) -> Game:
+        return Game(self.numPlayers, self.seedStreams[i].next())
+
+    """
+    reset
+    start new games everywhere
+
+    :return: observations
+    """
+
+    def reset(self) -> np.ndarray:
+        for i in range(self.numGames):
+            self.games[i] = self.newGame(i)
+            self.observe(i)
+        return self.observations
+
+    """
+    step
+    play one action in every game, an illegal action ends that game as a loss for its player
+
+    :param actions: action index per game
+    :return: observations, rewards (per game and player), dones, masks, infos
+    """
+
+    def step(
+        self, actions: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, List[Dict]]:
+        assert len(actions) == self.numGames
+        self.rewards[:] = 0
+        self.dones[:] = False
+        infos: List[Dict] = [{} for _ in range(self.numGames)]
+
+        for i, action in enumerate(actions):
+            game = self.games[i]
+            action = int(action)
+            if not self.masks[i, action]:
+                self.rewards[i] = 1.0 / (self.numPlayers - 1)
+                self.rewards[i, game.currentPlayerNum] = -1
+                self.dones[i] = True
+            else:
+                game.step(action)
+                if game.isOver:
+                    self.rewards[i] = game.rewards()
+                    self.dones[i] = True
+
+            if self.dones[i]:
+                self.observe(i)
+                infos[i]["terminal_observation"] = self.observations[i].copy()
+                infos[i]["scores"] = game.scores()
+                self.games[i] = self.newGame(i)
+            self.observe(i)
+
+        return self.observations, self.rewards, self.dones, self.masks, infos
+
+    """
+    observe
+    write the observation of a game for its current player
+
+    :param i: game index
+    """
+
+    def observe(self, i: int):
+        game = self.games[i]
+        self.currentPlayerNums[i] = game.currentPlayerNum
+        self.observations[i, :OBSERVATION_SIZE] = self.encoders[i].encode(
+            game.board, game.currentPlayerNum
+        )
+        self.masks[i] = game.legalActions()
@@ -17,6 +17,7 @@ class ButterflyEnv(gym.Env):
         self.n_players = 3
 
         self.manual = manual
+        self.random = random  # global random until seed() is called
 
         self.board_size = 7
         self.squares = self.board_size * self.board_size
@@ -295,8 +296,8 @@ class ButterflyEnv(gym.Env):
         self.current_player.position.add([tile])
 
     def place_hudson(self):
-        self.board.hudson = random.randint(0, self.squares - 1)
-        self.board.hudson_facing = random.choice(["U", "D", "L", "R"])
+        self.board.hudson = self.random.randint(0, self.squares - 1)
+        self.board.hudson_facing = self.random.choice(["U", "D", "L", "R"])
 
     def step(self, action):
 
@@ -341,8 +342,12 @@ class ButterflyEnv(gym.Env):
 
         return self.observation, reward, done, {}
 
+    def seed(self, seed=None):
+        self.random = random.Random(seed)
+        return [seed]
+
     def reset(self):
-        self.drawbag = DrawBag(self.contents)
+        self.drawbag = DrawBag(self.contents, self.random)
         self.players = []
 
         player_id = 1
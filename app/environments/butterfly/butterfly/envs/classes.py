@@ -88,12 +88,13 @@ class Wasp(Tile):
 
 
 class DrawBag:
-    def __init__(self, contents):
+    def __init__(self, contents, rng=random):
         self.contents = contents
+        self.random = rng
         self.create()
 
     def shuffle(self):
-        random.shuffle(self.tiles)
+        self.random.shuffle(self.tiles)
 
     def draw(self, n):
         drawn = []
@@ -247,8 +247,8 @@ class Deck:
     def __init__(self, cards=list()):
         self.cards = list(cards)
 
-    def shuffle(self):
-        random.shuffle(self.cards)
+    def shuffle(self, rng=random):
+        rng.shuffle(self.cards)
 
     def draw(self, n):
         drawn = []
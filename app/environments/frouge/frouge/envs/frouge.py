@@ -25,6 +25,7 @@ class FlammeRougeEnv(gym.Env):
         super(FlammeRougeEnv, self).__init__()
         self.name = "frouge"
         self.manual = manual
+        self.random = random  # global random until seed() is called
 
         self.n_players = 5
         self.board = None
@@ -362,7 +363,7 @@ class FlammeRougeEnv(gym.Env):
             (p, "s") for p in self.board.players
         ]
         # shuffle
-        random.shuffle(self.cyclists)
+        self.random.shuffle(self.cyclists)
         first_col = self.board.first_start_col()
         for c in self.cyclists:
             self.board.set_cycl_to_pos(c[0].n, c[1], first_col)
@@ -374,7 +375,7 @@ class FlammeRougeEnv(gym.Env):
                 if len(drawn) < 4:
                     player.r_deck.add(player.r_discard.cards)
                     player.r_discard = Deck()
-                    player.r_deck.shuffle()
+                    player.r_deck.shuffle(self.random)
                     drawn += player.r_deck.draw(4 - len(drawn))
                 if len(drawn) == 0:
                     drawn.append(PENALTY_ROULEUR_CARD)
@@ -384,22 +385,26 @@ class FlammeRougeEnv(gym.Env):
                 if len(drawn) < 4:
                     player.s_deck.add(player.s_discard.cards)
                     player.s_discard = Deck()
-                    player.s_deck.shuffle()
+                    player.s_deck.shuffle(self.random)
                     drawn += player.s_deck.draw(4 - len(drawn))
                 if len(drawn) == 0:
                     drawn.append(PENALTY_SPRINTER_CARD)
                 player.s_hand.add(drawn)
 
+    def seed(self, seed=None):
+        self.random = random.Random(seed)
+        return [seed]
+
     def reset(self):
         # set_global_seeds(17)
         # pick a random board
-        self.board = Board(random.choice(ALL_BOARDS))
+        self.board = Board(self.random.choice(ALL_BOARDS))
         # reset players
         player_id = 1
         for p in range(self.n_players):
             player = Player(player_id)
-            player.r_deck.shuffle()
-            player.s_deck.shuffle()
+            player.r_deck.shuffle(self.random)
+            player.s_deck.shuffle(self.random)
             self.board.add_player(player)
             player_id += 1
         self.current_player_num = 0
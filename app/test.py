@@ -55,6 +55,8 @@ def main(args):
             agent_obj = Agent("human")
         elif agent == "rules":
             agent_obj = Agent("rules")
+        elif agent == "mcts":
+            agent_obj = Agent("mcts")
         elif agent == "base":
             base_model = load_model(env, "base.zip")
             agent_obj = Agent("base", base_model)
@@ -43,6 +43,9 @@ class Agent:
         if self.name == "rules":
             action_probs = np.array(env.rules_move())
             value = None
+        elif self.name == "mcts":
+            action_probs = np.array(env.mcts_move())
+            value = None
         else:
             action_probs = self.model.action_probability(env.observation)
             value = self.model.policy_pi.value(np.array([env.observation]))[0]